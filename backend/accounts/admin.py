@@ -61,6 +61,7 @@ class EmailVerificationTokenAdmin(admin.ModelAdmin):
     list_filter = ["is_used", "created_at"]
     search_fields = ["user__email"]
     readonly_fields = ["token", "created_at", "expires_at"]
+    raw_id_fields = ["user"]
 
 
 @admin.register(PasswordResetToken)
@@ -69,3 +70,4 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
     list_filter = ["is_used", "created_at"]
     search_fields = ["user__email"]
     readonly_fields = ["token", "created_at", "expires_at"]
+    raw_id_fields = ["user"]
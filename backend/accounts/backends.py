@@ -0,0 +1,68 @@
+# backend/accounts/backends.py
+"""
+session 인증 시 User 조회를 cache 하는 인증 backend.
+
+- AUTH_USER_CACHE_ENABLED=True 일 때만 AUTHENTICATION_BACKENDS 에 포함 (기본값: 공유 cache 가 있을 때)
+- cache 는 AUTH_USER_CACHE_ALIAS(기본 "shared") 를 직접 사용 (TwoTierCache 의 local 계층 없음)
+  → 한 worker 의 invalidate 가 다른 worker 에도 바로 반영
+
+- 모든 API 요청은 SessionAuthentication → get_user(user_id) 로 User 1건을 조회
+  → User row 를 cache 에 두고 요청마다 DB 조회 없이 복원
+- User 저장/삭제 시 (post_save / post_delete, 커밋 이후) 해당 user 의 cache 삭제
+  (비밀번호 변경도 save 를 거치므로 session auth hash 검증은 항상 최신 값 기준)
+- 이력서(user.teacher_application)는 cache 하지 않음 (이미지 후처리 등 UPDATE 로 바뀌는 값이 있음)
+  → 요청 안에서는 같은 user 인스턴스의 related cache 로 한 번만 조회 (get_teacher_application)
+"""
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from config.db_router import use_primary
+
+_USER_KEY = "accounts:user:{}"
+
+
+def _user_key(user_id) -> str:
+    return _USER_KEY.format(user_id)
+
+
+def _cache():
+    return caches[getattr(settings, "AUTH_USER_CACHE_ALIAS", "shared")]
+
+
+class CachedModelBackend(ModelBackend):
+    def get_user(self, user_id):
+        key = _user_key(user_id)
+        cache = _cache()
+        user = cache.get(key)
+        if user is None:
+            UserModel = get_user_model()
+            try:
+                # cache 에 넣는 값은 replica 가 아닌 default 에서
+                with use_primary():
+                    user = UserModel._default_manager.get(pk=user_id)
+            except UserModel.DoesNotExist:
+                return None
+            cache.set(
+                key, user, timeout=getattr(settings, "AUTH_USER_CACHE_SECONDS", 300)
+            )
+        return user if self.user_can_authenticate(user) else None
+
+
+def invalidate_cached_user(user_id) -> None:
+    _cache().delete(_user_key(user_id))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_changed(sender, instance, **kwargs):
+    user_id = instance.pk
+    # 지금 바로 + 커밋 이후 한 번 더 (커밋 전 다른 요청이 예전 값으로 다시 채운 경우 대비)
+    invalidate_cached_user(user_id)
+    transaction.on_commit(lambda: invalidate_cached_user(user_id))
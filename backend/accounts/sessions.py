@@ -0,0 +1,105 @@
+# backend/accounts/sessions.py
+"""
+cache 우선 + DB write-behind session engine (SESSION_ENGINE = "accounts.sessions").
+
+- 조회: django cached_db 와 같음 (cache → 없으면 DB 에서 읽어 cache 에 채움)
+- 새 session(로그인 / cycle_key) 생성·삭제는 바로 DB 반영 (write-through)
+- 기존 session 의 변경은 cache 에만 쓰고 "dirty" 표시
+  → SESSION_WRITE_BEHIND_SECONDS 가 지난 뒤의 다음 조회/저장에서 DB 에 한 번에 반영
+  → 자주 바뀌는 session 도 DB 쓰기는 구간당 1회
+- cache 가 유실되면 마지막 DB 반영 이후의 변경만 사라짐 (인증 정보는 생성 시점에 이미 DB 에 있음)
+- 여러 worker 가 같은 session 을 보려면 공유 cache(CACHE_URL=redis://...) 필요
+  → 기본값은 공유 cache 가 있을 때만 이 engine, 없으면 django.contrib.sessions.backends.db
+  → SESSION_CACHE_ALIAS="shared" (TwoTierCache 의 local 계층 없이 공유 backend 직접 사용)
+"""
+from __future__ import annotations
+
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.db import router, transaction
+
+from config.db_router import use_primary
+
+logger = logging.getLogger("django.contrib.sessions")
+
+
+class SessionStore(CachedDBStore):
+    cache_key_prefix = "accounts.sessions:"
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._created_in_request = False
+
+    @property
+    def _dirty_key(self) -> str:
+        return self.cache_key + ":dirty"
+
+    @staticmethod
+    def _write_behind_seconds() -> float:
+        return getattr(settings, "SESSION_WRITE_BEHIND_SECONDS", 60)
+
+    def _write_db(self, data) -> None:
+        """data 를 DB 에 반영 (UPDATE, row 가 없으면 INSERT)"""
+        obj = self.model(
+            session_key=self.session_key,
+            session_data=self.encode(data),
+            expire_date=self.get_expiry_date(expiry=data.get("_session_expiry")),
+        )
+        using = router.db_for_write(self.model, instance=obj)
+        with transaction.atomic(using=using):
+            obj.save(using=using)
+        self._cache.delete(self._dirty_key)
+
+    def _flush_if_due(self, data) -> None:
+        dirty_since = self._cache.get(self._dirty_key)
+        if dirty_since is None:
+            return
+        if time.time() - dirty_since >= self._write_behind_seconds():
+            try:
+                self._write_db(data)
+            except Exception:
+                logger.exception("Error writing session to database")
+
+    def load(self):
+        # DB 에서 읽어 cache 를 채우는 경우도 있으므로 replica 가 아닌 default 에서
+        with use_primary():
+            data = super().load()
+        if data and self.session_key:
+            self._flush_if_due(data)
+        return data
+
+    def create(self):
+        super().create()
+        self._created_in_request = True
+
+    def save(self, must_create=False):
+        if (
+            must_create
+            or self.session_key is None
+            or self._created_in_request
+            or self._write_behind_seconds() <= 0
+        ):
+            super().save(must_create)
+            self._cache.delete(self._dirty_key)
+            return
+
+        data = self._get_session(no_load=must_create)
+        try:
+            self._cache.set(self.cache_key, data, self.get_expiry_age())
+            # 첫 미반영 변경 시각 (이미 있으면 유지)
+            self._cache.add(self._dirty_key, time.time(), self.get_expiry_age())
+        except Exception:
+            logger.exception("Error saving to cache (%s)", self._cache)
+            super().save(must_create)
+            return
+        self._flush_if_due(data)
+
+    def delete(self, session_key=None):
+        key = session_key or self.session_key
+        super().delete(session_key)
+        if key:
+            self._cache.delete(self.cache_key_prefix + key + ":dirty")
+
@@ -1,3 +1,195 @@
-from django.test import TestCase
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from .backends import CachedModelBackend, _user_key
+from .models import User
+from .sessions import SessionStore
+
+_SHARED_LOCATION = "accounts-tests"
+_CACHES = {
+    "default": settings.CACHES["default"],
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": _SHARED_LOCATION,
+    },
+}
+
+
+def other_worker_cache():
+    # 같은 저장소(공유 backend)를 보는 다른 프로세스의 cache 연결
+    return LocMemCache(_SHARED_LOCATION, {})
+
+
+class CacheDefaultsTests(SimpleTestCase):
+    def test_cached_auth_only_with_shared_cache(self):
+        if settings.SHARED_CACHE_CONFIGURED:
+            self.skipTest("CACHE_URL 로 공유 cache 가 설정된 환경")
+
+        self.assertEqual(
+            settings.AUTHENTICATION_BACKENDS,
+            ["django.contrib.auth.backends.ModelBackend"],
+        )
+        self.assertEqual(settings.SESSION_ENGINE, "django.contrib.sessions.backends.db")
+
+
+@override_settings(
+    CACHES=_CACHES,
+    AUTH_USER_CACHE_ENABLED=True,
+    AUTH_USER_CACHE_ALIAS="shared",
+    AUTHENTICATION_BACKENDS=[
+        "accounts.backends.CachedModelBackend",
+        "django.contrib.auth.backends.ModelBackend",
+    ],
+)
+class CachedModelBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="user@example.com", password="pw", role="teacher"
+        )
+
+    def setUp(self):
+        caches["shared"].clear()
+        self.addCleanup(caches["shared"].clear)
+
+    def test_user_is_cached_in_shared_backend(self):
+        backend = CachedModelBackend()
+        self.assertEqual(backend.get_user(self.user.pk), self.user)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(backend.get_user(self.user.pk), self.user)
+        self.assertIsNotNone(other_worker_cache().get(_user_key(self.user.pk)))
+
+    def test_save_invalidates_other_workers(self):
+        CachedModelBackend().get_user(self.user.pk)
+        other = CachedModelBackend()
+        with mock.patch("accounts.backends._cache", other_worker_cache):
+            with self.assertNumQueries(0):
+                self.assertEqual(other.get_user(self.user.pk).role, "teacher")
+
+            # 이 worker 에서 저장 → 다른 worker 도 다음 조회에서 DB 값
+            with self.captureOnCommitCallbacks(execute=True):
+                self.user.role = "admin"
+                self.user.save()
+
+            with self.assertNumQueries(1):
+                self.assertEqual(other.get_user(self.user.pk).role, "admin")
+
+    def test_inactive_or_missing_user(self):
+        backend = CachedModelBackend()
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        self.assertIsNone(backend.get_user(self.user.pk))
+        self.assertIsNone(backend.get_user(self.user.pk + 1000))
+
+
+@override_settings(
+    CACHES=_CACHES,
+    SESSION_ENGINE="accounts.sessions",
+    SESSION_CACHE_ALIAS="shared",
+    SESSION_WRITE_BEHIND_SECONDS=60,
+)
+class WriteBehindSessionTests(TestCase):
+    def setUp(self):
+        caches["shared"].clear()
+        self.addCleanup(caches["shared"].clear)
+
+    def _db_data(self, session_key):
+        return Session.objects.get(pk=session_key).get_decoded()
+
+    @staticmethod
+    def _later(seconds):
+        # time.time 을 patch 하기 전에 현재 시각을 고정
+        now = time.time()
+        return mock.patch("accounts.sessions.time.time", return_value=now + seconds)
+
+    def _created(self):
+        store = SessionStore()
+        store["step"] = 1
+        store.save()
+        return store.session_key
+
+    def test_new_session_is_written_through(self):
+        key = self._created()
+
+        self.assertEqual(self._db_data(key), {"step": 1})
+
+    def test_changes_stay_in_cache_until_due(self):
+        key = self._created()
+
+        store = SessionStore(key)
+        store["step"] = 2
+        store.save()
+
+        self.assertEqual(self._db_data(key), {"step": 1})
+        # 다른 worker 는 공유 cache 에서 바로 최신 값
+        other = SessionStore(key)
+        other._cache = other_worker_cache()
+        self.assertEqual(other["step"], 2)
+        self.assertEqual(self._db_data(key), {"step": 1})
+
+    def test_dirty_session_is_flushed_on_load_after_interval(self):
+        key = self._created()
+        store = SessionStore(key)
+        store["step"] = 2
+        store.save()
+
+        with self._later(61):
+            other = SessionStore(key)
+            other._cache = other_worker_cache()
+            self.assertEqual(other["step"], 2)
+
+        self.assertEqual(self._db_data(key), {"step": 2})
+        self.assertIsNone(caches["shared"].get(store._dirty_key))
+
+    def test_changes_within_interval_are_flushed_once(self):
+        key = self._created()
+        store = SessionStore(key)
+        store["step"] = 2
+        store.save()
+        first_dirty = caches["shared"].get(store._dirty_key)
+
+        store = SessionStore(key)
+        store["step"] = 3
+        store.save()
+        # 첫 미반영 변경 시각 유지
+        self.assertEqual(caches["shared"].get(store._dirty_key), first_dirty)
+        self.assertEqual(self._db_data(key), {"step": 1})
+
+        with self._later(61):
+            # 조회 시 밀린 변경(step=3)을 반영, 이번 변경은 다음 구간으로
+            store = SessionStore(key)
+            store["step"] = 4
+            store.save()
+
+        self.assertEqual(self._db_data(key), {"step": 3})
+        self.assertIsNotNone(caches["shared"].get(store._dirty_key))
+        with self._later(122):
+            self.assertEqual(SessionStore(key)["step"], 4)
+        self.assertEqual(self._db_data(key), {"step": 4})
+
+    def test_delete_clears_dirty_marker(self):
+        key = self._created()
+        store = SessionStore(key)
+        store["step"] = 2
+        store.save()
+
+        store.delete()
+
+        self.assertFalse(Session.objects.filter(pk=key).exists())
+        self.assertIsNone(caches["shared"].get(store.cache_key_prefix + key + ":dirty"))
+
+    @override_settings(SESSION_WRITE_BEHIND_SECONDS=0)
+    def test_zero_interval_writes_every_save(self):
+        key = self._created()
+        store = SessionStore(key)
+        store["step"] = 2
+        store.save()
+
+        self.assertEqual(self._db_data(key), {"step": 2})
@@ -3,9 +3,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django.contrib.auth import login, logout
-from django.core.mail import send_mail
 from django.conf import settings
 from django.shortcuts import get_object_or_404
+from notifications.outbox import enqueue_email
 from .models import User, EmailVerificationToken, PasswordResetToken
 from .serializers import (
     UserRegistrationSerializer,
@@ -58,15 +58,9 @@ def register(request):
             If you didn't create an account, please ignore this email.
             """
 
-            send_mail(
-                subject,
-                message,
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                fail_silently=False,
-            )
+            enqueue_email(subject, message, [user.email])
 
-            logger.info(f"Verification email sent to: {user.email}")
+            logger.info(f"Verification email queued for: {user.email}")
 
             return Response(
                 {
@@ -186,15 +180,9 @@ def resend_verification(request):
             If you didn't create an account, please ignore this email.
             """
 
-            send_mail(
-                subject,
-                message,
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                fail_silently=False,
-            )
+            enqueue_email(subject, message, [user.email])
 
-            logger.info(f"Verification email resent successfully to: {email}")
+            logger.info(f"Verification email re-queued for: {email}")
 
             return Response(
                 {"message": "Verification email sent."}, status=status.HTTP_200_OK
@@ -284,15 +272,9 @@ def password_reset_request(request):
             If you didn't request a password reset, please ignore this email.
             """
 
-            send_mail(
-                subject,
-                message,
-                settings.DEFAULT_FROM_EMAIL,
-                [user.email],
-                fail_silently=False,
-            )
+            enqueue_email(subject, message, [user.email])
 
-            logger.info(f"Password reset email sent successfully to: {email}")
+            logger.info(f"Password reset email queued for: {email}")
 
             return Response(
                 {"message": "Password reset email sent."}, status=status.HTTP_200_OK
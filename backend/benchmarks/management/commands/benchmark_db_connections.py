@@ -0,0 +1,183 @@
+import copy
+import importlib.util
+import json
+import statistics
+import time
+from pathlib import Path
+
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.signals import connection_created
+
+MODES = ("new", "persistent", "pool")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request latency (p50/p99) of the Django request connection "
+        "lifecycle against the configured database: a new connection per request "
+        "(CONN_MAX_AGE=0), persistent connections with health checks, and the "
+        "psycopg3 connection pool (PostgreSQL + psycopg_pool only)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias whose settings are benchmarked",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=500, help="Measured requests per mode"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=20, help="Unmeasured requests per mode"
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=3,
+            help="Queries per request (SELECT 1)",
+        )
+        parser.add_argument(
+            "--modes",
+            default=",".join(MODES),
+            help="Comma separated subset of: " + ", ".join(MODES),
+        )
+        parser.add_argument(
+            "--conn-max-age",
+            type=int,
+            default=600,
+            help="CONN_MAX_AGE for the persistent mode",
+        )
+        parser.add_argument("--output", default="", help="Write results as JSON")
+
+    def handle(self, *args, **options):
+        if options["database"] not in connections.settings:
+            raise CommandError(f"Unknown database alias: {options['database']}")
+        modes = [m.strip() for m in options["modes"].split(",") if m.strip()]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f"Unknown mode(s): {', '.join(sorted(unknown))}")
+
+        base = connections.settings[options["database"]]
+        results = {}
+        for mode in modes:
+            settings_dict = self._settings_for(mode, base, options)
+            if settings_dict is None:
+                self.stderr.write(
+                    f"skip {mode}: needs PostgreSQL with psycopg3 + psycopg_pool"
+                )
+                continue
+            results[mode] = self._measure(mode, settings_dict, options)
+            self._report(mode, results[mode])
+
+        if "new" in results:
+            for mode in ("persistent", "pool"):
+                if mode in results:
+                    saved = {
+                        key: round(results["new"][key] - results[mode][key], 3)
+                        for key in ("p50_ms", "p99_ms")
+                    }
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"{mode}: p50 -{saved['p50_ms']}ms p99 -{saved['p99_ms']}ms "
+                            "vs new connection per request"
+                        )
+                    )
+
+        if options["output"]:
+            meta = {
+                "vendor": connections[options["database"]].vendor,
+                "requests": options["requests"],
+                "queries": options["queries"],
+            }
+            Path(options["output"]).write_text(
+                json.dumps({"meta": meta, "modes": results}, indent=2) + "\n"
+            )
+
+    # ------------------------------------------------------------------
+    # 설정
+    # ------------------------------------------------------------------
+    def _settings_for(self, mode, base, options):
+        settings_dict = copy.deepcopy(base)
+        settings_dict["OPTIONS"] = dict(settings_dict.get("OPTIONS") or {})
+        pool = settings_dict["OPTIONS"].pop("pool", None)
+
+        if mode == "new":
+            settings_dict["CONN_MAX_AGE"] = 0
+            settings_dict["CONN_HEALTH_CHECKS"] = False
+        elif mode == "persistent":
+            settings_dict["CONN_MAX_AGE"] = options["conn_max_age"]
+            settings_dict["CONN_HEALTH_CHECKS"] = True
+        else:
+            if settings_dict["ENGINE"] != "django.db.backends.postgresql":
+                return None
+            if importlib.util.find_spec("psycopg_pool") is None:
+                return None
+            settings_dict["CONN_MAX_AGE"] = 0
+            settings_dict["CONN_HEALTH_CHECKS"] = True
+            settings_dict["OPTIONS"]["pool"] = pool or {"min_size": 2, "max_size": 4}
+        return settings_dict
+
+    # ------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------
+    def _measure(self, mode, settings_dict, options):
+        alias = f"benchmark_{mode}"
+        connections.settings[alias] = settings_dict
+        opened = []
+
+        def count_connection(sender, connection, **kwargs):
+            if connection.alias == alias:
+                opened.append(connection.alias)
+
+        connection_created.connect(count_connection)
+        try:
+            connection = connections[alias]
+            for _ in range(max(0, options["warmup"])):
+                self._request(connection, options["queries"])
+            opened.clear()
+
+            timings = []
+            for _ in range(max(1, options["requests"])):
+                began = time.perf_counter()
+                self._request(connection, options["queries"])
+                timings.append((time.perf_counter() - began) * 1000)
+        finally:
+            connection_created.disconnect(count_connection)
+            connections[alias].close()
+            if getattr(connections[alias], "pool", None):
+                connections[alias].close_pool()
+            del connections[alias]
+            del connections.settings[alias]
+
+        percentiles = statistics.quantiles(timings, n=100, method="inclusive")
+        return {
+            "p50_ms": round(statistics.median(timings), 3),
+            "p99_ms": round(percentiles[98], 3),
+            "mean_ms": round(statistics.fmean(timings), 3),
+            "connections_opened": len(opened),
+        }
+
+    @staticmethod
+    def _request(connection, queries):
+        # 실제 요청과 같은 순서: request_started / finished 에서 close_old_connections
+        request_started.send(sender=WSGIHandler)
+        try:
+            with connection.cursor() as cursor:
+                for _ in range(queries):
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+        finally:
+            request_finished.send(sender=WSGIHandler)
+
+    def _report(self, mode, result):
+        self.stdout.write(
+            f"{mode:<11} p50={result['p50_ms']:>7.3f}ms p99={result['p99_ms']:>7.3f}ms "
+            f"mean={result['mean_ms']:>7.3f}ms connections={result['connections_opened']}"
+        )
+
+
+# python manage.py benchmark_db_connections --requests 1000
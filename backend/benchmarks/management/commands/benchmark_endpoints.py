@@ -0,0 +1,284 @@
+import json
+import logging
+import statistics
+import time
+from contextlib import ExitStack
+from http.cookies import SimpleCookie
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.test import Client
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import reverse
+
+from accounts.models import User
+from benchmarks.scenarios import (
+    MUTATING_METHODS,
+    build_scenarios,
+    scenario_key,
+    uncovered_url_names,
+)
+from benchmarks.seed import seed
+
+DEFAULT_BASELINE = Path(__file__).resolve().parents[2] / "baseline.json"
+
+
+class _QueryCounter:
+    """execute_wrapper: 모든 DB 연결의 쿼리 수 (queries_log 9000개 제한 없음)"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway test database with production-like volumes, hit every API "
+        "URL with the test client and record query count, wall time and response "
+        "bytes per endpoint. Fails when a result regresses against the baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiplier for seed volumes (1.0 = 2k branches / 20k teachers ...)",
+        )
+        parser.add_argument("--seed", type=int, default=42, help="Random seed")
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Timed runs per endpoint (median is reported)",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=str(DEFAULT_BASELINE),
+            help="Baseline JSON file",
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Write the results to the baseline file instead of comparing",
+        )
+        parser.add_argument(
+            "--output",
+            default="",
+            help="Also write the results as JSON to this file",
+        )
+        parser.add_argument(
+            "--only",
+            default="",
+            help="Only run scenarios whose key contains this text",
+        )
+        parser.add_argument(
+            "--time-ratio",
+            type=float,
+            default=1.5,
+            help="Allowed slowdown factor against the baseline median",
+        )
+        parser.add_argument(
+            "--time-slack-ms",
+            type=float,
+            default=5.0,
+            help="Allowed absolute slowdown on top of --time-ratio",
+        )
+        parser.add_argument(
+            "--bytes-ratio",
+            type=float,
+            default=1.1,
+            help="Allowed response size growth factor",
+        )
+        parser.add_argument(
+            "--no-timing",
+            action="store_true",
+            help="Compare query counts / status / bytes only (noisy CI machines)",
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+        # 요청 로그(INFO/WARNING)가 결과 표를 덮지 않도록
+        logging.disable(logging.WARNING)
+        try:
+            started = time.perf_counter()
+            fixtures = seed(scale=options["scale"], random_seed=options["seed"])
+            counts = " ".join(f"{k}={v}" for k, v in fixtures["counts"].items())
+            self.stdout.write(
+                f"Seeded in {time.perf_counter() - started:.1f}s: {counts}"
+            )
+            scenarios = build_scenarios(fixtures)
+            uncovered = uncovered_url_names(scenarios)
+            if options["only"]:
+                scenarios = [
+                    s for s in scenarios if options["only"] in scenario_key(s)
+                ]
+            results = self._run(scenarios, fixtures, options)
+        finally:
+            logging.disable(logging.NOTSET)
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        meta = {
+            "scale": options["scale"],
+            "seed": options["seed"],
+            "repeat": options["repeat"],
+        }
+        report = {"meta": meta, "endpoints": results}
+        if options["output"]:
+            Path(options["output"]).write_text(
+                json.dumps(report, indent=2, sort_keys=True) + "\n"
+            )
+
+        baseline_path = Path(options["baseline"])
+        if options["update_baseline"]:
+            baseline_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+            self.stdout.write(
+                self.style.SUCCESS(f"Baseline written: {baseline_path} ({len(results)})")
+            )
+            return
+
+        baseline = {"meta": {}, "endpoints": {}}
+        if baseline_path.exists():
+            baseline = json.loads(baseline_path.read_text())
+        else:
+            self.stderr.write(f"No baseline at {baseline_path}; nothing to compare")
+        regressions = self._compare(results, baseline, meta, options)
+
+        problems = []
+        if uncovered:
+            problems.append(f"{len(uncovered)} URL(s) without a benchmark scenario")
+            for name in uncovered:
+                self.stderr.write(f"  uncovered: {name}")
+        if regressions:
+            problems.append(f"{regressions} regression(s)")
+        if problems:
+            raise CommandError("; ".join(problems))
+        self.stdout.write(self.style.SUCCESS(f"OK: {len(results)} endpoints"))
+
+    # ------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------
+    def _run(self, scenarios, fixtures, options):
+        users = {
+            "admin": fixtures["admin"],
+            "manager": fixtures["manager"],
+            "teacher": fixtures["teacher_user"],
+            "newcomer": fixtures["newcomer"],
+        }
+        clients = {None: Client()}
+        for role, pk in users.items():
+            clients[role] = Client()
+            clients[role].force_login(User.objects.get(pk=pk))
+
+        results = {}
+        for scenario in scenarios:
+            key = scenario_key(scenario)
+            client = clients[scenario["user"]]
+            path = reverse(scenario["url"], kwargs=scenario["kwargs"])
+
+            # 1회 warm-up (권한/ContentType 캐시 등) 후 쿼리 수 측정, 이후 반복 측정
+            self._request(client, scenario, path)
+            counter = _QueryCounter()
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(counter))
+                response = self._request(client, scenario, path)
+            timings = []
+            for _ in range(max(1, options["repeat"])):
+                began = time.perf_counter()
+                self._request(client, scenario, path)
+                timings.append((time.perf_counter() - began) * 1000)
+
+            results[key] = {
+                "status": response.status_code,
+                "queries": counter.count,
+                "ms": round(statistics.median(timings), 2),
+                "bytes": len(response.content) if not response.streaming else 0,
+            }
+        return results
+
+    def _request(self, client, scenario, path):
+        method = scenario["method"]
+        if method not in MUTATING_METHODS:
+            return client.get(path, scenario["query"])
+
+        # 데이터 변경 요청은 rollback → 같은 상태에서 반복 측정
+        # (logout 등이 바꾼 세션 cookie 도 복원)
+        cookies = SimpleCookie(client.cookies.output(header="", sep="\n"))
+        try:
+            with transaction.atomic():
+                response = client.generic(
+                    method.upper(),
+                    path,
+                    json.dumps(scenario["data"] or {}),
+                    content_type="application/json",
+                )
+                transaction.set_rollback(True)
+        finally:
+            client.cookies = cookies
+        return response
+
+    # ------------------------------------------------------------------
+    # baseline 비교
+    # ------------------------------------------------------------------
+    def _compare(self, results, baseline, meta, options):
+        base_endpoints = baseline.get("endpoints", {})
+        same_volume = all(
+            baseline.get("meta", {}).get(name) == meta[name] for name in ("scale", "seed")
+        )
+        if base_endpoints and not same_volume:
+            self.stderr.write(
+                "Baseline was recorded with a different --scale/--seed; "
+                "comparing status and query counts only"
+            )
+        compare_timing = same_volume and not options["no_timing"]
+
+        regressions = 0
+        for key, result in results.items():
+            base = base_endpoints.get(key)
+            flags = []
+            if base is None:
+                flags.append("new")
+            else:
+                if result["status"] != base["status"]:
+                    flags.append(f"status {base['status']}->{result['status']}")
+                if result["queries"] > base["queries"]:
+                    flags.append(f"queries {base['queries']}->{result['queries']}")
+                if compare_timing:
+                    allowed_ms = (
+                        base["ms"] * options["time_ratio"] + options["time_slack_ms"]
+                    )
+                    if result["ms"] > allowed_ms:
+                        flags.append(f"time {base['ms']}->{result['ms']}ms")
+                if same_volume:
+                    allowed_bytes = base["bytes"] * options["bytes_ratio"] + 256
+                    if result["bytes"] > allowed_bytes:
+                        flags.append(f"bytes {base['bytes']}->{result['bytes']}")
+            regressed = any(flag != "new" for flag in flags)
+            regressions += int(regressed)
+
+            line = (
+                f"{result['status']} q={result['queries']:<3} "
+                f"{result['ms']:>8.1f}ms {result['bytes']:>8}B  {key}"
+            )
+            if regressed:
+                self.stdout.write(self.style.ERROR(f"{line}  REGRESSION: {', '.join(flags)}"))
+            elif flags:
+                self.stdout.write(self.style.WARNING(f"{line}  (new)"))
+            else:
+                self.stdout.write(line)
+        return regressions
+
+
+# python manage.py benchmark_endpoints --scale 0.1 --no-timing
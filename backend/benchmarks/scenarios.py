@@ -0,0 +1,272 @@
+# backend/benchmarks/scenarios.py
+"""
+엔드포인트별 벤치마크 요청 정의.
+
+- build_scenarios(fixtures): config/urls.py 의 모든 API URL(name) 에 대한 요청 목록
+  (method / 로그인 사용자 / URL kwargs / query / body)
+- admin/ 은 등록된 모델마다 changelist / change 화면을 자동 생성
+- uncovered_url_names(): 시나리오가 없는 URL name → 새 엔드포인트를 추가하면 여기도 추가해야 함
+"""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.contrib import admin
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from .seed import BENCH_PASSWORD
+
+# 데이터를 바꾸는 method → 매 실행을 트랜잭션 rollback 으로 감싸서 반복 측정
+MUTATING_METHODS = {"post", "put", "patch", "delete"}
+
+
+def scenario_key(scenario: dict) -> str:
+    label = scenario.get("label")
+    key = f"{scenario['method'].upper()} {scenario['url']} [{scenario['user'] or 'anonymous'}]"
+    return f"{key} {label}" if label else key
+
+
+def _scenario(url, method="get", user=None, kwargs=None, query=None, data=None, label=""):
+    return {
+        "url": url,
+        "method": method,
+        "user": user,
+        "kwargs": kwargs or {},
+        "query": query or {},
+        "data": data,
+        "label": label,
+    }
+
+
+def _next_weekday(weekday: int) -> date:
+    start = date.today() + timedelta(days=14)
+    return start + timedelta(days=(weekday - start.weekday()) % 7)
+
+
+def build_scenarios(fx: dict) -> list[dict]:
+    """fx: seed.seed() 반환값"""
+    open_request = {"pk": fx["open_request"]}
+    dispatch_payload = {
+        "culture_center_id": fx["culture_center"],
+        "teaching_language": "English",
+        "course_title": "Benchmark Course",
+        "class_days": ["MON"],
+        "start_time": "10:00",
+        "end_time": "11:30",
+        "start_date": _next_weekday(0).isoformat(),
+        "lecture_count": 12,
+        "applicant_name": "Bench",
+        "applicant_phone": "02-123-4567",
+        "applicant_email": "applicant@bench.invalid",
+    }
+
+    scenarios = [
+        # --- accounts ---------------------------------------------------------------
+        _scenario("accounts:csrf"),
+        _scenario(
+            "accounts:register",
+            "post",
+            data={
+                "email": "bench-register@bench.invalid",
+                "password": BENCH_PASSWORD,
+                "password_confirm": BENCH_PASSWORD,
+            },
+        ),
+        _scenario(
+            "accounts:login",
+            "post",
+            data={"email": "bench-admin@bench.invalid", "password": BENCH_PASSWORD},
+        ),
+        _scenario("accounts:logout", "post", user="teacher"),
+        _scenario("accounts:verify_email", "post", data={"token": fx["verify_token"]}),
+        _scenario(
+            "accounts:resend_verification",
+            "post",
+            data={"email": "bench-newcomer@bench.invalid"},
+        ),
+        _scenario(
+            "accounts:password_reset_request",
+            "post",
+            data={"email": "bench-teacher0@bench.invalid"},
+        ),
+        _scenario(
+            "accounts:password_reset_confirm",
+            "post",
+            data={
+                "token": fx["reset_token"],
+                "password": BENCH_PASSWORD + "!",
+                "password_confirm": BENCH_PASSWORD + "!",
+            },
+        ),
+        _scenario("accounts:profile", user="teacher"),
+        _scenario("accounts:profile", "patch", user="teacher", data={}),
+        # --- teacher_applications ---------------------------------------------------
+        _scenario("teacher_applications:teacher-application-create", user="newcomer"),
+        _scenario(
+            "teacher_applications:teacher-application-create",
+            "post",
+            user="newcomer",
+            data={"first_name": "Bench"},
+            label="invalid",
+        ),
+        _scenario("teacher_applications:teacher-application-update", user="teacher"),
+        _scenario(
+            "teacher_applications:teacher-application-update",
+            "patch",
+            user="teacher",
+            data={
+                "preferred_subjects": "Conversation",
+                "consent_personal_data": True,
+                "consent_data_retention": True,
+                "confirmation_info_true": True,
+            },
+        ),
+        _scenario(
+            "teacher_applications:teacher-application-update", "delete", user="teacher"
+        ),
+        _scenario(
+            "teacher_applications:teacher-application-upload-url",
+            "post",
+            user="teacher",
+            data={"field": "profile_image", "filename": "me.jpg"},
+        ),
+        _scenario("teacher_applications:teacher-application-list", user="admin"),
+        _scenario(
+            "teacher_applications:teacher-application-list",
+            user="admin",
+            query={"page_size": 200, "ordering": "visa_expiry_date"},
+            label="page_size=200",
+        ),
+        _scenario(
+            "teacher_applications:teacher-application-detail",
+            user="admin",
+            kwargs={"pk": fx["teacher_application"]},
+        ),
+        _scenario(
+            "teacher_applications:teacher-application-detail",
+            "patch",
+            user="admin",
+            kwargs={"pk": fx["teacher_application"]},
+            data={"memo": "benchmark"},
+        ),
+        # --- culture_centers --------------------------------------------------------
+        _scenario("culture_centers:branch-list", user="teacher"),
+        # --- dispatch_requests ------------------------------------------------------
+        _scenario("dispatch_requests:create", "post", user="manager", data=dispatch_payload),
+        _scenario("dispatch_requests:my-list", user="manager"),
+        _scenario("dispatch_requests:open-list", user="teacher"),
+        _scenario(
+            "dispatch_requests:open-list",
+            user="teacher",
+            query={"page_size": 200},
+            label="page_size=200",
+        ),
+        _scenario(
+            "dispatch_requests:open-near-me", user="teacher", query={"radius_km": 15}
+        ),
+        _scenario("dispatch_requests:detail", user="teacher", kwargs=open_request),
+        _scenario(
+            "dispatch_requests:apply",
+            "post",
+            user="teacher",
+            kwargs={"pk": fx["apply_request"]},
+            data={"message": "benchmark"},
+        ),
+        _scenario("dispatch_requests:withdraw", "post", user="teacher", kwargs=open_request),
+        _scenario("dispatch_requests:admin-list", user="admin"),
+        _scenario(
+            "dispatch_requests:admin-list",
+            user="admin",
+            query={"page_size": 200},
+            label="page_size=200",
+        ),
+        _scenario("dispatch_requests:admin-detail", user="admin", kwargs=open_request),
+        _scenario(
+            "dispatch_requests:admin-detail",
+            "patch",
+            user="admin",
+            kwargs=open_request,
+            data={"notes_for_teachers": "benchmark"},
+        ),
+        _scenario(
+            "dispatch_requests:admin-open",
+            "post",
+            user="admin",
+            kwargs={"pk": fx["requested_request"]},
+        ),
+        _scenario("dispatch_requests:admin-close", "post", user="admin", kwargs=open_request),
+        _scenario(
+            "dispatch_requests:admin-applications", user="admin", kwargs=open_request
+        ),
+        _scenario(
+            "dispatch_requests:admin-nearest-teachers",
+            user="admin",
+            kwargs=open_request,
+            query={"k": 20},
+        ),
+        _scenario(
+            "dispatch_requests:admin-set-application-status",
+            "patch",
+            user="admin",
+            kwargs={"pk": fx["selected_request"]},
+            data={"application_id": fx["selected_application"], "status": "SHORTLISTED"},
+        ),
+        # --- courses ----------------------------------------------------------------
+        _scenario("courses:my-list", user="teacher"),
+        _scenario("courses:admin-list", user="admin"),
+        _scenario(
+            "courses:admin-list",
+            user="admin",
+            query={"page_size": 200},
+            label="page_size=200",
+        ),
+        _scenario("courses:admin-detail", user="admin", kwargs={"pk": fx["course"]}),
+        _scenario(
+            "courses:admin-detail",
+            "patch",
+            user="admin",
+            kwargs={"pk": fx["course"]},
+            data={"notes": "benchmark"},
+        ),
+        _scenario(
+            "courses:admin-confirm-from-dispatch",
+            "post",
+            user="admin",
+            kwargs={"dispatch_id": fx["selected_request"]},
+            data={},
+        ),
+    ]
+
+    # --- Django admin: 대시보드 + 모델별 목록/상세 -------------------------------------
+    scenarios.append(_scenario("admin:index", user="admin"))
+    for model in admin.site._registry:
+        opts = model._meta
+        prefix = f"admin:{opts.app_label}_{opts.model_name}"
+        scenarios.append(_scenario(f"{prefix}_changelist", user="admin"))
+        obj = model._default_manager.order_by("pk").first()
+        if obj is not None:
+            scenarios.append(
+                _scenario(f"{prefix}_change", user="admin", kwargs={"object_id": obj.pk})
+            )
+    return scenarios
+
+
+def _url_names(patterns, namespace=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            ns = pattern.namespace or ""
+            child = f"{namespace}{ns}:" if ns else namespace
+            yield from _url_names(pattern.url_patterns, child)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield f"{namespace}{pattern.name}"
+
+
+def uncovered_url_names(scenarios: list[dict]) -> list[str]:
+    """admin/ 을 제외한 URL name 중 시나리오가 없는 것"""
+    covered = {scenario["url"] for scenario in scenarios}
+    names = {
+        name
+        for name in _url_names(get_resolver().url_patterns)
+        if not name.startswith("admin:")
+    }
+    return sorted(names - covered)
@@ -0,0 +1,311 @@
+# backend/benchmarks/seed.py
+"""
+벤치마크용 데이터 생성 (운영 규모: 지점 수천 / 강사·지원서·강좌 수만).
+
+- bulk_create 로 빠르게 넣음 → model.save() 훅(이미지 처리, full_clean)은 타지 않으므로
+  geo_cell / applications_count 같은 파생 값은 여기서 직접 채움
+- random.Random(seed) 고정 → 같은 scale 이면 항상 같은 데이터 (응답 크기 비교 가능)
+- 반환값: 시나리오에서 쓰는 대표 객체들의 id (fixtures dict)
+"""
+from __future__ import annotations
+
+import io
+import random
+from datetime import date, time, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.utils import timezone
+
+from accounts.models import EmailVerificationToken, PasswordResetToken, User
+from course_posts.models import CourseApplication, CourseApplicationStatusChoices
+from courses.models import Course
+from culture_centers.models import Center, CultureCenter, Region
+from dispatch_requests.models import DispatchRequest, DispatchRequestStatusChoices
+from teacher_applications.geo_cells import cell_key_or_none
+from teacher_applications.models import ApplicationStatusChoices, TeacherApplication
+
+# scale=1.0 기준 행 수
+VOLUMES = {
+    "culture_centers": 2000,
+    "teachers": 20000,
+    "managers": 50,
+    "dispatch_requests": 20000,
+    "applications_per_open_request": 5,
+}
+BENCH_PASSWORD = "bench-password-1234"
+BATCH_SIZE = 1000
+
+_LANGUAGES = ["English", "Japanese", "Chinese", "Spanish"]
+_NATIONALITIES = ["USA", "UK", "CANADA", "AUSTRALIA", "PHILIPPINES", "JAPAN", "CHINA"]
+_GENDERS = ["MALE", "FEMALE", "OTHER"]
+_CITIES = [("서울특별시", "강남구"), ("서울특별시", "마포구"), ("경기도", "성남시"), ("인천광역시", "연수구")]
+_DAYS = ["MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"]
+# 지원서 TextField 는 실제 이력서 길이(수백~수천 자)로 채움
+_PARAGRAPH = (
+    "I have taught conversational English to adults and children for several years, "
+    "designing lesson plans around real-life situations and steady feedback. "
+)
+
+
+def _scaled(name: str, scale: float) -> int:
+    return max(1, int(VOLUMES[name] * scale))
+
+
+def _seoul_point(rng: random.Random):
+    lat = round(37.40 + rng.random() * 0.30, 7)
+    lng = round(126.80 + rng.random() * 0.40, 7)
+    return lat, lng
+
+
+def _next_weekday(start: date, weekday: int) -> date:
+    return start + timedelta(days=(weekday - start.weekday()) % 7)
+
+
+def seed(scale: float = 1.0, random_seed: int = 42) -> dict:
+    rng = random.Random(random_seed)
+    now = timezone.now()
+    today = date.today()
+    password = make_password(BENCH_PASSWORD)  # 해시 1회만 계산해서 공유
+
+    # --- 사용자 (관리자 / 매니저 / 강사) -------------------------------------------
+    admin = User.objects.create(
+        email="bench-admin@bench.invalid",
+        password=password,
+        role=User.Role.ADMIN,
+        is_staff=True,
+        is_superuser=True,
+        is_email_verified=True,
+    )
+    managers = User.objects.bulk_create(
+        [
+            User(
+                email=f"bench-manager{i}@bench.invalid",
+                password=password,
+                role=User.Role.MANAGER,
+                is_email_verified=True,
+            )
+            for i in range(_scaled("managers", scale))
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    teacher_count = _scaled("teachers", scale)
+    teacher_users = User.objects.bulk_create(
+        [
+            User(
+                email=f"bench-teacher{i}@bench.invalid",
+                password=password,
+                role=User.Role.TEACHER,
+                is_email_verified=True,
+            )
+            for i in range(teacher_count)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    # 이력서가 없는 강사 계정 (이력서 제출 화면)
+    newcomer = User.objects.create(
+        email="bench-newcomer@bench.invalid",
+        password=password,
+        role=User.Role.TEACHER,
+    )
+
+    # --- 문화센터 지점 -------------------------------------------------------------
+    centers = Center.objects.bulk_create(
+        [Center(name=f"Bench Center {i}") for i in range(20)]
+    )
+    regions = Region.objects.bulk_create(
+        [Region(name=f"Bench Region {i}") for i in range(25)]
+    )
+    branches = []
+    for i in range(_scaled("culture_centers", scale)):
+        lat, lng = _seoul_point(rng)
+        branches.append(
+            CultureCenter(
+                center=centers[i % len(centers)],
+                region=regions[(i // len(centers)) % len(regions)],
+                branch_name=f"Branch {i}",
+                address_detail=f"{i} Bench-ro",
+                manager_name="Bench Manager",
+                latitude=lat,
+                longitude=lng,
+                geo_cell=cell_key_or_none(lat, lng),
+            )
+        )
+    branches = CultureCenter.objects.bulk_create(branches, batch_size=BATCH_SIZE)
+
+    # --- 강사 이력서 ---------------------------------------------------------------
+    teachers = []
+    for i, user in enumerate(teacher_users):
+        lat, lng = _seoul_point(rng)
+        city, district = rng.choice(_CITIES)
+        status = (
+            ApplicationStatusChoices.ACCEPTED
+            if i == 0 or rng.random() < 0.7
+            else rng.choice(
+                [ApplicationStatusChoices.NEW, ApplicationStatusChoices.IN_REVIEW]
+            )
+        )
+        teachers.append(
+            TeacherApplication(
+                user=user,
+                first_name=f"Teacher{i}",
+                last_name="Bench",
+                gender=rng.choice(_GENDERS),
+                date_of_birth=date(1970 + rng.randrange(30), 1 + rng.randrange(12), 1),
+                nationality=rng.choice(_NATIONALITIES),
+                native_language="ENGLISH",
+                email=user.email,
+                phone_number="010-1234-5678",
+                address_line1=f"{i} Bench-gil",
+                city=city,
+                district=district,
+                latitude=lat,
+                longitude=lng,
+                geo_cell=cell_key_or_none(lat, lng),
+                visa_type="F-2",
+                visa_expiry_date=(
+                    today + timedelta(days=rng.randrange(30, 1500))
+                    if rng.random() < 0.8
+                    else None
+                ),
+                teaching_languages=rng.choice(_LANGUAGES),
+                self_introduction=_PARAGRAPH * rng.randrange(3, 12),
+                education_history=_PARAGRAPH * rng.randrange(1, 5),
+                experience_history=_PARAGRAPH * rng.randrange(2, 8),
+                evaluation_result=_PARAGRAPH if rng.random() < 0.3 else "",
+                consent_personal_data=True,
+                consent_data_retention=True,
+                confirmation_info_true=True,
+                status=status,
+            )
+        )
+    teachers = TeacherApplication.objects.bulk_create(teachers, batch_size=BATCH_SIZE)
+    accepted = [t for t in teachers if t.status == ApplicationStatusChoices.ACCEPTED]
+
+    # --- 파견 요청 (OPEN 40% / REQUESTED 10% / CLOSED 50%) ---------------------------
+    requests_ = []
+    for i in range(_scaled("dispatch_requests", scale)):
+        roll = rng.random()
+        if roll < 0.4:
+            status = DispatchRequestStatusChoices.OPEN
+        elif roll < 0.5:
+            status = DispatchRequestStatusChoices.REQUESTED
+        else:
+            status = DispatchRequestStatusChoices.CLOSED
+        day = rng.randrange(7)
+        start_date = _next_weekday(today + timedelta(days=rng.randrange(7, 120)), day)
+        published_at = (
+            now - timedelta(minutes=rng.randrange(60 * 24 * 60))
+            if status != DispatchRequestStatusChoices.REQUESTED
+            else None
+        )
+        requests_.append(
+            DispatchRequest(
+                requester=managers[i % len(managers)],
+                culture_center=rng.choice(branches),
+                teaching_language=rng.choice(_LANGUAGES),
+                course_title=f"Bench Course {i}",
+                class_days=[_DAYS[day]],
+                start_time=time(10, 0),
+                end_time=time(11, 30),
+                start_date=start_date,
+                end_date=start_date + timedelta(weeks=11),
+                lecture_count=12,
+                applicant_name="Bench Applicant",
+                applicant_phone="02-123-4567",
+                applicant_email="applicant@bench.invalid",
+                notes_for_teachers="Bring your own materials.",
+                published_at=published_at,
+                closed_at=now if status == DispatchRequestStatusChoices.CLOSED else None,
+                status=status,
+            )
+        )
+    requests_ = DispatchRequest.objects.bulk_create(requests_, batch_size=BATCH_SIZE)
+    open_requests = [r for r in requests_ if r.status == DispatchRequestStatusChoices.OPEN]
+    requested = [
+        r for r in requests_ if r.status == DispatchRequestStatusChoices.REQUESTED
+    ]
+    closed = [r for r in requests_ if r.status == DispatchRequestStatusChoices.CLOSED]
+
+    # --- 지원서 (OPEN 공고마다 N명) / 강좌 (CLOSED 공고마다 1개) ---------------------
+    applications = []
+    per_request = VOLUMES["applications_per_open_request"]
+    for dr in open_requests:
+        for teacher in rng.sample(accepted, min(per_request, len(accepted))):
+            applications.append(
+                CourseApplication(
+                    dispatch_request=dr,
+                    teacher=teacher,
+                    status=CourseApplicationStatusChoices.APPLIED,
+                    message="I would love to teach this course.",
+                )
+            )
+    CourseApplication.objects.bulk_create(
+        applications, batch_size=BATCH_SIZE, ignore_conflicts=True
+    )
+    call_command("reconcile_applications_count", stdout=io.StringIO())
+
+    Course.objects.bulk_create(
+        [
+            Course(
+                source_dispatch_request=dr,
+                culture_center_id=dr.culture_center_id,
+                teaching_language=dr.teaching_language,
+                course_title=dr.course_title,
+                teacher=rng.choice(accepted),
+                class_days=dr.class_days,
+                start_time=dr.start_time,
+                end_time=dr.end_time,
+                start_date=dr.start_date,
+                end_date=dr.end_date,
+                lecture_count=dr.lecture_count,
+            )
+            for dr in closed
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    # --- 시나리오용 대표 객체 ------------------------------------------------------
+    teacher = teachers[0]  # ACCEPTED
+    CourseApplication.objects.filter(teacher=teacher).delete()
+    applied_request, other_request = open_requests[0], open_requests[1]
+    CourseApplication.objects.create(dispatch_request=applied_request, teacher=teacher)
+    selected = (
+        CourseApplication.objects.filter(dispatch_request=other_request)
+        .exclude(teacher=teacher)
+        .first()
+    )
+    CourseApplication.objects.filter(pk=selected.pk).update(
+        status=CourseApplicationStatusChoices.SELECTED
+    )
+    # 매니저 0 은 본인 요청 목록 시나리오용
+    manager = managers[0]
+    verify_token = EmailVerificationToken.objects.create(user=newcomer)
+    reset_token = PasswordResetToken.objects.create(
+        user=teacher.user, expires_at=now + timedelta(hours=1)
+    )
+    course = Course.objects.filter(teacher__isnull=False).order_by("id").first()
+
+    return {
+        "admin": admin.pk,
+        "manager": manager.pk,
+        "teacher_user": teacher.user_id,
+        "newcomer": newcomer.pk,
+        "teacher_application": teacher.pk,
+        "culture_center": branches[0].pk,
+        "open_request": applied_request.pk,  # teacher 가 지원한 OPEN 공고
+        "selected_request": other_request.pk,  # SELECTED 지원자가 있는 OPEN 공고
+        "apply_request": open_requests[2].pk,  # teacher 가 아직 지원하지 않은 OPEN 공고
+        "requested_request": requested[0].pk,
+        "course": course.pk,
+        "selected_application": selected.pk,
+        "verify_token": str(verify_token.token),
+        "reset_token": str(reset_token.token),
+        "counts": {
+            "culture_centers": len(branches),
+            "teachers": len(teachers),
+            "dispatch_requests": len(requests_),
+            "applications": CourseApplication.objects.count(),
+            "courses": len(closed),
+        },
+    }
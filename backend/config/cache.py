@@ -0,0 +1,346 @@
+"""
+2단 cache backend + tag 기반 invalidate helper.
+
+TwoTierCache (CACHES["default"])
+- 프로세스 내 LRU(local) → 공유 backend(CACHES["shared"], CACHE_URL) 순서로 조회
+- local 항목은 LOCAL_TIMEOUT 초만 유지 → 다른 worker 의 set/delete/invalidate 는 최대 그 시간 뒤 반영
+  (같은 프로세스의 변경은 local 도 함께 갱신하므로 바로 반영)
+- LOCAL_MAX_ENTRIES=0 이면 local 없이 공유 backend 만 사용
+- 운영: CACHE_URL=redis://redis:6379/1 (docker-compose redis 서비스)
+- 테스트/로컬 개발: CACHE_URL 기본값 locmemcache://, 파일 cache 는 filecache:///tmp/friending-cache
+
+tag
+- tag 마다 공유 cache 에 임의 token 을 두고, cache key 뒤에 관련 tag token 들의 hash 를 붙임
+- invalidate_tags() 는 token 만 새로 발급 → 이전 key 는 더 이상 조회되지 않고 timeout 으로 정리
+  (token 이 evict 되어도 새 token 이 발급되므로 예전 값이 되살아나지 않음)
+- invalidate_on_change(model, *tags): 모델 저장/삭제 시 커밋 이후 tag invalidate
+
+helper
+- cached_value(key, compute, tags=...): 값 1개
+- cached(tags=...): 함수 결과 (인자별)
+- cached_queryset(queryset, tags=...): 쿼리 결과 list (SQL 기준 key)
+- cache_response(tags=...): DRF view handler(get/list) 의 200 응답 data
+- API_CACHE_ENABLED=False 면 helper 는 cache 없이 매번 계산
+  (DEBUG=False 에서 공유 cache 없이 locmem 만 있을 때의 기본값)
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.exceptions import EmptyResultSet
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.functional import cached_property
+from rest_framework.response import Response
+
+from .db_router import use_primary
+
+_MISSING = object()
+
+
+class TwoTierCache(BaseCache):
+    """
+    CACHES = {
+        "default": {
+            "BACKEND": "config.cache.TwoTierCache",
+            "LOCATION": "shared",  # 공유 backend alias
+            "OPTIONS": {"LOCAL_MAX_ENTRIES": 1000, "LOCAL_TIMEOUT": 5},
+        },
+        "shared": env.cache("CACHE_URL"),
+    }
+    key prefix / version / TIMEOUT 기본값은 공유 backend 설정을 따름.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = location or "shared"
+        self._local_max_entries = int(options.get("LOCAL_MAX_ENTRIES", 1000))
+        self._local_timeout = float(options.get("LOCAL_TIMEOUT", 5))
+        self._local: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @cached_property
+    def shared(self) -> BaseCache:
+        return caches[self._shared_alias]
+
+    # ------------------------------------------------------------------
+    # local LRU
+    # ------------------------------------------------------------------
+    def _local_key(self, key, version) -> str:
+        return self.shared.make_and_validate_key(key, version=version)
+
+    def _local_get(self, local_key):
+        if not self._local_max_entries:
+            return _MISSING
+        with self._lock:
+            entry = self._local.get(local_key)
+            if entry is None:
+                return _MISSING
+            expires_at, pickled = entry
+            if expires_at <= time.monotonic():
+                del self._local[local_key]
+                return _MISSING
+            self._local.move_to_end(local_key)
+        # 호출자가 값을 수정해도 cache 가 바뀌지 않도록 매번 새 객체
+        return pickle.loads(pickled)
+
+    def _local_set(self, local_key, value, timeout=DEFAULT_TIMEOUT):
+        if not self._local_max_entries:
+            return
+        local_timeout = self._local_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            local_timeout = min(local_timeout, timeout)
+        if local_timeout <= 0:
+            self._local_delete(local_key)
+            return
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._local[local_key] = (time.monotonic() + local_timeout, pickled)
+            self._local.move_to_end(local_key)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def _local_delete(self, local_key):
+        with self._lock:
+            self._local.pop(local_key, None)
+
+    # ------------------------------------------------------------------
+    # BaseCache
+    # ------------------------------------------------------------------
+    def get(self, key, default=None, version=None):
+        local_key = self._local_key(key, version)
+        value = self._local_get(local_key)
+        if value is not _MISSING:
+            return value
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self._local_set(local_key, value)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._local_get(self._local_key(key, version))
+            if value is _MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        if missing:
+            for key, value in self.shared.get_many(missing, version=version).items():
+                self._local_set(self._local_key(key, version), value)
+                found[key] = value
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self._local_set(self._local_key(key, version), value, timeout)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.shared.set_many(data, timeout=timeout, version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self._local_set(self._local_key(key, version), value, timeout)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout=timeout, version=version)
+        if added:
+            self._local_set(self._local_key(key, version), value, timeout)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._local_delete(self._local_key(key, version))
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self._local_delete(self._local_key(key, version))
+        self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        if self._local_get(self._local_key(key, version)) is not _MISSING:
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        # 원자성은 공유 backend 에 맡기고 local 값은 버림
+        self._local_delete(self._local_key(key, version))
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self._local_delete(self._local_key(key, version))
+        return self.shared.decr(key, delta, version=version)
+
+    def clear(self):
+        with self._lock:
+            self._local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
+
+
+# ----------------------------------------------------------------------
+# tag
+# ----------------------------------------------------------------------
+_TAG_KEY = "cache_tag:{}"
+
+
+def _new_token() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def tag_tokens(tags) -> list[str]:
+    tags = sorted(set(tags))
+    keys = [_TAG_KEY.format(tag) for tag in tags]
+    found = cache.get_many(keys)
+    tokens = []
+    for key in keys:
+        token = found.get(key)
+        if token is None:
+            # 다른 프로세스가 먼저 발급했으면 그 token 사용
+            cache.add(key, _new_token(), timeout=None)
+            token = cache.get(key) or _new_token()
+        tokens.append(token)
+    return tokens
+
+
+def tagged_key(key: str, tags=()) -> str:
+    if not tags:
+        return key
+    digest = hashlib.md5(".".join(tag_tokens(tags)).encode()).hexdigest()[:16]
+    return f"{key}:t{digest}"
+
+
+def invalidate_tags(*tags) -> None:
+    cache.set_many({_TAG_KEY.format(tag): _new_token() for tag in tags}, timeout=None)
+
+
+def invalidate_on_change(model, *tags) -> None:
+    """model 저장/삭제가 커밋되면 tags invalidate (AppConfig.ready 에서 호출)"""
+
+    def receiver(sender, **kwargs):
+        # 커밋 전 다른 요청이 예전 데이터로 다시 채우지 않도록 커밋 이후에 무효화
+        transaction.on_commit(lambda: invalidate_tags(*tags))
+
+    uid = f"cache_tags:{model._meta.label}:{','.join(tags)}"
+    post_save.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+
+
+# ----------------------------------------------------------------------
+# helper
+# ----------------------------------------------------------------------
+def cache_enabled() -> bool:
+    return getattr(settings, "API_CACHE_ENABLED", True)
+
+
+def _timeout(timeout):
+    if timeout is DEFAULT_TIMEOUT:
+        return getattr(settings, "API_RESPONSE_CACHE_SECONDS", 60)
+    return timeout
+
+
+def cached_value(key: str, compute, *, tags=(), timeout=DEFAULT_TIMEOUT):
+    """cache 에 있으면 그 값, 없으면 compute() 결과를 저장 후 반환"""
+    if not cache_enabled():
+        return compute()
+    full_key = tagged_key(key, tags)
+    value = cache.get(full_key, _MISSING)
+    if value is _MISSING:
+        # replica 지연 데이터가 invalidate 이후까지 cache 에 남지 않도록 default 에서 조회
+        with use_primary():
+            value = compute()
+        cache.set(full_key, value, timeout=_timeout(timeout))
+    return value
+
+
+def _args_digest(*parts) -> str:
+    return hashlib.md5(repr(parts).encode()).hexdigest()
+
+
+def cached(*, tags=(), timeout=DEFAULT_TIMEOUT, key_prefix=None):
+    """
+    함수 결과 cache (인자는 repr 로 key 생성 → 모델 인스턴스보다 pk 같은 단순 값 권장)
+
+        @cached(tags=("teacher_applications",), timeout=300)
+        def accepted_teacher_count(language): ...
+    """
+
+    def decorator(func):
+        prefix = key_prefix or f"fn:{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = f"{prefix}:{_args_digest(args, sorted(kwargs.items()))}"
+            return cached_value(
+                key, lambda: func(*args, **kwargs), tags=tags, timeout=timeout
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def cached_queryset(queryset, *, tags=(), timeout=DEFAULT_TIMEOUT) -> list:
+    """queryset 결과를 list 로 cache (key: DB alias + SQL + params)"""
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return []
+    key = "qs:{}:{}".format(
+        queryset.model._meta.label_lower, _args_digest(queryset.db, sql, params)
+    )
+    return cached_value(key, lambda: list(queryset), tags=tags, timeout=timeout)
+
+
+def cache_response(*, tags=(), timeout=DEFAULT_TIMEOUT, per_user=False):
+    """
+    DRF view handler(get / list / retrieve) 의 200 응답 data 를 cache.
+    권한 검사(initial) 이후에 실행되므로 인증/권한은 그대로 적용됨.
+    key: view 클래스 + 전체 URL(쿼리스트링 포함), per_user=True 면 사용자별.
+
+        class OpenListView(generics.ListAPIView):
+            @cache_response(tags=("dispatch_requests",))
+            def list(self, request, *args, **kwargs): ...
+    """
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            if not cache_enabled():
+                return handler(view, request, *args, **kwargs)
+            parts = [type(view).__module__, type(view).__qualname__]
+            parts.append(request.build_absolute_uri())
+            if per_user:
+                parts.append(getattr(request.user, "pk", None))
+            key = f"view:{type(view).__name__}:{_args_digest(*parts)}"
+            full_key = tagged_key(key, tags)
+
+            data = cache.get(full_key, _MISSING)
+            if data is not _MISSING:
+                return Response(data)
+            with use_primary():
+                response = handler(view, request, *args, **kwargs)
+            if response.status_code == 200 and hasattr(response, "data"):
+                cache.set(full_key, response.data, timeout=_timeout(timeout))
+            return response
+
+        return wrapper
+
+    return decorator
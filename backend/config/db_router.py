@@ -0,0 +1,150 @@
+"""
+읽기 전용 replica DB router (DATABASE_ROUTERS).
+
+- DATABASES["replica"] 가 있을 때만 동작 (DB_REPLICA_URL), 없으면 모든 쿼리가 default
+- 쓰기 / migrate 는 항상 default
+- 읽기는 read_from_replica() 구간(ReplicaReadMixin 을 쓴 view 의 GET 등)에서만 replica
+  · transaction(atomic) 안에서는 default (select_for_update / 방금 쓴 값 조회)
+  · read-your-writes: 데이터 변경 요청(POST/PUT/PATCH/DELETE) 응답에 ReplicaPinMiddleware 가
+    REPLICA_PIN_COOKIE 를 REPLICA_STICKY_SECONDS 동안 심음 → 그 사이 같은 브라우저의 GET 은 default
+- ModelAdmin: ReplicaChangelistMixin (목록 / django-import-export export)
+- cache 를 채우는 조회는 use_primary() 로 default 에서 (replica 지연 데이터가 cache 에 남지 않도록)
+
+로컬 테스트: DB_REPLICA_URL=sqlite:////tmp/friending-replica.sqlite3 (db.sqlite3 복사본)
+"""
+from __future__ import annotations
+
+import contextvars
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = "replica"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# 현재 요청(thread / task)의 읽기 DB alias (None = default)
+_read_alias: contextvars.ContextVar = contextvars.ContextVar(
+    "db_read_alias", default=None
+)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in connections.settings
+
+
+def read_alias() -> str:
+    """지금 읽기 쿼리가 갈 DB alias"""
+    alias = _read_alias.get()
+    if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return DEFAULT_DB_ALIAS
+    return alias
+
+
+def is_pinned_to_primary(request) -> bool:
+    return bool(request.COOKIES.get(settings.REPLICA_PIN_COOKIE))
+
+
+@contextmanager
+def use_primary():
+    token = _read_alias.set(None)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+@contextmanager
+def read_from_replica(request=None):
+    """
+    구간 안의 읽기 쿼리를 replica 로.
+    request 가 주어지면 안전한 메서드이고 primary 고정 cookie 가 없을 때만.
+    """
+    use_replica = replica_configured() and (
+        request is None
+        or (request.method in SAFE_METHODS and not is_pinned_to_primary(request))
+    )
+    token = _read_alias.set(REPLICA_DB_ALIAS if use_replica else None)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        # replica 에서 읽은 인스턴스를 저장해도 default 로
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # replica 는 default 의 복제본 → schema 는 복제로 따라감
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
+
+
+class ReplicaReadMixin:
+    """
+    APIView / Django View 에 섞어서 GET(HEAD/OPTIONS) 조회를 replica 로 보냄.
+
+        class DispatchRequestAdminListView(ReplicaReadMixin, generics.ListAPIView): ...
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        with read_from_replica(request):
+            return super().dispatch(request, *args, **kwargs)
+
+
+class ReplicaChangelistMixin:
+    """ModelAdmin 목록(changelist) / export 조회를 replica 로"""
+
+    def changelist_view(self, request, extra_context=None):
+        with read_from_replica(request):
+            response = super().changelist_view(request, extra_context)
+            # 목록 queryset 은 template 에서 평가되므로 구간 안에서 render
+            if hasattr(response, "render"):
+                response.render()
+        return response
+
+    def get_export_queryset(self, request):
+        # django-import-export: export 는 form POST 라서 메서드 대신 cookie 만 확인
+        queryset = super().get_export_queryset(request)
+        if replica_configured() and not is_pinned_to_primary(request):
+            queryset = queryset.using(REPLICA_DB_ALIAS)
+        return queryset
+
+
+class ReplicaPinMiddleware:
+    """
+    read-your-writes: 성공한 데이터 변경 요청 뒤 REPLICA_STICKY_SECONDS 동안 읽기를 default 로 고정.
+    (replica 복제 지연보다 길게 설정, cookie 라서 worker / 공유 cache 와 무관)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and replica_configured()
+        ):
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite=settings.SESSION_COOKIE_SAMESITE,
+                secure=settings.SESSION_COOKIE_SECURE,
+            )
+        return response
@@ -0,0 +1,233 @@
+"""
+요청 단위 SQL / 단계별 시간 측정 (Server-Timing 헤더 + 느린 요청 로그).
+
+- db: connection.execute_wrapper 로 쿼리 수 / DB 시간 (모든 DB alias)
+- view: process_view ~ view 반환, render: response.render()
+- serialize: DRF serializer.data 계산 — DRF 에 hook 이 없어서 Serializer / ListSerializer.data 를
+  프로세스 전체에서 감싸야 하므로 REQUEST_TIMING_SERIALIZER_ENABLED(기본 DEBUG) 일 때만 설치
+- total 은 모든 요청에서 측정(perf_counter 2회), 나머지 단계는 REQUEST_TIMING_SAMPLE_RATE 비율만 측정
+- total 이 SLOW_REQUEST_LOG_MS 이상이면 "config.request_timing" logger 로 한 줄 기록
+- Server-Timing 헤더는 내부 구조(쿼리 수 / 단계 시간)를 드러내므로 SERVER_TIMING_HEADER_ENABLED
+  (기본 DEBUG) 이거나 staff 사용자일 때만 응답에 붙임
+
+응답 헤더 예:
+  Server-Timing: total;dur=41.2, db;dur=12.8;desc="9 queries", view;dur=30.1,
+                 serialize;dur=9.7, render;dur=3.4
+"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("config.request_timing")
+
+# serializer.data 계측이 현재 요청의 RequestTiming 을 찾을 수 있도록 (thread / async 안전)
+_current_timing: contextvars.ContextVar = contextvars.ContextVar(
+    "request_timing", default=None
+)
+
+
+class RequestTiming:
+    __slots__ = (
+        "queries",
+        "db",
+        "view_started",
+        "view",
+        "serialize",
+        "serializing",
+        "render_started",
+        "render",
+    )
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.view_started = None
+        self.view = None
+        self.serialize = 0.0
+        self.serializing = False
+        self.render_started = None
+        self.render = None
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+    def end_view(self):
+        if self.view_started is not None and self.view is None:
+            self.view = time.perf_counter() - self.view_started
+
+
+def _timed_serializer_data(prop):
+    fget = prop.fget
+
+    def data(self):
+        timing = _current_timing.get()
+        # 중첩 serializer(.data 안의 .data) 는 바깥에서 한 번만 계산
+        if timing is None or timing.serializing:
+            return fget(self)
+        timing.serializing = True
+        started = time.perf_counter()
+        try:
+            return fget(self)
+        finally:
+            timing.serialize += time.perf_counter() - started
+            timing.serializing = False
+
+    data._request_timing = True
+    return property(data, doc=prop.__doc__)
+
+
+def install_serializer_timing():
+    """DRF 에는 직렬화 단계 hook 이 없어서 Serializer / ListSerializer.data 를 감쌈 (1회)."""
+    from rest_framework import serializers
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        prop = cls.__dict__["data"]
+        if not getattr(prop.fget, "_request_timing", False):
+            wrapped = _timed_serializer_data(prop)
+            wrapped.fget._original = prop
+            cls.data = wrapped
+
+
+def uninstall_serializer_timing():
+    """install_serializer_timing 이전의 property 로 되돌림."""
+    from rest_framework import serializers
+
+    for cls in (serializers.Serializer, serializers.ListSerializer):
+        prop = cls.__dict__["data"]
+        if getattr(prop.fget, "_request_timing", False):
+            cls.data = prop.fget._original
+
+
+def _ms(seconds) -> float:
+    return round(seconds * 1000, 1)
+
+
+class RequestTimingMiddleware:
+    """
+    MIDDLEWARE 앞쪽(CORS / Security 바로 뒤)에 두어야 세션/인증 미들웨어 시간까지 total 에 포함됨.
+    REQUEST_TIMING_ENABLED=False 면 아무것도 하지 않음.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "REQUEST_TIMING_ENABLED", True)
+        self.sample_rate = getattr(settings, "REQUEST_TIMING_SAMPLE_RATE", 1.0)
+        self.slow_ms = getattr(settings, "SLOW_REQUEST_LOG_MS", 1000)
+        self.header_enabled = getattr(
+            settings, "SERVER_TIMING_HEADER_ENABLED", settings.DEBUG
+        )
+        if self.enabled and getattr(
+            settings, "REQUEST_TIMING_SERIALIZER_ENABLED", settings.DEBUG
+        ):
+            install_serializer_timing()
+
+    def __call__(self, request):
+        if not self.enabled:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        timing = None
+        if self.sample_rate >= 1 or random.random() < self.sample_rate:
+            timing = RequestTiming()
+        request.request_timing = timing
+
+        if timing is None:
+            response = self.get_response(request)
+        else:
+            token = _current_timing.set(timing)
+            try:
+                with ExitStack() as stack:
+                    for connection in connections.all():
+                        stack.enter_context(connection.execute_wrapper(timing))
+                    response = self.get_response(request)
+            finally:
+                _current_timing.reset(token)
+            timing.end_view()
+
+        total = time.perf_counter() - started
+        if timing is not None and self._header_allowed(request):
+            response["Server-Timing"] = self._header(total, timing)
+        if self.slow_ms and total * 1000 >= self.slow_ms:
+            self._log_slow(request, response, total, timing)
+        return response
+
+    def _header_allowed(self, request) -> bool:
+        if self.header_enabled:
+            return True
+        user = getattr(request, "user", None)
+        return bool(user is not None and getattr(user, "is_staff", False))
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timing = getattr(request, "request_timing", None)
+        if timing is not None:
+            timing.view_started = time.perf_counter()
+        return None
+
+    def process_template_response(self, request, response):
+        # DRF Response / TemplateResponse: 이 직후 handler 가 response.render() 호출
+        timing = getattr(request, "request_timing", None)
+        if timing is not None:
+            timing.end_view()
+            timing.render_started = time.perf_counter()
+            response.add_post_render_callback(
+                lambda rendered: self._end_render(timing)
+            )
+        return response
+
+    @staticmethod
+    def _end_render(timing):
+        timing.render = time.perf_counter() - timing.render_started
+
+    def _header(self, total, timing) -> str:
+        parts = [
+            f"total;dur={_ms(total)}",
+            f'db;dur={_ms(timing.db)};desc="{timing.queries} queries"',
+        ]
+        if timing.view is not None:
+            parts.append(f"view;dur={_ms(timing.view)}")
+        if timing.serialize:
+            parts.append(f"serialize;dur={_ms(timing.serialize)}")
+        if timing.render is not None:
+            parts.append(f"render;dur={_ms(timing.render)}")
+        return ", ".join(parts)
+
+    def _log_slow(self, request, response, total, timing):
+        resolver_match = getattr(request, "resolver_match", None)
+        fields = {
+            "method": request.method,
+            "path": request.path,
+            "route": getattr(resolver_match, "view_name", None),
+            "status": response.status_code,
+            "user_id": getattr(getattr(request, "user", None), "id", None),
+            "total_ms": _ms(total),
+        }
+        if timing is not None:
+            fields.update(
+                {
+                    "queries": timing.queries,
+                    "db_ms": _ms(timing.db),
+                    "view_ms": _ms(timing.view) if timing.view is not None else None,
+                    "serialize_ms": _ms(timing.serialize),
+                    "render_ms": (
+                        _ms(timing.render) if timing.render is not None else None
+                    ),
+                }
+            )
+        logger.warning(
+            "Slow request "
+            + " ".join(f"{key}={value}" for key, value in fields.items()),
+            extra={"request_timing": fields},
+        )
@@ -0,0 +1,251 @@
+"""
+Keyset(cursor) pagination (REST_FRAMEWORK DEFAULT_PAGINATION_CLASS).
+
+- queryset 의 order_by (없으면 Meta.ordering) 뒤에 pk 를 붙여 (created_at, id) 같은 유일한 정렬 키를 만들고
+  "마지막 행 다음" 조건(WHERE created_at < %s OR (created_at = %s AND id < %s))으로 다음 페이지 조회
+  → OFFSET 이 없으므로 N 번째 페이지도 첫 페이지와 같은 비용 (정렬 키와 같은 복합 인덱스 필요)
+- cursor 는 정렬 키 값 + 방향을 base64(JSON) 로 감싼 불투명 문자열 (?cursor=...)
+- page_size: REST_FRAMEWORK["PAGE_SIZE"] (API_PAGE_SIZE), ?page_size= 로 API_MAX_PAGE_SIZE 까지 조정
+- annotate 된 정렬 키는 NULL 가능으로 취급 → 항상 NOT NULL 이면 view 의 keyset_not_null 에 선언
+  (e.g. keyset_not_null = ("distance_km",)) → IS NULL 분기 없이 범위 조건만 사용
+
+응답: {"next": url | null, "previous": url | null, "results": [...]}
+"""
+from __future__ import annotations
+
+import base64
+import datetime
+import decimal
+import json
+from functools import reduce
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    cursor_query_param = "cursor"
+    not_null_keys: frozenset[str] = frozenset()
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor. 잘못된 cursor 값입니다."
+
+    def get_page_size(self, request) -> int:
+        default = settings.REST_FRAMEWORK.get("PAGE_SIZE") or 50
+        max_page_size = getattr(settings, "API_MAX_PAGE_SIZE", 200)
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return default
+        if page_size <= 0:
+            return default
+        return min(page_size, max_page_size)
+
+    # ------------------------------------------------------------------
+    # 정렬 키
+    # ------------------------------------------------------------------
+    def get_ordering(self, queryset) -> list[tuple[str, bool]]:
+        """[(field, descending), ...] — 마지막은 항상 pk."""
+        order_by = list(queryset.query.order_by) or list(
+            queryset.model._meta.ordering or []
+        )
+        ordering: list[tuple[str, bool]] = []
+        for item in order_by:
+            if not isinstance(item, str):
+                raise TypeError(
+                    "KeysetCursorPagination supports only field-name ordering"
+                )
+            name = item.lstrip("-")
+            name = queryset.model._meta.pk.name if name == "pk" else name
+            ordering.append((name, item.startswith("-")))
+
+        pk_name = queryset.model._meta.pk.name
+        if not any(name == pk_name for name, _ in ordering):
+            descending = ordering[-1][1] if ordering else True
+            ordering.append((pk_name, descending))
+        # pk 이후의 정렬 키는 의미가 없으므로 잘라냄
+        pk_index = next(i for i, (name, _) in enumerate(ordering) if name == pk_name)
+        return ordering[: pk_index + 1]
+
+    def _model_field(self, queryset, name):
+        model = queryset.model
+        field = None
+        for part in name.split("__"):
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return None  # annotate 된 값 (e.g. distance_km)
+            model = getattr(field, "related_model", None) or model
+        return field
+
+    def _nullable(self, queryset, name) -> bool:
+        field = self._model_field(queryset, name)
+        if field is None:
+            return name not in self.not_null_keys
+        return field.null
+
+    def _order_expressions(self, queryset, ordering, reverse: bool):
+        expressions = []
+        for name, descending in ordering:
+            descending = descending != reverse
+            nullable = self._nullable(queryset, name)
+            kwargs = {}
+            if nullable:
+                # NULL 위치를 DB 와 무관하게 고정 (정방향 기준 NULL 은 항상 맨 뒤)
+                kwargs = {"nulls_first": True} if reverse else {"nulls_last": True}
+            expressions.append(
+                F(name).desc(**kwargs) if descending else F(name).asc(**kwargs)
+            )
+        return expressions
+
+    def _after(self, queryset, ordering, values, reverse: bool) -> Q:
+        """정렬 순서상 values 행 '다음' 행 조건 (reverse 면 '이전')."""
+        clauses = []
+        equal = Q()
+        for (name, descending), value in zip(ordering, values):
+            nullable = self._nullable(queryset, name)
+            lookup = "lt" if descending != reverse else "gt"
+            if value is None:
+                # NULL 은 맨 뒤: 정방향이면 NULL 이후 행 없음, 역방향이면 모든 non-null 이 앞
+                strictly = Q(**{f"{name}__isnull": False}) if reverse else None
+                same = Q(**{f"{name}__isnull": True})
+            else:
+                strictly = Q(**{f"{name}__{lookup}": value})
+                if nullable and not reverse:
+                    strictly |= Q(**{f"{name}__isnull": True})
+                same = Q(**{name: value})
+            if strictly is not None:
+                clauses.append(equal & strictly)
+            equal &= same
+        condition = reduce(lambda a, b: a | b, clauses) if clauses else Q(pk__in=[])
+
+        # 첫 정렬 키가 NOT NULL 이면 범위 조건을 앞에 붙여 인덱스 range scan 을 유도
+        first_name, first_desc = ordering[0]
+        if not self._nullable(queryset, first_name) and values[0] is not None:
+            bound = "lte" if first_desc != reverse else "gte"
+            condition = Q(**{f"{first_name}__{bound}": values[0]}) & condition
+        return condition
+
+    # ------------------------------------------------------------------
+    # cursor 인코딩
+    # ------------------------------------------------------------------
+    def encode_cursor(self, values, reverse: bool) -> str:
+        def _json(value):
+            if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+                return value.isoformat()
+            if isinstance(value, (decimal.Decimal, datetime.timedelta)):
+                return str(value)
+            return value
+
+        payload = json.dumps(
+            {"v": [_json(v) for v in values], "r": int(reverse)},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, queryset, ordering, encoded: str):
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            raw_values, reverse = payload["v"], bool(payload.get("r"))
+            if len(raw_values) != len(ordering):
+                raise ValueError
+            values = []
+            for (name, _), raw in zip(ordering, raw_values):
+                field = self._model_field(queryset, name)
+                if raw is not None and field is not None:
+                    raw = field.to_python(raw)
+                values.append(raw)
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def _values_of(self, obj, ordering):
+        values = []
+        for name, _ in ordering:
+            value = obj
+            for part in name.split("__"):
+                value = getattr(value, part, None) if value is not None else None
+            if hasattr(value, "pk") and not isinstance(value, (str, int)):
+                value = value.pk
+            values.append(value)
+        return values
+
+    # ------------------------------------------------------------------
+    # BasePagination
+    # ------------------------------------------------------------------
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.not_null_keys = frozenset(getattr(view, "keyset_not_null", ()))
+        ordering = self.get_ordering(queryset)
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        reverse = False
+        if encoded:
+            values, reverse = self.decode_cursor(queryset, ordering, encoded)
+            queryset = queryset.filter(self._after(queryset, ordering, values, reverse))
+
+        rows = list(
+            queryset.order_by(*self._order_expressions(queryset, ordering, reverse))[
+                : self.page_size + 1
+            ]
+        )
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # 정방향: 더 있으면 next, cursor 로 들어왔으면 previous
+        # 역방향(previous 로 이동): 더 있으면 previous, next 는 항상 존재
+        has_next = has_more if not reverse else True
+        has_previous = bool(encoded) if not reverse else has_more
+
+        self.next_cursor = (
+            self.encode_cursor(self._values_of(rows[-1], ordering), False)
+            if rows and has_next
+            else None
+        )
+        self.previous_cursor = (
+            self.encode_cursor(self._values_of(rows[0], ordering), True)
+            if rows and has_previous
+            else None
+        )
+        return rows
+
+    def _link(self, cursor):
+        if cursor is None:
+            return None
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        return self._link(self.next_cursor)
+
+    def get_previous_link(self):
+        return self._link(self.previous_cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
@@ -1,4 +1,14 @@
+import hashlib
+import os
+import posixpath
+
 from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import File
+from django.core.files.storage import FileSystemStorage
+from django.core.files.utils import validate_file_name
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from storages.backends.s3boto3 import S3Boto3Storage
 
 
@@ -15,3 +25,113 @@ class PublicMediaStorage(S3Boto3Storage):
 
     # https://<bucket>.s3.<region>.amazonaws.com 형식
     custom_domain = f"{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com"
+
+
+class ContentAddressedStorageMixin:
+    """
+    파일 이름을 내용의 SHA-256 으로 정하는 Storage mixin (중복 제거 + 참조 카운트).
+
+    - save(): <upload_to 디렉터리>/<sha256><확장자> 로 저장.
+      같은 내용이 이미 있으면 업로드하지 않고 mediafiles.StoredObject.ref_count + 1
+      field 의 max_length 를 넘으면 hash 뒤쪽을 잘라서 맞춤 (항상 같은 길이 → 같은 내용이면 같은 이름,
+      hash 가 min_hash_length 보다 짧아져야 하면 SuspiciousFileOperation)
+    - delete(): ref_count - 1, 마지막 참조일 때만 실제 객체 삭제
+      (StoredObject 가 없는 기존 파일/직접 업로드 파일은 바로 삭제)
+    → 같은 파일을 다시 제출해도 버킷 쓰기 0회
+    """
+
+    hash_chunk_size = 64 * 1024
+    # max_length 에 맞춰 자를 때 남길 최소 hex 길이 (128bit)
+    min_hash_length = 32
+
+    def _content_hash(self, content) -> tuple[str, int]:
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in content.chunks(chunk_size=self.hash_chunk_size):
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            digest.update(chunk)
+            size += len(chunk)
+        content.seek(0)
+        return digest.hexdigest(), size
+
+    def _hashed_name(self, dirname, sha256, ext, max_length=None) -> str:
+        name = posixpath.join(dirname, f"{sha256}{ext}")
+        if max_length is None or len(name) <= max_length:
+            return name
+        keep = len(sha256) - (len(name) - max_length)
+        if keep < self.min_hash_length:
+            raise SuspiciousFileOperation(
+                f'Storage name "{name}" exceeds max_length={max_length}. '
+                "Please make sure that the corresponding file field "
+                'allows sufficient "max_length".'
+            )
+        return posixpath.join(dirname, f"{sha256[:keep]}{ext}")
+
+    def save(self, name, content, max_length=None):
+        from mediafiles.models import StoredObject
+
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        sha256, size = self._content_hash(content)
+        dirname, filename = posixpath.split(str(name).replace("\\", "/"))
+        ext = os.path.splitext(filename)[1].lower()
+        name = self._hashed_name(dirname, sha256, ext, max_length)
+        validate_file_name(name, allow_relative_path=True)
+
+        with transaction.atomic():
+            # 같은 이름 row 를 잠가서 동시에 도는 delete() 와 순서를 맞춤
+            stored = StoredObject.objects.select_for_update().filter(name=name).first()
+            if stored:
+                StoredObject.objects.filter(pk=stored.pk).update(
+                    ref_count=F("ref_count") + 1
+                )
+                return name
+
+            saved_name = self._save(name, content)
+            try:
+                with transaction.atomic():
+                    StoredObject.objects.create(
+                        name=saved_name, sha256=sha256, size=size, ref_count=1
+                    )
+            except IntegrityError:
+                # 다른 요청이 같은 내용을 먼저 등록 → 참조만 추가
+                StoredObject.objects.filter(name=saved_name).update(
+                    ref_count=F("ref_count") + 1
+                )
+        validate_file_name(saved_name, allow_relative_path=True)
+        return saved_name
+
+    def delete(self, name):
+        from mediafiles.models import StoredObject
+
+        if not name:
+            return
+        with transaction.atomic():
+            stored = StoredObject.objects.select_for_update().filter(name=name).first()
+            if stored and stored.ref_count > 1:
+                StoredObject.objects.filter(pk=stored.pk).update(
+                    ref_count=F("ref_count") - 1
+                )
+                return
+            if stored:
+                stored.delete()
+            super().delete(name)
+
+
+class ContentAddressedMediaStorage(ContentAddressedStorageMixin, PublicMediaStorage):
+    """PublicMediaStorage + SHA-256 이름 / 중복 제거 / 참조 카운트 삭제"""
+
+    # 같은 이름 = 같은 내용이므로 덮어써도 무방 (get_available_name 이 이름을 바꾸지 않도록)
+    file_overwrite = True
+
+
+class ContentAddressedFileSystemStorage(ContentAddressedStorageMixin, FileSystemStorage):
+    """로컬 개발용 (media 폴더)"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(*args, **kwargs)
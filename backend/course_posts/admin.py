@@ -13,3 +13,10 @@ class CourseApplicationAdmin(admin.ModelAdmin):
         "teacher__korean_name",
         "dispatch_request__course_title",
     )
+    list_select_related = (
+        "dispatch_request__culture_center__center",
+        "dispatch_request__culture_center__region",
+        "teacher",
+    )
+    # 파견 요청 / 강사는 수만 건 → select 대신 id 입력 위젯
+    raw_id_fields = ("dispatch_request", "teacher")
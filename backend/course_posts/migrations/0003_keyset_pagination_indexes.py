@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-17 04:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("course_posts", "0002_remove_coursepost_created_by_and_more"),
+        ("dispatch_requests", "0009_keyset_pagination_indexes"),
+        ("teacher_applications", "0011_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="courseapplication",
+            index=models.Index(
+                fields=["dispatch_request", "created_at", "id"],
+                name="ca_dispatch_created_idx",
+            ),
+        ),
+    ]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 
+from config.cache import invalidate_tags
 from dispatch_requests.models import DispatchRequest, DispatchRequestStatusChoices
 from teacher_applications.models import TeacherApplication
 
@@ -15,6 +19,27 @@ class CourseApplicationStatusChoices(models.TextChoices):
     SELECTED = "SELECTED", "Selected"
 
 
+def counts_as_application(status: str) -> bool:
+    """DispatchRequest.applications_count 에 포함되는 상태인지 (WITHDRAWN 제외)"""
+    return status != CourseApplicationStatusChoices.WITHDRAWN
+
+
+def counted_applications_q(prefix: str = "") -> Q:
+    """applications_count 집계 조건 (reconcile / 집계 쿼리용)"""
+    return ~Q(**{f"{prefix}status": CourseApplicationStatusChoices.WITHDRAWN})
+
+
+def adjust_applications_count(dispatch_request_id, delta: int):
+    """공고 지원자 수를 원자적으로 증감 (F() UPDATE, 메모리 값 사용 안 함)"""
+    if not delta or not dispatch_request_id:
+        return
+    DispatchRequest.objects.filter(pk=dispatch_request_id).update(
+        applications_count=F("applications_count") + delta
+    )
+    # UPDATE 는 save signal 이 없으므로 공고 cache 를 직접 무효화
+    transaction.on_commit(lambda: invalidate_tags("dispatch_requests"))
+
+
 class CourseApplication(models.Model):
     """
     강사 지원서
@@ -56,6 +81,11 @@ class CourseApplication(models.Model):
             models.Index(fields=["dispatch_request"]),
             models.Index(fields=["teacher"]),
             models.Index(fields=["status"]),
+            # keyset pagination (공고별 지원자 목록: created_at, id)
+            models.Index(
+                fields=["dispatch_request", "created_at", "id"],
+                name="ca_dispatch_created_idx",
+            ),
         ]
 
     def __str__(self):
@@ -86,3 +116,34 @@ class CourseApplication(models.Model):
         ]:
             raise ValidationError("현재 상태에서는 지원 취소가 불가능합니다.")
         self.status = CourseApplicationStatusChoices.WITHDRAWN
+
+    def save(self, *args, **kwargs):
+        """
+        저장 전후 상태로 DispatchRequest.applications_count 증감
+        - 생성(APPLIED) +1 / 취소(WITHDRAWN) -1 / 재지원(WITHDRAWN → APPLIED) +1
+        """
+        with transaction.atomic():
+            was_counted = False
+            if self.pk and not self._state.adding:
+                # 동시에 상태를 바꾸는 요청과 이중 증감하지 않도록 row 잠금 후 이전 상태 조회
+                old_status = (
+                    CourseApplication.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list("status", flat=True)
+                    .first()
+                )
+                was_counted = old_status is not None and counts_as_application(
+                    old_status
+                )
+            super().save(*args, **kwargs)
+            adjust_applications_count(
+                self.dispatch_request_id,
+                int(counts_as_application(self.status)) - int(was_counted),
+            )
+
+
+@receiver(post_delete, sender=CourseApplication)
+def decrement_applications_count(sender, instance, **kwargs):
+    """지원서 삭제(공고/강사 CASCADE 포함) 시 지원자 수 감소"""
+    if counts_as_application(instance.status):
+        adjust_applications_count(instance.dispatch_request_id, -1)
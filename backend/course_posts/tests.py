@@ -1,3 +1,129 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from culture_centers.models import Center, CultureCenter, Region
+from dispatch_requests.models import DispatchRequest, DispatchRequestStatusChoices
+from dispatch_requests.tests import make_teacher, next_monday
+
+from .models import CourseApplication, CourseApplicationStatusChoices
+
+
+class ApplicationsCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        admin = User.objects.create_user(
+            email="admin@example.com", password="pw", role="admin"
+        )
+        cls.dispatch_request = DispatchRequest.objects.create(
+            requester=admin,
+            culture_center=CultureCenter.objects.create(
+                center=Center.objects.create(name="C"),
+                region=Region.objects.create(name="R"),
+                branch_name="B",
+                address_detail="-",
+                latitude=Decimal("37.5"),
+                longitude=Decimal("127.0"),
+            ),
+            teaching_language="English",
+            course_title="Course",
+            class_days=["MON"],
+            start_date=next_monday(),
+            applicant_name="a",
+            applicant_phone="1",
+            applicant_email="a@example.com",
+            status=DispatchRequestStatusChoices.OPEN,
+        )
+        cls.teachers = [make_teacher(i) for i in range(3)]
+
+    def assertCount(self, expected):
+        self.dispatch_request.refresh_from_db(fields=["applications_count"])
+        self.assertEqual(self.dispatch_request.applications_count, expected)
+
+    def _client(self, teacher):
+        client = APIClient()
+        client.force_authenticate(teacher.user)
+        return client
+
+    def _apply(self, teacher):
+        return CourseApplication.objects.create(
+            dispatch_request=self.dispatch_request, teacher=teacher
+        )
+
+    def test_apply_withdraw_and_reapply_through_api(self):
+        client = self._client(self.teachers[0])
+        url = f"/api/dispatch-requests/{self.dispatch_request.pk}"
+
+        self.assertEqual(client.post(f"{url}/apply/").status_code, 201)
+        self.assertCount(1)
+        self.assertEqual(client.post(f"{url}/apply/").status_code, 400)
+        self.assertCount(1)
+
+        self.assertEqual(client.post(f"{url}/withdraw/").status_code, 200)
+        self.assertCount(0)
+
+        self.assertEqual(client.post(f"{url}/apply/").status_code, 201)
+        self.assertCount(1)
+
+    def test_status_changes_between_counted_states_keep_count(self):
+        app = self._apply(self.teachers[0])
+        self._apply(self.teachers[1])
+        self.assertCount(2)
+
+        for status in (
+            CourseApplicationStatusChoices.SHORTLISTED,
+            CourseApplicationStatusChoices.REJECTED,
+        ):
+            app.status = status
+            app.save()
+            self.assertCount(2)
+
+    def test_stale_instances_do_not_double_decrement(self):
+        app = self._apply(self.teachers[0])
+        self._apply(self.teachers[1])
+        stale = CourseApplication.objects.get(pk=app.pk)
+
+        app.withdraw()
+        app.save()
+        # 이미 WITHDRAWN 이 된 row 를 예전 값(APPLIED)을 가진 인스턴스로 다시 취소
+        stale.status = CourseApplicationStatusChoices.WITHDRAWN
+        stale.save()
+
+        self.assertCount(1)
+
+    def test_delete_decrements_only_counted_applications(self):
+        counted = self._apply(self.teachers[0])
+        withdrawn = self._apply(self.teachers[1])
+        withdrawn.withdraw()
+        withdrawn.save()
+        self.assertCount(1)
+
+        withdrawn.delete()
+        self.assertCount(1)
+        counted.delete()
+        self.assertCount(0)
+
+    def test_cascade_delete_of_teacher_decrements(self):
+        self._apply(self.teachers[0])
+        self._apply(self.teachers[1])
+
+        self.teachers[0].delete()
+
+        self.assertCount(1)
+
+    def test_counter_matches_reconcile(self):
+        self._apply(self.teachers[0])
+        app = self._apply(self.teachers[1])
+        app.withdraw()
+        app.save()
+        self._apply(self.teachers[2]).delete()
+
+        out = StringIO()
+        call_command("reconcile_applications_count", "--dry-run", stdout=out)
 
-# Create your tests here.
+        self.assertCount(1)
+        self.assertIn("mismatched=0", out.getvalue())
@@ -1,10 +1,13 @@
 from django.contrib import admin
 
+from config.db_router import ReplicaChangelistMixin
+from culture_centers.models import CultureCenter
+
 from .models import Course
 
 
 @admin.register(Course)
-class CourseAdmin(admin.ModelAdmin):
+class CourseAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
     list_display = (
         "id",
         "status",
@@ -18,3 +21,11 @@ class CourseAdmin(admin.ModelAdmin):
     )
     list_filter = ("status", "teaching_language")
     search_fields = ("course_title", "culture_center__branch_name")
+    list_select_related = ("culture_center__center", "culture_center__region", "teacher")
+    # 파견 요청 / 강사는 수만 건 → select 대신 id 입력 위젯
+    raw_id_fields = ("source_dispatch_request", "teacher")
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == "culture_center":
+            kwargs["queryset"] = CultureCenter.objects.select_related("center", "region")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
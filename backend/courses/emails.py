@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage
 
 from course_posts.models import CourseApplication, CourseApplicationStatusChoices
 from dispatch_requests.models import DispatchRequest
+from notifications.outbox import enqueue_email, enqueue_messages
 
 
 def _teacher_email(application: CourseApplication):
@@ -35,20 +36,10 @@ def send_course_confirmed_email(application: CourseApplication, dr: DispatchRequ
 Friending Team
 """.strip()
 
-    send_mail(
-        subject=subject,
-        message=body,
-        from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-        recipient_list=[email],
-        fail_silently=True,
-    )
+    enqueue_email(subject, body, [email])
 
 
-def send_course_rejected_email(application: CourseApplication, dr: DispatchRequest) -> None:
-    email = _teacher_email(application)
-    if not email:
-        return
-
+def _build_rejected_email(dr: DispatchRequest) -> tuple[str, str]:
     subject = f"[Friending] 지원 결과 안내: {dr.course_title}"
     body = f"""안녕하세요.
 
@@ -58,18 +49,20 @@ def send_course_rejected_email(application: CourseApplication, dr: DispatchReque
 감사합니다.
 Friending Team
 """.strip()
+    return subject, body
 
-    send_mail(
-        subject=subject,
-        message=body,
-        from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-        recipient_list=[email],
-        fail_silently=True,
-    )
+
+def send_course_rejected_email(application: CourseApplication, dr: DispatchRequest) -> None:
+    email = _teacher_email(application)
+    if not email:
+        return
+
+    subject, body = _build_rejected_email(dr)
+    enqueue_email(subject, body, [email])
 
 
 def notify_confirmation_results(dr: DispatchRequest, selected_app: CourseApplication) -> None:
-    """선정자에 축하 메일, 그 외 APPLIED/SHORTLISTED 지원자에 결과 메일 발송."""
+    """선정자에 축하 메일, 그 외 APPLIED/SHORTLISTED 지원자에 결과 메일을 outbox 에 적재."""
     send_course_confirmed_email(selected_app, dr)
 
     other_apps = CourseApplication.objects.filter(
@@ -80,5 +73,10 @@ def notify_confirmation_results(dr: DispatchRequest, selected_app: CourseApplica
         ],
     ).exclude(pk=selected_app.pk).select_related("teacher")
 
-    for app in other_apps:
-        send_course_rejected_email(app, dr)
+    # 결과 메일은 내용이 같으므로 한 번 만들어서 지원자별 메시지로 일괄 적재
+    subject, body = _build_rejected_email(dr)
+    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None)
+    enqueue_messages(
+        EmailMessage(subject=subject, body=body, from_email=from_email, to=[email])
+        for email in sorted({_teacher_email(app) for app in other_apps} - {None})
+    )
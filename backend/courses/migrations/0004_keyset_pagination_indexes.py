@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-17 04:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0003_remove_course_source_post_and_more"),
+        ("culture_centers", "0006_culturecenter_geo_cell"),
+        ("dispatch_requests", "0009_keyset_pagination_indexes"),
+        ("teacher_applications", "0011_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(fields=["created_at", "id"], name="course_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(
+                fields=["teacher", "created_at", "id"],
+                name="course_teacher_created_idx",
+            ),
+        ),
+    ]
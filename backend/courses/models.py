@@ -95,6 +95,11 @@ class Course(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["culture_center"]),
             models.Index(fields=["start_date"]),
+            # keyset pagination (created_at, id)
+            models.Index(fields=["created_at", "id"], name="course_created_idx"),
+            models.Index(
+                fields=["teacher", "created_at", "id"], name="course_teacher_created_idx"
+            ),
         ]
 
     def __str__(self) -> str:
@@ -7,6 +7,7 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from config.db_router import ReplicaReadMixin
 from course_posts.models import CourseApplication, CourseApplicationStatusChoices
 from dispatch_requests.models import DispatchRequest
 from teacher_applications.models import TeacherApplication
@@ -26,7 +27,7 @@ def _get_my_teacher_application_or_error(user) -> TeacherApplication:
         )
 
 
-class CourseMyListView(generics.ListAPIView):
+class CourseMyListView(ReplicaReadMixin, generics.ListAPIView):
     """GET /api/courses/my/"""
 
     permission_classes = [permissions.IsAuthenticated, IsTeacher]
@@ -36,20 +37,26 @@ class CourseMyListView(generics.ListAPIView):
         teacher = _get_my_teacher_application_or_error(self.request.user)
         return (
             Course.objects.select_related(
-                "culture_center", "teacher", "source_dispatch_request"
+                "culture_center__center",
+                "culture_center__region",
+                "teacher",
+                "source_dispatch_request",
             )
             .filter(teacher=teacher)
             .order_by("-created_at")
         )
 
 
-class CourseAdminListView(generics.ListAPIView):
+class CourseAdminListView(ReplicaReadMixin, generics.ListAPIView):
     """GET /api/courses/admin/list/"""
 
     permission_classes = [permissions.IsAuthenticated, IsAdminOrManager]
     serializer_class = CourseSerializer
     queryset = Course.objects.select_related(
-        "culture_center", "teacher", "source_dispatch_request"
+        "culture_center__center",
+        "culture_center__region",
+        "teacher",
+        "source_dispatch_request",
     ).order_by("-created_at")
 
 
@@ -59,7 +66,10 @@ class CourseAdminDetailView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsAdminOrManager]
     serializer_class = CourseSerializer
     queryset = Course.objects.select_related(
-        "culture_center", "teacher", "source_dispatch_request"
+        "culture_center__center",
+        "culture_center__region",
+        "teacher",
+        "source_dispatch_request",
     )
 
 
@@ -127,7 +137,8 @@ class CourseConfirmFromDispatchView(APIView):
             dr.close()
             dr.save()
 
-        transaction.on_commit(lambda: notify_confirmation_results(dr, selected))
+            # 강좌 확정과 같은 트랜잭션에서 결과 메일을 outbox 에 적재
+            notify_confirmation_results(dr, selected)
 
         return Response(
             CourseSerializer(course, context={"request": request}).data,
@@ -1,6 +1,12 @@
 from django.contrib import admin
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
 from import_export.admin import ImportExportModelAdmin
 
+from config.db_router import ReplicaChangelistMixin
+from teacher_applications.models import TeacherApplication
+from teacher_applications.spatial_index import get_teacher_coordinates
+
 from .models import Region, Center, CultureCenter
 from .resources import CultureCenterUpsertResource, CultureCenterInsertOnlyResource
 
@@ -18,7 +24,7 @@ class CenterAdmin(admin.ModelAdmin):
 
 
 @admin.register(CultureCenter)
-class CultureCenterAdmin(ImportExportModelAdmin):
+class CultureCenterAdmin(ReplicaChangelistMixin, ImportExportModelAdmin):
     # ✅ 리소스 2개 등록: 관리자에서 선택 가능
     resource_classes = [CultureCenterUpsertResource, CultureCenterInsertOnlyResource]
 
@@ -32,3 +38,39 @@ class CultureCenterAdmin(ImportExportModelAdmin):
     )
     list_filter = ("center", "region")
     search_fields = ("center__name", "branch_name", "address_detail")
+    readonly_fields = ("nearest_accepted_teachers",)
+
+    NEAREST_TEACHERS_LIMIT = 10
+
+    def nearest_accepted_teachers(self, obj):
+        if not obj or obj.latitude is None or obj.longitude is None:
+            return "좌표 없음"
+
+        hits = get_teacher_coordinates().top_k(
+            float(obj.latitude), float(obj.longitude), self.NEAREST_TEACHERS_LIMIT
+        )
+        if not hits:
+            return "ACCEPTED 강사 없음"
+
+        teachers = TeacherApplication.objects.in_bulk([pk for pk, _ in hits])
+        return format_html(
+            "<ol>{}</ol>",
+            format_html_join(
+                "",
+                '<li><a href="{}">{}</a> — {} km</li>',
+                (
+                    (
+                        reverse(
+                            "admin:teacher_applications_teacherapplication_change",
+                            args=[pk],
+                        ),
+                        teachers[pk],
+                        f"{distance:.1f}",
+                    )
+                    for pk, distance in hits
+                    if pk in teachers
+                ),
+            ),
+        )
+
+    nearest_accepted_teachers.short_description = "가까운 ACCEPTED 강사 (Top 10)"
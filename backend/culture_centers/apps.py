@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class CultureCentersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "culture_centers"
+
+    def ready(self):
+        from config.cache import invalidate_on_change
+
+        # 지점 카탈로그 import signal 등록
+        from . import catalog  # noqa: F401
+        from .models import Center, CultureCenter, Region
+
+        # 지점 / 센터 / 지역이 바뀌면 "culture_centers" tag cache 무효화
+        for model in (CultureCenter, Center, Region):
+            invalidate_on_change(model, catalog.CATALOG_TAG)
@@ -0,0 +1,84 @@
+# backend/culture_centers/catalog.py
+"""
+지점 선택 dropdown 용 지점 카탈로그 캐시.
+
+- ETag 는 DB 에서 바로 계산한 카탈로그 version (CultureCenter / Center / Region 의 row 수 +
+  최종 updated_at) → cache 상태와 무관하게 같은 DB 를 보는 worker 는 항상 같은 ETag
+  · If-None-Match 가 같으면 version 조회(aggregate 3번)만으로 304
+- 전체 지점 목록을 직렬화한 JSON bytes 는 version 별 key 로 cache 에 저장
+  → 데이터가 바뀌면 version 이 바뀌어 key 자체가 달라지므로, invalidate 가 닿지 않는
+    worker(locmem cache)도 예전 목록을 응답하지 않음 (BRANCH_CATALOG_CACHE_SECONDS 는 메모리 상한용)
+- "culture_centers" tag 도 함께 사용 (config/cache.py), 변경 시 tag invalidate 로 예전 version 정리
+  · CultureCenter / Center / Region 저장·삭제 (apps.py invalidate_on_change, 커밋 이후)
+  · django-import-export 엑셀 import 완료 (post_import)
+"""
+from __future__ import annotations
+
+import hashlib
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max
+from django.dispatch import receiver
+from import_export.signals import post_import
+from rest_framework.renderers import JSONRenderer
+
+from config.cache import cached_value, invalidate_tags
+
+from .models import Center, CultureCenter, Region
+
+CATALOG_TAG = "culture_centers"
+_CATALOG_KEY = "culture_centers:branch_catalog"
+# 직렬화 형식(CultureCenterBranchSerializer)이 바뀌면 올려서 예전 ETag / cache 를 무효화
+_FORMAT_VERSION = "1"
+
+
+def branch_queryset():
+    return CultureCenter.objects.select_related("center", "region").order_by(
+        "center__name", "branch_name"
+    )
+
+
+def branch_catalog_version() -> str:
+    """
+    DB 기준 카탈로그 version
+    - 모델별 row 수 + 최종 updated_at (auto_now) → 추가 / 수정 / 삭제 시 바뀜
+    """
+    parts = [_FORMAT_VERSION]
+    for model in (CultureCenter, Center, Region):
+        stats = model.objects.aggregate(count=Count("pk"), updated=Max("updated_at"))
+        updated = stats["updated"].isoformat() if stats["updated"] else "-"
+        parts.append(f"{stats['count']}:{updated}")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+
+def branch_catalog_etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def render_branch_catalog() -> bytes:
+    """DB 조회 + 직렬화 → 응답 JSON bytes"""
+    from .serializers import CultureCenterBranchSerializer
+
+    data = CultureCenterBranchSerializer(branch_queryset(), many=True).data
+    return JSONRenderer().render(data)
+
+
+def get_branch_catalog(version: str) -> bytes:
+    """version 의 카탈로그 JSON bytes (cache 에 없으면 생성해서 저장)"""
+    return cached_value(
+        f"{_CATALOG_KEY}:{version}",
+        render_branch_catalog,
+        tags=(CATALOG_TAG,),
+        timeout=getattr(settings, "BRANCH_CATALOG_CACHE_SECONDS", 600),
+    )
+
+
+def invalidate_branch_catalog() -> None:
+    invalidate_tags(CATALOG_TAG)
+
+
+@receiver(post_import)
+def branch_catalog_imported(sender, model=None, **kwargs):
+    if model in (CultureCenter, Center, Region):
+        transaction.on_commit(invalidate_branch_catalog)
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("culture_centers", "0005_delete_culturecentermembership"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="culturecenter",
+            name="geo_cell",
+            field=models.BigIntegerField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                null=True,
+                verbose_name="공간 셀",
+            ),
+        ),
+    ]
@@ -3,6 +3,8 @@ from django.db import models
 # ✅ added
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from teacher_applications.geo_cells import cell_key_or_none
+
 
 class Region(models.Model):
     name = models.CharField("지역", max_length=50, unique=True)
@@ -86,6 +88,10 @@ class CultureCenter(models.Model):
         validators=[MinValueValidator(-180), MaxValueValidator(180)],
         help_text="e.g. 127.081270 (WGS84). Optional for now.",
     )
+    # 위경도에서 파생되는 공간 격자 셀 key (save 시 자동 계산, 반경 검색 cell IN 조회용)
+    geo_cell = models.BigIntegerField(
+        "공간 셀", blank=True, null=True, editable=False, db_index=True
+    )
 
     notes = models.CharField("비고", max_length=255, blank=True, null=True)
 
@@ -108,5 +114,12 @@ class CultureCenter(models.Model):
             )
         ]
 
+    def save(self, *args, **kwargs):
+        self.geo_cell = cell_key_or_none(self.latitude, self.longitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geo_cell"}
+        return super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         return f"{self.center.name} - {self.branch_name} ({self.region.name})"
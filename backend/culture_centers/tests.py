@@ -1,3 +1,101 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import User
+
+from .models import Center, CultureCenter, Region
+
+URL = "/api/culture-centers/branches/"
+
+
+@override_settings(API_CACHE_ENABLED=True)
+class BranchCatalogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="user@example.com", password="pw", role="teacher"
+        )
+        cls.center = Center.objects.create(name="C")
+        cls.region = Region.objects.create(name="R")
+        cls.branch = cls._branch("B1")
+
+    @classmethod
+    def _branch(cls, name):
+        return CultureCenter.objects.create(
+            center=cls.center,
+            region=cls.region,
+            branch_name=name,
+            address_detail="-",
+            latitude=Decimal("37.5"),
+            longitude=Decimal("127.0"),
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _get(self, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        return self.client.get(URL, headers=headers)
+
+    def _names(self, response):
+        return [row["branch_name"] for row in response.json()]
+
+    def test_matching_etag_is_not_modified(self):
+        first = self._get()
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(self._names(first), ["B1"])
+
+        second = self._get(first["ETag"])
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(self._get(f"W/{first['ETag']}").status_code, 304)
+
+    def test_not_modified_skips_catalog_query(self):
+        etag = self._get()["ETag"]
+        cache.clear()
+
+        # version aggregate 3번 (+ 인증) 외에 목록 조회 없음
+        with self.assertNumQueries(3):
+            self.assertEqual(self._get(etag).status_code, 304)
+
+    # TestCase 에서는 on_commit invalidate 가 실행되지 않음
+    # → signal 이 닿지 않은 다른 worker 의 cache 와 같은 상황
+    def test_update_changes_etag_without_invalidation(self):
+        etag = self._get()["ETag"]
+
+        self.branch.branch_name = "B1-renamed"
+        self.branch.save()
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self._names(response), ["B1-renamed"])
+
+    def test_related_name_change_changes_etag(self):
+        etag = self._get()["ETag"]
+
+        self.center.name = "C2"
+        self.center.save()
+        response = self._get(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["center_name"], "C2")
+
+    def test_create_and_delete_change_etag(self):
+        etag = self._get()["ETag"]
+
+        extra = self._branch("B2")
+        created = self._get(etag)
+        self.assertEqual(self._names(created), ["B1", "B2"])
+
+        extra.delete()
+        deleted = self._get(created["ETag"])
+        self.assertEqual(deleted.status_code, 200)
+        self.assertEqual(self._names(deleted), ["B1"])
@@ -1,16 +1,52 @@
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 from rest_framework import generics, permissions
-from .models import CultureCenter
+
+from .catalog import (
+    branch_catalog_etag,
+    branch_catalog_version,
+    branch_queryset,
+    get_branch_catalog,
+)
 from .serializers import CultureCenterBranchSerializer
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match 는 weak 비교 (W/ 접두어 무시)
+    candidates = parse_etags(if_none_match)
+    if "*" in candidates:
+        return True
+    return etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
 class CultureCenterBranchListView(generics.ListAPIView):
     """
     지점 선택 dropdown을 위한 지점 목록 API
     GET /api/culture-centers/branches/
+
+    전체 목록을 미리 직렬화한 JSON bytes 를 cache 에서 그대로 응답 (culture_centers/catalog.py)
+    ETag 는 DB 기준 카탈로그 version, If-None-Match 가 같으면 목록 없이 304 Not Modified
     """
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = CultureCenterBranchSerializer
-    queryset = CultureCenter.objects.select_related("center", "region").order_by(
-        "center__name", "branch_name"
-    )
+    # dropdown 에 전체 지점이 필요하므로 페이지네이션 없이 반환
+    pagination_class = None
+
+    def get_queryset(self):
+        return branch_queryset()
+
+    def list(self, request, *args, **kwargs):
+        version = branch_catalog_version()
+        etag = branch_catalog_etag(version)
+
+        if _etag_matches(request.META.get("HTTP_IF_NONE_MATCH", ""), etag):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                get_branch_catalog(version), content_type="application/json"
+            )
+        response["ETag"] = etag
+        # 로그인 사용자 전용 → 공유 cache 금지, 브라우저는 매번 ETag 로 재검증
+        response["Cache-Control"] = "private, no-cache"
+        return response
@@ -3,6 +3,9 @@ from datetime import time
 from django import forms
 from django.contrib import admin
 
+from config.db_router import ReplicaChangelistMixin
+from culture_centers.models import CultureCenter
+
 from .models import DAY_KEYS, DispatchRequest
 from teacher_applications.admin_widgets import WeeklyTimeTableWidget
 
@@ -104,6 +107,11 @@ class DispatchRequestAdminForm(forms.ModelForm):
             self.fields["teacher_name"].queryset = TeacherApplication.objects.filter(
                 status=ApplicationStatusChoices.ACCEPTED
             )
+        # 지점 option 라벨(__str__)이 center / region 을 읽으므로 함께 조회 (지점 수만큼 쿼리 방지)
+        if "culture_center" in self.fields:
+            self.fields["culture_center"].queryset = CultureCenter.objects.select_related(
+                "center", "region"
+            )
 
         obj = self.instance
         if obj and obj.pk:
@@ -160,7 +168,7 @@ class DispatchRequestAdminForm(forms.ModelForm):
 
 
 @admin.register(DispatchRequest)
-class DispatchRequestAdmin(admin.ModelAdmin):
+class DispatchRequestAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
     form = DispatchRequestAdminForm
 
     list_display = (
@@ -171,11 +179,14 @@ class DispatchRequestAdmin(admin.ModelAdmin):
         "teacher_name",
         "course_title",
         "status",
+        "applications_count",
         "created_at",
     )
     list_filter = ("status", "teaching_language", "culture_center__center__name")
     search_fields = ("course_title", "applicant_name", "applicant_email")
     readonly_fields = ("created_at", "updated_at", "requester")
+    # 강사 수만 명 → select 대신 id 입력 위젯 (limit_choices_to 로 ACCEPTED 만 선택)
+    raw_id_fields = ("teacher_name",)
 
     exclude = ("class_days", "start_time", "end_time")
 
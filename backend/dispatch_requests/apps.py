@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class DispatchRequestsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dispatch_requests"
+
+    def ready(self):
+        from config.cache import invalidate_on_change
+
+        from .models import DispatchRequest
+
+        invalidate_on_change(DispatchRequest, "dispatch_requests")
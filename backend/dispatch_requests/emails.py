@@ -1,17 +1,25 @@
 # backend/dispatch_requests/emails.py
 from __future__ import annotations
 
+from datetime import timedelta
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives, send_mail
+from django.core.mail import EmailMessage
+from django.db import transaction
+from django.db.models import Min
 from django.utils import timezone
 
 from django.contrib.auth.models import Group
 
-from teacher_applications.geo import teachers_within_radius
-from teacher_applications.models import ApplicationStatusChoices
+from notifications.outbox import enqueue_email, enqueue_messages
+from teacher_applications.geo import accepted_teachers_within_radius
 
-from .models import DispatchRequest
+from .models import (
+    DispatchOpenNotification,
+    DispatchRequest,
+    DispatchRequestStatusChoices,
+)
 
 
 DEFAULT_NOTIFY_RADIUS_KM = 15
@@ -107,7 +115,7 @@ def get_dispatch_request_recipients(dr: DispatchRequest) -> list[str]:
 
 
 def send_dispatch_request_received_email(dr: DispatchRequest) -> None:
-    """DB에 이미 저장된 DispatchRequest 기준으로 이메일 발송. (매니저/관리자용 접수 안내)"""
+    """DB에 이미 저장된 DispatchRequest 기준으로 이메일 outbox 적재. (매니저/관리자용 접수 안내)"""
     dr = DispatchRequest.objects.select_related(
         "culture_center__center",
         "culture_center__region",
@@ -120,15 +128,7 @@ def send_dispatch_request_received_email(dr: DispatchRequest) -> None:
 
     subject, body = build_dispatch_request_email_text(dr)
 
-    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None) or "no-reply@localhost"
-
-    msg = EmailMultiAlternatives(
-        subject=subject,
-        body=body,
-        from_email=from_email,
-        to=recipients,
-    )
-    msg.send(fail_silently=True)
+    enqueue_email(subject, body, recipients)
 
 
 def _build_teacher_open_email(dr: DispatchRequest) -> tuple[str, str]:
@@ -166,50 +166,146 @@ Friending Team
 
 def send_open_notification_to_matched_teachers(dr: DispatchRequest) -> dict:
     """
-    공고 게시 시 호출: 반경 + 언어 + ACCEPTED 강사 전원에 개별 발송.
+    공고 게시 시 호출: 반경 + 언어 + ACCEPTED 강사 전원에게 개별 메일을 outbox 에 적재.
     """
     cc = dr.culture_center
     if not cc or cc.latitude is None or cc.longitude is None:
-        return {"target_count": 0, "sent_count": 0, "failed_count": 0, "skipped_reason": "missing_center_geo"}
+        return {"target_count": 0, "queued_count": 0, "skipped_reason": "missing_center_geo"}
 
-    teachers = teachers_within_radius(
+    teachers = accepted_teachers_within_radius(
         center_lat=float(cc.latitude),
         center_lng=float(cc.longitude),
         radius_km=float(DEFAULT_NOTIFY_RADIUS_KM),
-    ).filter(
-        status=ApplicationStatusChoices.ACCEPTED,
-        teaching_languages=dr.teaching_language,
+        teaching_language=dr.teaching_language,
     )
 
+    if getattr(settings, "DISPATCH_NOTIFY_DIGEST_ENABLED", False):
+        # digest 모드: 매칭 쌍만 쌓고 send_dispatch_digests 가 강사별로 묶어서 발송
+        pairs = [
+            DispatchOpenNotification(teacher=teacher, dispatch_request=dr)
+            for teacher in teachers
+            if (getattr(teacher, "email", None) or "").strip()
+        ]
+        DispatchOpenNotification.objects.bulk_create(pairs, ignore_conflicts=True)
+        return {"target_count": len(pairs), "queued_count": len(pairs), "digest": True}
+
     subject, message = _build_teacher_open_email(dr)
     from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None)
 
+    # 수신자별 메시지를 먼저 모두 만든 뒤 한 번에 적재 (bulk INSERT)
+    messages = []
     seen = set()
-    target_count = 0
-    sent_count = 0
-    failed_count = 0
-
     for teacher in teachers:
         email = (getattr(teacher, "email", None) or "").strip()
         if not email or email in seen:
             continue
         seen.add(email)
+        messages.append(
+            EmailMessage(
+                subject=subject, body=message, from_email=from_email, to=[email]
+            )
+        )
+
+    enqueue_messages(messages)
+
+    return {"target_count": len(messages), "queued_count": len(messages)}
+
+
+def _build_teacher_digest_email(requests: list[DispatchRequest]) -> tuple[str, str]:
+    frontend_url = getattr(settings, "FRONTEND_URL", "").rstrip("/")
+
+    subject = f"[Friending] {len(requests)} New Teaching Opportunities Near You"
+    if len(requests) == 1:
+        subject = f"[Friending] New Teaching Opportunity: {requests[0].course_title} ({requests[0].teaching_language})"
+
+    items = "\n\n".join(
+        f"""{i}. {dr.course_title} ({dr.teaching_language})
+   - Culture Center: {dr.culture_center}
+   - Class Days: {", ".join(dr.class_days or [])}
+   - Time: {dr.start_time or ""} ~ {dr.end_time or ""}
+   - Start Date: {dr.start_date or ""}
+   - Apply: {frontend_url}/teacher/posts/{dr.id}"""
+        for i, dr in enumerate(requests, start=1)
+    )
+
+    message = f"""Hello,
+
+New teaching opportunities are available near you.
+
+{items}
 
-        target_count += 1
-        try:
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=from_email,
-                recipient_list=[email],
-                fail_silently=True,
+Best regards,
+Friending Team
+""".strip()
+
+    return subject, message
+
+
+def send_dispatch_digests(window_minutes: int | None = None) -> dict:
+    """
+    digest 대기열에서 가장 오래된 항목이 window_minutes 이상 지난 강사마다
+    대기 중인 공고를 모두 묶어서 1통을 outbox 에 적재하고, 처리한 row 는 삭제.
+    (이미 마감/취소된 공고는 메일에서 제외)
+    """
+    if window_minutes is None:
+        window_minutes = getattr(settings, "DISPATCH_NOTIFY_DIGEST_WINDOW_MINUTES", 10)
+    cutoff = timezone.now() - timedelta(minutes=window_minutes)
+
+    due_teacher_ids = list(
+        DispatchOpenNotification.objects.values("teacher_id")
+        .annotate(first_at=Min("created_at"))
+        .filter(first_at__lte=cutoff)
+        .values_list("teacher_id", flat=True)
+    )
+    if not due_teacher_ids:
+        return {"teacher_count": 0, "email_count": 0, "pair_count": 0}
+
+    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None)
+
+    with transaction.atomic():
+        # 동시에 돈 다른 실행이 잡은 row 는 건너뜀 (같은 쌍을 두 번 보내지 않음)
+        # of=("self",): select_related 로 JOIN 한 강사/공고 row 는 잠그지 않음
+        pending = list(
+            DispatchOpenNotification.objects.select_for_update(
+                skip_locked=True, of=("self",)
+            )
+            .filter(teacher_id__in=due_teacher_ids)
+            .select_related(
+                "teacher",
+                "dispatch_request__culture_center__center",
+                "dispatch_request__culture_center__region",
             )
-            sent_count += 1
-        except Exception:
-            failed_count += 1
+            .order_by("teacher_id", "created_at")
+        )
+
+        by_teacher: dict[int, list[DispatchOpenNotification]] = {}
+        for row in pending:
+            by_teacher.setdefault(row.teacher_id, []).append(row)
+
+        messages = []
+        for rows in by_teacher.values():
+            email = (rows[0].teacher.email or "").strip()
+            requests = [
+                row.dispatch_request
+                for row in rows
+                if row.dispatch_request.status == DispatchRequestStatusChoices.OPEN
+            ]
+            if not email or not requests:
+                continue
+            subject, message = _build_teacher_digest_email(requests)
+            messages.append(
+                EmailMessage(
+                    subject=subject, body=message, from_email=from_email, to=[email]
+                )
+            )
+
+        enqueue_messages(messages)
+        DispatchOpenNotification.objects.filter(
+            pk__in=[row.pk for row in pending]
+        ).delete()
 
     return {
-        "target_count": target_count,
-        "sent_count": sent_count,
-        "failed_count": failed_count,
+        "teacher_count": len(by_teacher),
+        "email_count": len(messages),
+        "pair_count": len(pending),
     }
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from config.cache import invalidate_tags
+from course_posts.models import CourseApplication, counted_applications_q
+from dispatch_requests.models import DispatchRequest
+
+
+def _counted_subquery():
+    return (
+        CourseApplication.objects.filter(dispatch_request=OuterRef("pk"))
+        .filter(counted_applications_q())
+        .order_by()
+        .values("dispatch_request")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute DispatchRequest.applications_count (non-withdrawn course "
+        "applications) and fix rows where the denormalized counter drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Rows fixed per UPDATE",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the rows whose counter is wrong",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = max(1, options["chunk_size"])
+        mismatched = list(
+            DispatchRequest.objects.annotate(
+                actual=Coalesce(Subquery(_counted_subquery()), 0)
+            )
+            .exclude(applications_count=F("actual"))
+            .order_by("id")
+            .values_list("id", "applications_count", "actual")
+        )
+        for pk, stored, actual in mismatched:
+            self.stdout.write(f"id={pk}: applications_count {stored} -> {actual}")
+
+        fixed = 0
+        if not options["dry_run"]:
+            ids = [pk for pk, _, _ in mismatched]
+            for start in range(0, len(ids), chunk_size):
+                # 조회 이후 바뀐 값까지 반영되도록 UPDATE 안에서 다시 집계
+                fixed += DispatchRequest.objects.filter(
+                    id__in=ids[start : start + chunk_size]
+                ).update(applications_count=Coalesce(Subquery(_counted_subquery()), 0))
+            if fixed:
+                invalidate_tags("dispatch_requests")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"mismatched={len(mismatched)} fixed={fixed}")
+        )
+
+
+# python manage.py reconcile_applications_count --dry-run
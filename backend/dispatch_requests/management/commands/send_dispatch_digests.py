@@ -0,0 +1,50 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from dispatch_requests.emails import send_dispatch_digests
+
+
+class Command(BaseCommand):
+    help = (
+        "Send one consolidated open-notice email per teacher from the "
+        "DispatchOpenNotification digest queue (DISPATCH_NOTIFY_DIGEST_ENABLED)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--window-minutes",
+            type=int,
+            default=getattr(settings, "DISPATCH_NOTIFY_DIGEST_WINDOW_MINUTES", 10),
+            help="Send a teacher's digest once their oldest queued item is this old",
+        )
+        parser.add_argument(
+            "--every",
+            type=int,
+            default=0,
+            help="Run repeatedly every N seconds (0 = run once and exit)",
+        )
+
+    def handle(self, *args, **options):
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        while not self._stopping:
+            stats = send_dispatch_digests(options["window_minutes"])
+            if stats["pair_count"] or not options["every"]:
+                self.stdout.write(
+                    f"teachers={stats['teacher_count']} emails={stats['email_count']} "
+                    f"pairs={stats['pair_count']}"
+                )
+            if not options["every"]:
+                break
+            time.sleep(options["every"])
+
+    def _stop(self, signum, frame):
+        self._stopping = True
+
+
+# python manage.py send_dispatch_digests --every 60
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dispatch_requests", "0007_dispatchrequest_application_deadline_and_more"),
+        ("teacher_applications", "0008_teacherapplication_geo_cell"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DispatchOpenNotification",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "dispatch_request",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_open_notifications",
+                        to="dispatch_requests.dispatchrequest",
+                        verbose_name="공고",
+                    ),
+                ),
+                (
+                    "teacher",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_open_notifications",
+                        to="teacher_applications.teacherapplication",
+                        verbose_name="강사",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "공고 알림 대기열",
+                "verbose_name_plural": "공고 알림 대기열",
+                "indexes": [
+                    models.Index(
+                        fields=["teacher", "created_at"],
+                        name="dispatch_re_teacher_86d26e_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("teacher", "dispatch_request"),
+                        name="uniq_open_notification_teacher_request",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-17 04:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("culture_centers", "0006_culturecenter_geo_cell"),
+        ("dispatch_requests", "0008_dispatchopennotification"),
+        ("teacher_applications", "0011_keyset_pagination_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dispatchrequest",
+            index=models.Index(fields=["created_at", "id"], name="dr_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="dispatchrequest",
+            index=models.Index(
+                fields=["status", "published_at", "id"], name="dr_status_published_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dispatchrequest",
+            index=models.Index(
+                fields=["requester", "created_at", "id"],
+                name="dr_requester_created_idx",
+            ),
+        ),
+    ]
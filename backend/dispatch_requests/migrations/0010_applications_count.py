@@ -0,0 +1,41 @@
+# Generated by Django 5.2.9 on 2026-10-17 04:03
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_applications_count(apps, schema_editor):
+    """기존 공고: WITHDRAWN 을 제외한 지원서 수로 초기화."""
+    DispatchRequest = apps.get_model("dispatch_requests", "DispatchRequest")
+    CourseApplication = apps.get_model("course_posts", "CourseApplication")
+    counts = (
+        CourseApplication.objects.filter(dispatch_request=OuterRef("pk"))
+        .filter(~Q(status="WITHDRAWN"))
+        .order_by()
+        .values("dispatch_request")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    DispatchRequest.objects.update(applications_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dispatch_requests", "0009_keyset_pagination_indexes"),
+        ("course_posts", "0003_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dispatchrequest",
+            name="applications_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="지원자 수"
+            ),
+        ),
+        migrations.RunPython(
+            backfill_applications_count, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -94,6 +94,12 @@ class DispatchRequest(models.Model):
         db_index=True,
     )
 
+    # 지원자 수 (WITHDRAWN 제외) — CourseApplication 생성/취소/삭제 시 F() 로 증감
+    # 어긋나면: python manage.py reconcile_applications_count
+    applications_count = models.PositiveIntegerField(
+        "지원자 수", default=0, editable=False
+    )
+
     created_at = models.DateTimeField("생성일", auto_now_add=True)
     updated_at = models.DateTimeField("수정일", auto_now=True)
 
@@ -105,10 +111,31 @@ class DispatchRequest(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["culture_center"]),
             models.Index(fields=["requester"]),
+            # keyset pagination: (created_at, id) / OPEN 공고 (published_at, id)
+            models.Index(fields=["created_at", "id"], name="dr_created_idx"),
+            models.Index(
+                fields=["status", "published_at", "id"], name="dr_status_published_idx"
+            ),
+            models.Index(
+                fields=["requester", "created_at", "id"], name="dr_requester_created_idx"
+            ),
         ]
 
     def save(self, *args, **kwargs):
         self.full_clean()
+        # 메모리에 있는 applications_count 는 오래된 값일 수 있으므로 전체 저장에서 제외
+        # (카운터는 course_posts 의 F() UPDATE 만 변경)
+        if (
+            self.pk
+            and not self._state.adding
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                f.name
+                for f in self._meta.concrete_fields
+                if not f.primary_key and f.name != "applications_count"
+            ]
         return super().save(*args, **kwargs)
 
     def _calculate_end_date_from_start_days_and_count(self):
@@ -219,3 +246,41 @@ class DispatchRequest(models.Model):
 
     def __str__(self) -> str:
         return f"[{self.status}] {self.course_title} / {self.teaching_language} @ {self.culture_center}"
+
+
+class DispatchOpenNotification(models.Model):
+    """
+    공고 게시 알림 digest 대기열: (강사, 공고) 매칭 쌍
+    - 게시 시점에는 row 만 쌓고, send_dispatch_digests 가 강사별로 묶어서 1통씩 발송
+    - 발송(또는 공고 마감으로 폐기)된 row 는 삭제
+    """
+
+    teacher = models.ForeignKey(
+        TeacherApplication,
+        on_delete=models.CASCADE,
+        related_name="pending_open_notifications",
+        verbose_name="강사",
+    )
+    dispatch_request = models.ForeignKey(
+        DispatchRequest,
+        on_delete=models.CASCADE,
+        related_name="pending_open_notifications",
+        verbose_name="공고",
+    )
+    created_at = models.DateTimeField("생성일", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "공고 알림 대기열"
+        verbose_name_plural = "공고 알림 대기열"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["teacher", "dispatch_request"],
+                name="uniq_open_notification_teacher_request",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["teacher", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.teacher_id} ← {self.dispatch_request_id}"
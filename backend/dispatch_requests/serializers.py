@@ -25,7 +25,6 @@ class DispatchRequestSerializer(serializers.ModelSerializer):
     )
 
     teacher_name_display = serializers.SerializerMethodField(read_only=True)
-    applications_count = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = DispatchRequest
@@ -78,11 +77,6 @@ class DispatchRequestSerializer(serializers.ModelSerializer):
         ta = getattr(obj, "teacher_name", None)
         return str(ta) if ta else None
 
-    def get_applications_count(self, obj: DispatchRequest) -> int:
-        if hasattr(obj, "_applications_count"):
-            return obj._applications_count
-        return obj.applications.count()
-
     def validate(self, attrs):
         start_time = attrs.get("start_time")
         end_time = attrs.get("end_time")
@@ -136,6 +130,37 @@ class DispatchRequestAdminSerializer(DispatchRequestSerializer):
         ]
 
 
+class DispatchRequestNearMeSerializer(DispatchRequestSerializer):
+    """강사용 — 내 위치 기준 OPEN 공고 (지점까지 거리 포함)"""
+
+    distance_km = serializers.FloatField(read_only=True)
+
+    class Meta(DispatchRequestSerializer.Meta):
+        fields = DispatchRequestSerializer.Meta.fields + ["distance_km"]
+
+
+class NearestTeacherSerializer(serializers.ModelSerializer):
+    """관리자용 — 파견 요청 지점 기준 가까운 ACCEPTED 강사"""
+
+    distance_km = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = TeacherApplication
+        fields = [
+            "id",
+            "first_name",
+            "last_name",
+            "korean_name",
+            "email",
+            "phone_number",
+            "teaching_languages",
+            "city",
+            "district",
+            "distance_km",
+        ]
+        read_only_fields = fields
+
+
 class ApplySerializer(serializers.Serializer):
     message = serializers.CharField(required=False, allow_blank=True, default="")
 
@@ -1,3 +1,345 @@
-from django.test import TestCase
+from datetime import date, timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from culture_centers.models import Center, CultureCenter, Region
+from notifications.models import EmailOutbox
+from teacher_applications.geo import teachers_within_radius
+from teacher_applications.models import TeacherApplication
+from teacher_applications.spatial_index import invalidate_teacher_spatial_index
+
+from .emails import send_dispatch_digests
+from .models import (
+    DispatchOpenNotification,
+    DispatchRequest,
+    DispatchRequestStatusChoices,
+)
+
+
+def next_monday():
+    day = date.today() + timedelta(days=1)
+    while day.weekday() != 0:
+        day += timedelta(days=1)
+    return day
+
+
+def make_teacher(i, **fields):
+    user = User.objects.create_user(
+        email=f"teacher{i}@example.com", password="pw", role="teacher"
+    )
+    fields = {
+        "latitude": Decimal("37.5"),
+        "longitude": Decimal("127.0"),
+        "teaching_languages": "English",
+        "status": "ACCEPTED",
+        **fields,
+    }
+    return TeacherApplication.objects.create(
+        user=user,
+        first_name="T",
+        last_name=str(i),
+        nationality="OTHER",
+        native_language="ENGLISH",
+        email=user.email,
+        phone_number="010-1111-2222",
+        address_line1="-",
+        city="-",
+        district="-",
+        visa_type="F-2",
+        self_introduction="-",
+        education_history="-",
+        experience_history="-",
+        **fields,
+    )
+
+
+def make_culture_center(name, latitude, longitude):
+    return CultureCenter.objects.create(
+        center=Center.objects.get_or_create(name="C")[0],
+        region=Region.objects.get_or_create(name="R")[0],
+        branch_name=name,
+        address_detail="-",
+        latitude=Decimal(str(latitude)),
+        longitude=Decimal(str(longitude)),
+    )
+
+
+def make_dispatch_request(requester, culture_center, **fields):
+    fields = {
+        "teaching_language": "English",
+        "course_title": "Course",
+        "status": DispatchRequestStatusChoices.OPEN,
+        **fields,
+    }
+    return DispatchRequest.objects.create(
+        requester=requester,
+        culture_center=culture_center,
+        class_days=["MON"],
+        start_date=next_monday(),
+        applicant_name="a",
+        applicant_phone="1",
+        applicant_email="a@example.com",
+        **fields,
+    )
+
+
+@override_settings(EMAIL_OUTBOX_ENABLED=True)
+class DispatchDigestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        admin = User.objects.create_user(
+            email="admin@example.com", password="pw", role="admin"
+        )
+        culture_center = CultureCenter.objects.create(
+            center=Center.objects.create(name="C"),
+            region=Region.objects.create(name="R"),
+            branch_name="B",
+            address_detail="-",
+            latitude=Decimal("37.5"),
+            longitude=Decimal("127.0"),
+        )
+        cls.requests = [
+            DispatchRequest.objects.create(
+                requester=admin,
+                culture_center=culture_center,
+                teaching_language="English",
+                course_title=f"Course {i}",
+                class_days=["MON"],
+                start_date=next_monday(),
+                applicant_name="a",
+                applicant_phone="1",
+                applicant_email="a@example.com",
+                status=DispatchRequestStatusChoices.OPEN,
+            )
+            for i in range(2)
+        ]
+        cls.teachers = [make_teacher(i) for i in range(2)]
+
+    def test_sends_one_digest_per_teacher_and_clears_queue(self):
+        for teacher in self.teachers:
+            for dispatch_request in self.requests:
+                DispatchOpenNotification.objects.create(
+                    teacher=teacher, dispatch_request=dispatch_request
+                )
+
+        result = send_dispatch_digests(window_minutes=0)
+
+        self.assertEqual(result["teacher_count"], 2)
+        self.assertEqual(result["email_count"], 2)
+        self.assertEqual(result["pair_count"], 4)
+        self.assertEqual(
+            sorted(row.to[0] for row in EmailOutbox.objects.all()),
+            ["teacher0@example.com", "teacher1@example.com"],
+        )
+        self.assertFalse(DispatchOpenNotification.objects.exists())
+
+    def test_waits_for_window(self):
+        DispatchOpenNotification.objects.create(
+            teacher=self.teachers[0], dispatch_request=self.requests[0]
+        )
+
+        result = send_dispatch_digests(window_minutes=10)
+
+        self.assertEqual(result["email_count"], 0)
+        self.assertTrue(DispatchOpenNotification.objects.exists())
+
+
+class NearestTeachersViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com", password="pw", role="admin"
+        )
+        cls.dispatch_request = make_dispatch_request(
+            cls.admin, make_culture_center("Seoul", 37.5665, 126.978)
+        )
+        coords = [
+            (37.57, 126.98),
+            (37.60, 127.05),
+            (37.45, 126.70),
+            (37.2636, 127.0286),  # 수원
+            (35.1796, 129.0756),  # 부산
+            (33.4996, 126.5312),  # 제주
+        ]
+        for i, (lat, lng) in enumerate(coords):
+            make_teacher(i, latitude=Decimal(str(lat)), longitude=Decimal(str(lng)))
+        # 언어 / 상태가 맞지 않는 가까운 강사
+        make_teacher(
+            10,
+            latitude=Decimal("37.5665"),
+            longitude=Decimal("126.978"),
+            teaching_languages="Japanese",
+        )
+        make_teacher(
+            11,
+            latitude=Decimal("37.5665"),
+            longitude=Decimal("126.978"),
+            status="PENDING",
+        )
+
+    def setUp(self):
+        cache.clear()
+        invalidate_teacher_spatial_index()
+        self.addCleanup(invalidate_teacher_spatial_index)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.url = (
+            f"/api/dispatch-requests/admin/{self.dispatch_request.pk}/nearest-teachers/"
+        )
+
+    def _orm_ids(self, k, max_radius_km=None):
+        cc = self.dispatch_request.culture_center
+        qs = teachers_within_radius(
+            center_lat=float(cc.latitude),
+            center_lng=float(cc.longitude),
+            radius_km=20037.5 if max_radius_km is None else max_radius_km,
+        ).filter(status="ACCEPTED", teaching_languages="English")
+        return list(qs.values_list("id", flat=True)[:k])
+
+    def test_matches_orm_distance_ordering(self):
+        for enabled in (True, False):
+            for k, max_radius_km in ((3, None), (10, None), (10, 30.0), (10, 0.5)):
+                params = {"k": k}
+                if max_radius_km is not None:
+                    params["max_radius_km"] = max_radius_km
+                with self.subTest(index=enabled, k=k, r=max_radius_km), self.settings(
+                    TEACHER_GEO_INDEX_ENABLED=enabled, API_CACHE_ENABLED=False
+                ):
+                    response = self.client.get(self.url, params)
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(
+                        [row["id"] for row in response.json()],
+                        self._orm_ids(k, max_radius_km),
+                    )
+                    distances = [row["distance_km"] for row in response.json()]
+                    self.assertEqual(distances, sorted(distances))
+
+    def test_invalid_max_radius_is_rejected(self):
+        for value in ("nan", "inf", "-inf", "-1", "abc"):
+            with self.subTest(value=value):
+                response = self.client.get(self.url, {"max_radius_km": value})
+                self.assertEqual(response.status_code, 400)
+
+    def test_requires_admin(self):
+        client = APIClient()
+        client.force_authenticate(TeacherApplication.objects.first().user)
+
+        self.assertEqual(client.get(self.url).status_code, 403)
+
+
+class OpenNearMeViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_teacher(0)
+        admin = User.objects.create_user(
+            email="admin@example.com", password="pw", role="admin"
+        )
+        centers = [
+            make_culture_center("Here", 37.5, 127.0),
+            make_culture_center("Near", 37.52, 127.01),
+            make_culture_center("Mid", 37.56, 126.95),
+        ]
+        published_at = timezone.now()
+        cls.open_ids = []
+        for center in centers:
+            # 같은 지점 = 같은 distance_km, published_at 도 같게 → pk 로만 구분되는 tie
+            for i in range(3):
+                dispatch_request = make_dispatch_request(
+                    admin, center, course_title=f"{center.branch_name} {i}"
+                )
+                cls.open_ids.append(dispatch_request.pk)
+        DispatchRequest.objects.filter(pk__in=cls.open_ids).update(
+            published_at=published_at
+        )
+        # 게시되지 않은 / 마감된 공고는 가까워도 제외
+        cls.not_open_ids = [
+            make_dispatch_request(admin, centers[0], status=status).pk
+            for status in (
+                DispatchRequestStatusChoices.REQUESTED,
+                DispatchRequestStatusChoices.CLOSED,
+                DispatchRequestStatusChoices.CANCELLED,
+            )
+        ]
+        # 기본 반경(15km) 밖
+        cls.suwon_id = make_dispatch_request(
+            admin, make_culture_center("Suwon", 37.2636, 127.0286)
+        ).pk
+        cls.busan_id = make_dispatch_request(
+            admin, make_culture_center("Busan", 35.1796, 129.0756)
+        ).pk
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.teacher.user)
+
+    def _walk(self, **params):
+        url, params = "/api/dispatch-requests/open/near-me/", params
+        rows = []
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            rows += response.json()["results"]
+            url, params = response.json()["next"], None
+        return rows
+
+    def test_cursor_walk_returns_every_row_once(self):
+        for page_size in (1, 2, 4, 50):
+            with self.subTest(page_size=page_size):
+                rows = self._walk(radius_km=15, page_size=page_size)
+                ids = [row["id"] for row in rows]
+                self.assertEqual(len(ids), len(set(ids)))
+                self.assertEqual(sorted(ids), sorted(self.open_ids))
+                distances = [row["distance_km"] for row in rows]
+                self.assertEqual(distances, sorted(distances))
+
+    def test_radius_filter_and_distance_ordering(self):
+        cases = [
+            ({}, self.open_ids),
+            ({"radius_km": 1}, self.open_ids[:3]),
+            ({"radius_km": 30}, self.open_ids + [self.suwon_id]),
+            # MAX_RADIUS_KM(100) 로 제한 → 부산(약 325km) 제외
+            ({"radius_km": 1000}, self.open_ids + [self.suwon_id]),
+        ]
+        for params, expected in cases:
+            with self.subTest(params=params):
+                rows = self._walk(**params)
+                self.assertEqual(sorted(row["id"] for row in rows), sorted(expected))
+                distances = [row["distance_km"] for row in rows]
+                self.assertEqual(distances, sorted(distances))
+                radius = min(params.get("radius_km", 15), 100)
+                self.assertTrue(all(d <= radius for d in distances))
+
+    def test_excludes_requests_that_are_not_open(self):
+        ids = {row["id"] for row in self._walk(radius_km=100)}
+
+        self.assertTrue(ids.isdisjoint(self.not_open_ids))
+
+    def test_invalid_radius_is_rejected(self):
+        response = self.client.get(
+            "/api/dispatch-requests/open/near-me/", {"radius_km": "abc"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_teacher_without_coordinates_is_rejected(self):
+        teacher = make_teacher(1, latitude=None, longitude=None)
+        self.client.force_authenticate(teacher.user)
+
+        response = self.client.get("/api/dispatch-requests/open/near-me/")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_user_without_application_is_rejected(self):
+        user = User.objects.create_user(
+            email="new@example.com", password="pw", role="teacher"
+        )
+        self.client.force_authenticate(user)
+
+        response = self.client.get("/api/dispatch-requests/open/near-me/")
+
+        self.assertEqual(response.status_code, 400)
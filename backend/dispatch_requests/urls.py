@@ -3,6 +3,7 @@ from .views import (
     DispatchRequestCreateView,
     DispatchRequestMyListView,
     DispatchRequestOpenListView,
+    DispatchRequestOpenNearMeListView,
     DispatchRequestDetailView,
     DispatchRequestAdminListView,
     DispatchRequestAdminDetailView,
@@ -11,6 +12,7 @@ from .views import (
     DispatchRequestApplyView,
     DispatchRequestWithdrawView,
     DispatchRequestApplicationsView,
+    DispatchRequestNearestTeachersView,
     DispatchRequestSetApplicationStatusView,
 )
 
@@ -20,6 +22,11 @@ urlpatterns = [
     path("", DispatchRequestCreateView.as_view(), name="create"),
     path("my/", DispatchRequestMyListView.as_view(), name="my-list"),
     path("open/", DispatchRequestOpenListView.as_view(), name="open-list"),
+    path(
+        "open/near-me/",
+        DispatchRequestOpenNearMeListView.as_view(),
+        name="open-near-me",
+    ),
     path("<int:pk>/", DispatchRequestDetailView.as_view(), name="detail"),
     path("<int:pk>/apply/", DispatchRequestApplyView.as_view(), name="apply"),
     path("<int:pk>/withdraw/", DispatchRequestWithdrawView.as_view(), name="withdraw"),
@@ -40,6 +47,11 @@ urlpatterns = [
         DispatchRequestApplicationsView.as_view(),
         name="admin-applications",
     ),
+    path(
+        "admin/<int:pk>/nearest-teachers/",
+        DispatchRequestNearestTeachersView.as_view(),
+        name="admin-nearest-teachers",
+    ),
     path(
         "admin/<int:pk>/set-application-status/",
         DispatchRequestSetApplicationStatusView.as_view(),
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import math
+
 from django.db import transaction
-from django.db.models import Count
 from django.utils import timezone
 
 from rest_framework import generics, permissions, status
@@ -9,14 +10,19 @@ from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from config.cache import cache_response
+from config.db_router import ReplicaReadMixin
 from course_posts.models import CourseApplication, CourseApplicationStatusChoices
 from course_posts.serializers import CourseApplicationSerializer
+from teacher_applications.geo import filter_within_radius, nearest_teachers
 from teacher_applications.models import TeacherApplication
 
 from .models import DispatchRequest, DispatchRequestStatusChoices
 from .serializers import (
     DispatchRequestSerializer,
     DispatchRequestAdminSerializer,
+    DispatchRequestNearMeSerializer,
+    NearestTeacherSerializer,
     ApplySerializer,
     SetApplicationStatusSerializer,
 )
@@ -53,14 +59,18 @@ class DispatchRequestCreateView(generics.CreateAPIView):
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = DispatchRequestSerializer
-    queryset = DispatchRequest.objects.select_related("culture_center", "requester")
+    queryset = DispatchRequest.objects.select_related(
+        "culture_center__center", "culture_center__region", "requester"
+    )
 
     def perform_create(self, serializer):
-        dr = serializer.save(requester=self.request.user)
-        transaction.on_commit(lambda: send_dispatch_request_received_email(dr))
+        # 요청 저장과 접수 안내 메일(outbox) 적재를 한 트랜잭션으로
+        with transaction.atomic():
+            dr = serializer.save(requester=self.request.user)
+            send_dispatch_request_received_email(dr)
 
 
-class DispatchRequestMyListView(generics.ListAPIView):
+class DispatchRequestMyListView(ReplicaReadMixin, generics.ListAPIView):
     """
     GET /api/dispatch-requests/my/
     매니저: 내 요청 목록
@@ -71,7 +81,9 @@ class DispatchRequestMyListView(generics.ListAPIView):
 
     def get_queryset(self):
         return (
-            DispatchRequest.objects.select_related("culture_center", "requester")
+            DispatchRequest.objects.select_related(
+                "culture_center__center", "culture_center__region", "requester"
+            )
             .filter(requester=self.request.user)
             .order_by("-created_at")
         )
@@ -81,20 +93,68 @@ class DispatchRequestOpenListView(generics.ListAPIView):
     """
     GET /api/dispatch-requests/open/
     강사: 게시된(OPEN) 공고 목록
+    모든 강사에게 같은 목록이므로 URL(cursor 포함) 단위로 응답 cache
     """
 
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = DispatchRequestSerializer
 
+    @cache_response(
+        tags=("dispatch_requests", "culture_centers", "teacher_applications")
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def get_queryset(self):
         return (
             DispatchRequest.objects.select_related(
                 "culture_center", "culture_center__center", "culture_center__region"
             )
-            .annotate(_applications_count=Count("applications"))
             .filter(status=DispatchRequestStatusChoices.OPEN)
-            .order_by("-published_at", "-created_at")
+            .order_by("-published_at", "-id")
+        )
+
+
+class DispatchRequestOpenNearMeListView(ReplicaReadMixin, generics.ListAPIView):
+    """
+    GET /api/dispatch-requests/open/near-me/?radius_km=15
+    강사: 내 이력서 좌표 기준 반경 이내 OPEN 공고 (가까운 순, distance_km 포함)
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = DispatchRequestNearMeSerializer
+
+    DEFAULT_RADIUS_KM = 15.0
+    MAX_RADIUS_KM = 100.0
+    # 반경 필터가 좌표 없는 row 를 제외하므로 distance_km 는 NULL 이 아님 (cursor 에 IS NULL 분기 불필요)
+    keyset_not_null = ("distance_km",)
+
+    def get_queryset(self):
+        teacher = _get_my_teacher_application_or_error(self.request.user)
+        if teacher.latitude is None or teacher.longitude is None:
+            raise ValidationError("강사 이력서에 주소 좌표가 등록되어 있지 않습니다.")
+
+        try:
+            radius_km = float(
+                self.request.query_params.get("radius_km", self.DEFAULT_RADIUS_KM)
+            )
+        except ValueError:
+            raise ValidationError("radius_km 값이 올바르지 않습니다.")
+        radius_km = max(0.0, min(radius_km, self.MAX_RADIUS_KM))
+
+        qs = (
+            DispatchRequest.objects.select_related(
+                "culture_center", "culture_center__center", "culture_center__region"
+            )
+            .filter(status=DispatchRequestStatusChoices.OPEN)
         )
+        return filter_within_radius(
+            qs,
+            center_lat=float(teacher.latitude),
+            center_lng=float(teacher.longitude),
+            radius_km=radius_km,
+            prefix="culture_center__",
+        ).order_by("distance_km", "-published_at")
 
 
 class DispatchRequestDetailView(generics.RetrieveAPIView):
@@ -111,8 +171,8 @@ class DispatchRequestDetailView(generics.RetrieveAPIView):
 
     def get_queryset(self):
         qs = DispatchRequest.objects.select_related(
-            "culture_center", "requester"
-        ).annotate(_applications_count=Count("applications"))
+            "culture_center__center", "culture_center__region", "requester"
+        )
         user = self.request.user
         role = _role(user)
         if _is_admin_or_manager(user) or user.is_staff:
@@ -122,7 +182,7 @@ class DispatchRequestDetailView(generics.RetrieveAPIView):
         return qs.filter(requester=user)
 
 
-class DispatchRequestAdminListView(generics.ListAPIView):
+class DispatchRequestAdminListView(ReplicaReadMixin, generics.ListAPIView):
     """
     GET /api/dispatch-requests/admin/list/
     관리자: 전체 목록
@@ -131,8 +191,9 @@ class DispatchRequestAdminListView(generics.ListAPIView):
     permission_classes = [permissions.IsAdminUser]
     serializer_class = DispatchRequestSerializer
     queryset = (
-        DispatchRequest.objects.select_related("culture_center", "requester")
-        .annotate(_applications_count=Count("applications"))
+        DispatchRequest.objects.select_related(
+            "culture_center__center", "culture_center__region", "requester"
+        )
         .order_by("-created_at")
     )
 
@@ -145,7 +206,9 @@ class DispatchRequestAdminDetailView(generics.RetrieveUpdateAPIView):
 
     permission_classes = [permissions.IsAdminUser]
     serializer_class = DispatchRequestAdminSerializer
-    queryset = DispatchRequest.objects.select_related("culture_center", "requester")
+    queryset = DispatchRequest.objects.select_related(
+        "culture_center__center", "culture_center__region", "requester"
+    )
 
 
 class DispatchRequestOpenView(APIView):
@@ -163,7 +226,9 @@ class DispatchRequestOpenView(APIView):
         with transaction.atomic():
             dr = (
                 DispatchRequest.objects.select_for_update()
-                .select_related("culture_center", "requester")
+                .select_related(
+                    "culture_center__center", "culture_center__region", "requester"
+                )
                 .get(pk=pk)
             )
 
@@ -172,10 +237,8 @@ class DispatchRequestOpenView(APIView):
             dr.open()
             dr.save()
 
-        # 트랜잭션 커밋 이후 자동 이메일 발송
-        transaction.on_commit(
-            lambda: send_open_notification_to_matched_teachers(dr)
-        )
+            # 상태 변경과 같은 트랜잭션에서 공고 메일을 outbox 에 적재
+            send_open_notification_to_matched_teachers(dr)
 
         return Response(
             DispatchRequestSerializer(dr).data, status=status.HTTP_200_OK
@@ -196,7 +259,9 @@ class DispatchRequestCloseView(APIView):
         with transaction.atomic():
             dr = (
                 DispatchRequest.objects.select_for_update()
-                .select_related("culture_center", "requester")
+                .select_related(
+                    "culture_center__center", "culture_center__region", "requester"
+                )
                 .get(pk=pk)
             )
             dr.close()
@@ -281,7 +346,7 @@ class DispatchRequestWithdrawView(APIView):
         )
 
 
-class DispatchRequestApplicationsView(generics.ListAPIView):
+class DispatchRequestApplicationsView(ReplicaReadMixin, generics.ListAPIView):
     """
     GET /api/dispatch-requests/admin/<id>/applications/
     """
@@ -300,6 +365,60 @@ class DispatchRequestApplicationsView(generics.ListAPIView):
         )
 
 
+class DispatchRequestNearestTeachersView(APIView):
+    """
+    GET /api/dispatch-requests/admin/<id>/nearest-teachers/?k=20&max_radius_km=50
+    지점에서 가까운 순으로 언어가 일치하는 ACCEPTED 강사 k명 (반경 자동 확장)
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    DEFAULT_K = 20
+    MAX_K = 100
+
+    def get(self, request, pk: int):
+        if not _is_admin_or_manager(request.user):
+            raise PermissionDenied("권한이 없습니다.")
+        return self._nearest_teachers(request, pk)
+
+    @cache_response(
+        tags=("dispatch_requests", "culture_centers", "teacher_applications")
+    )
+    def _nearest_teachers(self, request, pk: int):
+        try:
+            dr = DispatchRequest.objects.select_related("culture_center").get(pk=pk)
+        except DispatchRequest.DoesNotExist:
+            raise ValidationError("파견 요청을 찾을 수 없습니다.")
+
+        try:
+            k = int(request.query_params.get("k", self.DEFAULT_K))
+            max_radius_km = request.query_params.get("max_radius_km")
+            max_radius_km = float(max_radius_km) if max_radius_km else None
+            # nan / inf / 음수 거부
+            if max_radius_km is not None and not (
+                math.isfinite(max_radius_km) and max_radius_km >= 0
+            ):
+                raise ValueError
+        except ValueError:
+            raise ValidationError("k / max_radius_km 값이 올바르지 않습니다.")
+        k = max(1, min(k, self.MAX_K))
+
+        cc = dr.culture_center
+        if cc.latitude is None or cc.longitude is None:
+            raise ValidationError("문화센터 지점의 좌표가 등록되어 있지 않습니다.")
+
+        teachers = nearest_teachers(
+            cc,
+            k=k,
+            filters={"teaching_languages": dr.teaching_language},
+            max_radius_km=max_radius_km,
+        )
+        return Response(
+            NearestTeacherSerializer(teachers, many=True).data,
+            status=status.HTTP_200_OK,
+        )
+
+
 class DispatchRequestSetApplicationStatusView(APIView):
     """
     PATCH /api/dispatch-requests/admin/<id>/set-application-status/
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import StoredObject
+
+
+@admin.register(StoredObject)
+class StoredObjectAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "size", "ref_count", "created_at")
+    search_fields = ("name", "sha256")
+    readonly_fields = ("name", "sha256", "size", "ref_count", "created_at")
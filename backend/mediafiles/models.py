@@ -0,0 +1,23 @@
+# backend/mediafiles/models.py
+"""
+content-addressed 스토리지(config.storages.ContentAddressedStorageMixin)의 참조 카운트.
+
+- 같은 내용(SHA-256)의 파일은 스토리지에 객체 하나만 두고, save() 마다 ref_count + 1
+- delete() 는 ref_count - 1, 0 이 되는 순간에만 실제 객체 삭제
+"""
+from django.db import models
+
+
+class StoredObject(models.Model):
+    name = models.CharField(max_length=255, unique=True, verbose_name="Storage name")
+    sha256 = models.CharField(max_length=64, db_index=True, verbose_name="SHA-256")
+    size = models.PositiveBigIntegerField(default=0, verbose_name="Size (bytes)")
+    ref_count = models.PositiveIntegerField(default=1, verbose_name="Reference count")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Stored object / 저장 객체"
+        verbose_name_plural = "Stored objects / 저장 객체"
+
+    def __str__(self):
+        return f"{self.name} (refs={self.ref_count})"
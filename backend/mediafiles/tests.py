@@ -0,0 +1,81 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.test import TestCase
+
+from config.storages import ContentAddressedFileSystemStorage
+
+from .models import StoredObject
+
+
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.storage = ContentAddressedFileSystemStorage(location=tmpdir.name)
+
+    def _save(self, content, name="uploads/photo.JPG", **kwargs):
+        return self.storage.save(name, ContentFile(content), **kwargs)
+
+    def _refs(self, name):
+        return StoredObject.objects.get(name=name).ref_count
+
+    def test_name_is_content_hash(self):
+        name = self._save(b"abc")
+
+        self.assertEqual(name, f"uploads/{hashlib.sha256(b'abc').hexdigest()}.jpg")
+        stored = StoredObject.objects.get()
+        self.assertEqual((stored.name, stored.size, stored.ref_count), (name, 3, 1))
+
+    def test_identical_content_is_stored_once(self):
+        first = self._save(b"same", name="uploads/a.jpg")
+        second = self._save(b"same", name="uploads/b.jpg")
+        other = self._save(b"other", name="uploads/c.jpg")
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertEqual(self._refs(first), 2)
+        self.assertEqual(len(os.listdir(self.storage.path("uploads"))), 2)
+
+    def test_delete_decrements_and_removes_at_zero(self):
+        name = self._save(b"same")
+        self._save(b"same")
+
+        self.storage.delete(name)
+        self.assertEqual(self._refs(name), 1)
+        self.assertTrue(self.storage.exists(name))
+
+        self.storage.delete(name)
+        self.assertFalse(StoredObject.objects.filter(name=name).exists())
+        self.assertFalse(self.storage.exists(name))
+
+        # 다시 저장하면 처음부터
+        self.assertEqual(self._save(b"same"), name)
+        self.assertEqual(self._refs(name), 1)
+
+    def test_untracked_file_is_deleted_directly(self):
+        path = self.storage.path("legacy.jpg")
+        with open(path, "wb") as fh:
+            fh.write(b"legacy")
+
+        self.storage.delete("legacy.jpg")
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_long_name_is_truncated_deterministically(self):
+        full = self._save(b"abc")
+        name = self._save(b"abc", name="uploads/x.jpg", max_length=60)
+        again = self._save(b"abc", name="uploads/y.jpg", max_length=60)
+
+        self.assertEqual(len(name), 60)
+        self.assertEqual(name, again)
+        self.assertTrue(full.startswith(name.removesuffix(".jpg")))
+        self.assertEqual(self._refs(name), 2)
+
+    def test_too_short_max_length_is_rejected(self):
+        with self.assertRaises(SuspiciousFileOperation):
+            self._save(b"abc", max_length=30)
+        self.assertFalse(StoredObject.objects.exists())
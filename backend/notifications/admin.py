@@ -0,0 +1,38 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import EmailOutbox, EmailOutboxStatusChoices
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "status",
+        "subject",
+        "to",
+        "attempts",
+        "next_attempt_at",
+        "created_at",
+        "sent_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("subject", "to")
+    readonly_fields = (
+        "attempts",
+        "locked_at",
+        "last_error",
+        "created_at",
+        "sent_at",
+    )
+    actions = ["retry_now"]
+
+    @admin.action(description="선택한 이메일 즉시 재발송 대기열로 이동")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=EmailOutboxStatusChoices.SENT).update(
+            status=EmailOutboxStatusChoices.PENDING,
+            attempts=0,
+            next_attempt_at=timezone.now(),
+            locked_at=None,
+        )
+        self.message_user(request, f"{updated}건을 재발송 대기열로 이동했습니다.")
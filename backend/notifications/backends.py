@@ -0,0 +1,182 @@
+# backend/notifications/backends.py
+"""
+SMTP 세션 thread pool (Django email backend).
+
+EMAIL_BACKEND = "notifications.backends.ThreadedSMTPPoolEmailBackend"
+
+- EMAIL_POOL_SIZE 개의 SMTP 세션을 동시에 열어두고, 세션마다 thread 하나가 공유 큐에서 메시지를 꺼내 발송
+- 각 세션은 Django 기본 smtp backend(blocking smtplib) 그대로 → 비동기 SMTP client 가 아니라
+  blocking 세션 N 개를 thread 로 병렬 실행하는 풀. TLS/SSL/로그인 설정은 기본 backend 와 동일
+- EMAIL_RATE_LIMIT_PER_SECOND: (SMTP host, 계정) 별 초당 발송 수 제한 (Resend quota)
+  · limiter 는 모듈 단위로 공유 → 같은 프로세스의 backend 인스턴스(get_connection 호출마다 새로 생김)가
+    모두 같은 간격을 따름
+  · 프로세스 단위이므로 worker 가 N 개면 합계는 최대 N 배 → 워커 수에 맞춰 나눠서 설정
+- send_mail / EmailMessage.send / notifications.delivery 모두 코드 변경 없이 사용
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.mail.backends.smtp import EmailBackend as SMTPEmailBackend
+
+
+class _RateLimiter:
+    """초당 rate 통으로 발송 시각을 균등하게 배분 (rate <= 0 이면 제한 없음)."""
+
+    def __init__(self, rate: float):
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+# (host, username) → _RateLimiter
+_limiters: dict[tuple[str, str], _RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str, username: str, rate: float) -> _RateLimiter:
+    """
+    같은 SMTP host / 계정으로 보내는 모든 backend 인스턴스가 공유하는 limiter.
+    rate 는 가장 최근 설정값을 따름.
+    """
+    key = (host or "", username or "")
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = _RateLimiter(rate)
+        else:
+            limiter.set_rate(rate)
+        return limiter
+
+
+def _close_quietly(session: SMTPEmailBackend) -> None:
+    try:
+        session.close()
+    except Exception:
+        session.connection = None
+
+
+class ThreadedSMTPPoolEmailBackend(BaseEmailBackend):
+    def __init__(
+        self,
+        pool_size=None,
+        rate_limit_per_second=None,
+        fail_silently=False,
+        **kwargs,
+    ):
+        super().__init__(fail_silently=fail_silently)
+        self.pool_size = max(
+            1, pool_size or getattr(settings, "EMAIL_POOL_SIZE", 4)
+        )
+        self.rate_limit_per_second = (
+            rate_limit_per_second
+            if rate_limit_per_second is not None
+            else getattr(settings, "EMAIL_RATE_LIMIT_PER_SECOND", 0)
+        )
+        # host / port / username / password / use_tls / use_ssl / timeout ...
+        self.smtp_kwargs = kwargs
+        self._limiter = get_rate_limiter(
+            kwargs.get("host") or settings.EMAIL_HOST,
+            # Django smtp backend 와 같은 기본값 규칙
+            settings.EMAIL_HOST_USER
+            if kwargs.get("username") is None
+            else kwargs["username"],
+            self.rate_limit_per_second,
+        )
+        self._sessions: list[SMTPEmailBackend] = []
+        self._keep_open = False
+        self._lock = threading.RLock()
+
+    def _new_session(self) -> SMTPEmailBackend:
+        return SMTPEmailBackend(fail_silently=False, **self.smtp_kwargs)
+
+    def open(self):
+        """명시적으로 열면 close() 전까지 세션을 재사용 (Django smtp backend 와 동일한 규칙)."""
+        with self._lock:
+            if self._keep_open:
+                return False
+            self._keep_open = True
+            return True
+
+    def close(self):
+        with self._lock:
+            self._keep_open = False
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            _close_quietly(session)
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+        errors = self.send_messages_detailed(email_messages)
+        if not self.fail_silently:
+            first_error = next((e for e in errors if e is not None), None)
+            if first_error is not None:
+                raise first_error
+        return sum(1 for e in errors if e is None)
+
+    def send_messages_detailed(self, email_messages) -> list[Exception | None]:
+        """메시지 순서대로 None(성공) 또는 발생한 예외 목록."""
+        messages = [msg for msg in email_messages if msg.recipients()]
+        with self._lock:
+            try:
+                errors = self._deliver(messages)
+            finally:
+                if not self._keep_open:
+                    self.close()
+
+        results = iter(errors)
+        return [next(results) if msg.recipients() else None for msg in email_messages]
+
+    def _deliver(self, messages) -> list[Exception | None]:
+        errors: list[Exception | None] = [None] * len(messages)
+        if not messages:
+            return errors
+
+        pending: queue.SimpleQueue = queue.SimpleQueue()
+        for item in enumerate(messages):
+            pending.put(item)
+
+        worker_count = min(self.pool_size, len(messages))
+        while len(self._sessions) < worker_count:
+            self._sessions.append(self._new_session())
+
+        def worker(session: SMTPEmailBackend):
+            while True:
+                try:
+                    index, msg = pending.get_nowait()
+                except queue.Empty:
+                    return
+                self._limiter.wait()
+                try:
+                    if session.connection is None:
+                        session.open()
+                    if not session.send_messages([msg]):
+                        raise RuntimeError("SMTP session reported 0 messages sent")
+                except Exception as exc:
+                    errors[index] = exc
+                    # 세션 상태를 알 수 없으므로 끊고, 다음 메시지 발송 시 다시 연결
+                    _close_quietly(session)
+
+        # 세션 하나당 thread 하나 (smtplib 세션은 thread 간에 공유하지 않음)
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            list(executor.map(worker, self._sessions[:worker_count]))
+        return errors
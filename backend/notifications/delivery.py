@@ -0,0 +1,95 @@
+# backend/notifications/delivery.py
+"""
+대량 발송용 배치 sender.
+
+- EmailMessage 를 먼저 모두 만든 뒤, get_connection() 으로 연 SMTP 세션 하나로 발송
+- chunk_size 통마다 세션을 다시 열어 서버의 세션당 메시지 수 제한을 넘지 않도록 함
+- 메시지 단위로 성공/실패를 기록 (fail_silently 로 오류를 삼키지 않음)
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+
+def _chunks(items: Sequence, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def send_messages_batched(
+    messages: Sequence[EmailMessage],
+    *,
+    chunk_size: int | None = None,
+    connection=None,
+) -> dict:
+    """
+    messages 를 chunk_size 통씩 같은 SMTP 세션으로 발송.
+
+    returns:
+        {
+            "message_count", "sent_count", "failed_count", "connection_count",
+            "errors": 메시지 순서대로 None(성공) 또는 오류 문자열,
+            "recipients": {email: "sent" | "failed"},
+        }
+    """
+    chunk_size = chunk_size or getattr(settings, "EMAIL_BATCH_CHUNK_SIZE", 100)
+    conn = connection or get_connection(fail_silently=False)
+
+    errors: list[str | None] = []
+    connection_count = 0
+
+    for chunk in _chunks(list(messages), chunk_size):
+        try:
+            conn.open()
+            connection_count += 1
+        except Exception as exc:
+            errors.extend([f"{type(exc).__name__}: {exc}"] * len(chunk))
+            continue
+
+        try:
+            if hasattr(conn, "send_messages_detailed"):
+                # 세션 풀 backend(notifications.backends): chunk 전체를 여러 세션(thread)으로 병렬 발송
+                errors.extend(
+                    f"{type(exc).__name__}: {exc}" if exc else None
+                    for exc in conn.send_messages_detailed(chunk)
+                )
+                continue
+
+            for msg in chunk:
+                msg.connection = conn
+                try:
+                    if not conn.send_messages([msg]):
+                        raise RuntimeError("email backend reported 0 messages sent")
+                except Exception as exc:
+                    errors.append(f"{type(exc).__name__}: {exc}")
+                    # 오류 이후 세션 상태를 알 수 없으므로 다시 연결
+                    conn.close()
+                    try:
+                        conn.open()
+                        connection_count += 1
+                    except Exception:
+                        pass
+                else:
+                    errors.append(None)
+        finally:
+            conn.close()
+
+    recipients: dict[str, str] = {}
+    for msg, error in zip(messages, errors):
+        for email in msg.recipients():
+            # 같은 주소가 여러 메시지에 있으면 실패를 우선 기록
+            if recipients.get(email) != "failed":
+                recipients[email] = "failed" if error else "sent"
+
+    failed_count = sum(1 for error in errors if error)
+    return {
+        "message_count": len(errors),
+        "sent_count": len(errors) - failed_count,
+        "failed_count": failed_count,
+        "connection_count": connection_count,
+        "errors": errors,
+        "recipients": recipients,
+    }
@@ -0,0 +1,226 @@
+import socket
+import threading
+import time
+
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.core.management.base import BaseCommand, CommandError
+
+from notifications.delivery import send_messages_batched
+
+LOCMEM_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+POOLED_BACKEND = "notifications.backends.ThreadedSMTPPoolEmailBackend"
+
+
+class _CountingHandler:
+    """aiosmtpd handler: SMTP 세션(EHLO/HELO) 수와 수신 메시지 수만 센다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sessions = 0
+        self.messages = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        with self._lock:
+            self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_HELO(self, server, session, envelope, hostname):
+        with self._lock:
+            self.sessions += 1
+        session.host_name = hostname
+        return "250 {}".format(server.hostname)
+
+    async def handle_DATA(self, server, session, envelope):
+        with self._lock:
+            self.messages += 1
+        return "250 Message accepted for delivery"
+
+    def reset(self):
+        with self._lock:
+            self.sessions = 0
+            self.messages = 0
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark per-recipient send_mail vs notifications.delivery.send_messages_batched "
+        "(single connection and ThreadedSMTPPoolEmailBackend) on the locmem backend and "
+        "against a local aiosmtpd SMTP server."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--recipients", type=int, default=500)
+        parser.add_argument("--chunk-size", type=int, default=100)
+        parser.add_argument(
+            "--backends",
+            nargs="+",
+            choices=["locmem", "smtp"],
+            default=["locmem", "smtp"],
+        )
+        parser.add_argument(
+            "--pool-size", type=int, default=4, help="Sessions for the pooled backend"
+        )
+        parser.add_argument(
+            "--rate-limit",
+            type=float,
+            default=0,
+            help="Pooled backend messages/second (0 = unlimited)",
+        )
+        parser.add_argument(
+            "--smtp-port",
+            type=int,
+            default=0,
+            help="Local aiosmtpd port (0 = pick a free port)",
+        )
+
+    def handle(self, *args, **options):
+        count = options["recipients"]
+        chunk_size = options["chunk_size"]
+
+        self.stdout.write(
+            f"{'backend':>7} | {'mode':>10} | {'messages':>8} | {'elapsed':>9} "
+            f"| {'msg/s':>8} | {'sessions':>8} | delivered"
+        )
+
+        for backend in options["backends"]:
+            if backend == "locmem":
+                self._run_locmem(count, chunk_size)
+            else:
+                self._run_smtp(count, chunk_size, options)
+
+    def _messages(self, count: int) -> list[EmailMessage]:
+        return [
+            EmailMessage(
+                subject="[Friending] benchmark",
+                body="benchmark body",
+                from_email="bench@example.invalid",
+                to=[f"teacher-{i}@example.invalid"],
+            )
+            for i in range(count)
+        ]
+
+    def _legacy(self, messages, **conn_kwargs):
+        for msg in messages:
+            send_mail(
+                subject=msg.subject,
+                message=msg.body,
+                from_email=msg.from_email,
+                recipient_list=msg.to,
+                fail_silently=True,
+                connection=get_connection(**conn_kwargs),
+            )
+
+    def _row(self, backend, mode, count, elapsed, sessions, delivered):
+        self.stdout.write(
+            f"{backend:>7} | {mode:>10} | {count:>8} | {elapsed * 1000:>7.1f}ms "
+            f"| {count / elapsed:>8.0f} | {sessions:>8} | {delivered}"
+        )
+
+    def _run_locmem(self, count: int, chunk_size: int):
+        from django.core import mail
+
+        mail.outbox = []
+        started = time.perf_counter()
+        self._legacy(self._messages(count), backend=LOCMEM_BACKEND)
+        elapsed = time.perf_counter() - started
+        self._row("locmem", "per-recip", count, elapsed, count, len(mail.outbox))
+
+        mail.outbox = []
+        started = time.perf_counter()
+        result = send_messages_batched(
+            self._messages(count),
+            chunk_size=chunk_size,
+            connection=get_connection(LOCMEM_BACKEND),
+        )
+        elapsed = time.perf_counter() - started
+        self._row(
+            "locmem",
+            "batched",
+            count,
+            elapsed,
+            result["connection_count"],
+            f"{len(mail.outbox)} (sent={result['sent_count']} failed={result['failed_count']})",
+        )
+
+    def _run_smtp(self, count: int, chunk_size: int, options: dict):
+        try:
+            from aiosmtpd.controller import Controller
+        except ImportError:
+            raise CommandError(
+                "aiosmtpd is required for the smtp benchmark "
+                "(pip install -r requirements-dev.txt)"
+            )
+
+        handler = _CountingHandler()
+        port = options["smtp_port"] or _free_port()
+        controller = Controller(handler, hostname="127.0.0.1", port=port)
+        controller.start()
+        try:
+            conn_kwargs = {
+                "backend": SMTP_BACKEND,
+                "host": "127.0.0.1",
+                "port": port,
+                "use_tls": False,
+                "use_ssl": False,
+                "username": "",
+                "password": "",
+            }
+
+            started = time.perf_counter()
+            self._legacy(self._messages(count), **conn_kwargs)
+            elapsed = time.perf_counter() - started
+            self._row(
+                "smtp", "per-recip", count, elapsed, handler.sessions, handler.messages
+            )
+
+            handler.reset()
+            started = time.perf_counter()
+            result = send_messages_batched(
+                self._messages(count),
+                chunk_size=chunk_size,
+                connection=get_connection(fail_silently=False, **conn_kwargs),
+            )
+            elapsed = time.perf_counter() - started
+            self._row(
+                "smtp",
+                "batched",
+                count,
+                elapsed,
+                handler.sessions,
+                f"{handler.messages} (sent={result['sent_count']} failed={result['failed_count']})",
+            )
+
+            handler.reset()
+            started = time.perf_counter()
+            result = send_messages_batched(
+                self._messages(count),
+                chunk_size=chunk_size,
+                connection=get_connection(
+                    fail_silently=False,
+                    pool_size=options["pool_size"],
+                    rate_limit_per_second=options["rate_limit"],
+                    **{**conn_kwargs, "backend": POOLED_BACKEND},
+                ),
+            )
+            elapsed = time.perf_counter() - started
+            self._row(
+                "smtp",
+                f"pooled x{options['pool_size']}",
+                count,
+                elapsed,
+                handler.sessions,
+                f"{handler.messages} (sent={result['sent_count']} failed={result['failed_count']})",
+            )
+        finally:
+            controller.stop()
+
+
+# python manage.py benchmark_email_fanout --recipients 500 --chunk-size 100
@@ -0,0 +1,71 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from notifications.outbox import claim_due_emails, deliver_emails
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver queued EmailOutbox rows. Claims batches with "
+        "SELECT ... FOR UPDATE SKIP LOCKED where supported (polling on SQLite) "
+        "and sends each batch over a single SMTP connection."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "EMAIL_OUTBOX_BATCH_SIZE", 100),
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=getattr(settings, "EMAIL_OUTBOX_POLL_SECONDS", 2.0),
+            help="Seconds to sleep when the outbox is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain currently due emails and exit",
+        )
+
+    def handle(self, *args, **options):
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        batch_size = options["batch_size"]
+        totals = {"sent": 0, "retry": 0, "failed": 0}
+
+        while not self._stopping:
+            rows = claim_due_emails(batch_size)
+            if not rows:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            stats = deliver_emails(rows)
+            for key, value in stats.items():
+                totals[key] += value
+            self.stdout.write(
+                f"batch={len(rows)} sent={stats['sent']} "
+                f"retry={stats['retry']} failed={stats['failed']}"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stopped: sent={totals['sent']} retry={totals['retry']} "
+                f"failed={totals['failed']}"
+            )
+        )
+
+    def _stop(self, signum, frame):
+        # 진행 중인 배치는 마저 보내고 종료
+        self._stopping = True
+
+
+# python manage.py run_email_worker
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+
+
+class EmailOutboxStatusChoices(models.TextChoices):
+    PENDING = "PENDING", "Pending"
+    SENDING = "SENDING", "Sending"
+    SENT = "SENT", "Sent"
+    FAILED = "FAILED", "Failed"
+
+
+class EmailOutbox(models.Model):
+    """
+    발송 대기 이메일 (transactional outbox)
+    - 요청 처리 중에는 같은 트랜잭션 안에서 row 만 INSERT (SMTP 호출 없음)
+    - 실제 발송은 run_email_worker 가 배치 단위로 가져가서 처리
+    """
+
+    subject = models.CharField("제목", max_length=500)
+    body = models.TextField("본문")
+    html_body = models.TextField("HTML 본문", blank=True, default="")
+    from_email = models.CharField("발신자", max_length=254, blank=True, default="")
+    to = models.JSONField("수신자", default=list)
+
+    status = models.CharField(
+        "상태",
+        max_length=10,
+        choices=EmailOutboxStatusChoices.choices,
+        default=EmailOutboxStatusChoices.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField("시도 횟수", default=0)
+    next_attempt_at = models.DateTimeField("다음 시도 시각", default=timezone.now)
+    locked_at = models.DateTimeField("워커 점유 시각", null=True, blank=True)
+    last_error = models.TextField("마지막 오류", blank=True, default="")
+
+    created_at = models.DateTimeField("생성일시", auto_now_add=True)
+    sent_at = models.DateTimeField("발송일시", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "이메일 발송 대기열"
+        verbose_name_plural = "이메일 발송 대기열"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="email_outbox_due_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"[{self.status}] {self.subject} → {', '.join(self.to or [])}"
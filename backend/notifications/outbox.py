@@ -0,0 +1,222 @@
+# backend/notifications/outbox.py
+"""
+이메일 outbox: 요청 처리 중에는 EmailOutbox row 만 INSERT 하고,
+실제 SMTP 발송은 run_email_worker 프로세스가 담당.
+
+- claim_due_emails: 발송할 row 를 배치 단위로 점유
+  (Postgres: SELECT ... FOR UPDATE SKIP LOCKED / SQLite: 조건부 UPDATE 로 하나씩 점유)
+- deliver_emails: 배치 전체를 SMTP 연결 하나로 발송(delivery.send_messages_batched),
+  실패 row 는 지수 backoff 로 재시도 예약
+"""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Iterable
+
+from django.conf import settings
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .delivery import send_messages_batched
+from .models import EmailOutbox, EmailOutboxStatusChoices
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_recipients(to: Iterable[str] | str) -> list[str]:
+    if isinstance(to, str):
+        to = [to]
+    recipients: list[str] = []
+    for email in to:
+        email = (email or "").strip()
+        if email and email not in recipients:
+            recipients.append(email)
+    return recipients
+
+
+def build_message(row: EmailOutbox, connection=None) -> EmailMultiAlternatives:
+    msg = EmailMultiAlternatives(
+        subject=row.subject,
+        body=row.body,
+        from_email=row.from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(row.to),
+        connection=connection,
+    )
+    if row.html_body:
+        msg.attach_alternative(row.html_body, "text/html")
+    return msg
+
+
+def _send_now(messages: list[EmailMessage]) -> None:
+    result = send_messages_batched(messages)
+    if result["failed_count"]:
+        logger.error(
+            "Inline email delivery failed",
+            extra={
+                "failed": [
+                    email
+                    for email, outcome in result["recipients"].items()
+                    if outcome == "failed"
+                ]
+            },
+        )
+
+
+def _row_from_message(msg: EmailMessage) -> EmailOutbox | None:
+    recipients = _normalize_recipients(msg.to)
+    if not recipients:
+        return None
+
+    html_body = ""
+    for content, mimetype in getattr(msg, "alternatives", None) or []:
+        if mimetype == "text/html":
+            html_body = content
+            break
+
+    return EmailOutbox(
+        subject=msg.subject,
+        body=msg.body,
+        html_body=html_body,
+        from_email=msg.from_email or "",
+        to=recipients,
+    )
+
+
+def enqueue_messages(messages: Iterable[EmailMessage]) -> list[EmailOutbox]:
+    """
+    미리 만든 EmailMessage 들을 outbox 에 한 번의 bulk INSERT 로 적재.
+    EMAIL_OUTBOX_ENABLED=False 이면 커밋 이후 SMTP 연결 하나로 바로 발송.
+    """
+    messages = [msg for msg in messages if _normalize_recipients(msg.to)]
+    if not messages:
+        return []
+
+    if not getattr(settings, "EMAIL_OUTBOX_ENABLED", True):
+        transaction.on_commit(lambda: _send_now(messages))
+        return []
+
+    return EmailOutbox.objects.bulk_create(
+        [_row_from_message(msg) for msg in messages]
+    )
+
+
+def enqueue_email(
+    subject: str,
+    body: str,
+    to: Iterable[str] | str,
+    *,
+    from_email: str | None = None,
+    html_body: str = "",
+) -> EmailOutbox | None:
+    """이메일 1통을 outbox 에 적재 (호출한 쪽의 트랜잭션에 함께 묶임)."""
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=body,
+        from_email=from_email or "",
+        to=_normalize_recipients(to),
+    )
+    if html_body:
+        msg.attach_alternative(html_body, "text/html")
+
+    rows = enqueue_messages([msg])
+    return rows[0] if rows else None
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    base = getattr(settings, "EMAIL_OUTBOX_RETRY_BASE_SECONDS", 30)
+    cap = getattr(settings, "EMAIL_OUTBOX_RETRY_MAX_SECONDS", 3600)
+    return timedelta(seconds=min(cap, base * 2 ** max(0, attempts - 1)))
+
+
+def claim_due_emails(batch_size: int) -> list[EmailOutbox]:
+    """발송 시각이 된 PENDING row 를 최대 batch_size 개 점유(SENDING)해서 반환."""
+    now = timezone.now()
+
+    # 워커가 발송 도중 죽어서 SENDING 으로 남아 있는 row 복구
+    lock_timeout = getattr(settings, "EMAIL_OUTBOX_LOCK_TIMEOUT_SECONDS", 600)
+    EmailOutbox.objects.filter(
+        status=EmailOutboxStatusChoices.SENDING,
+        locked_at__lt=now - timedelta(seconds=lock_timeout),
+    ).update(status=EmailOutboxStatusChoices.PENDING, locked_at=None)
+
+    due = EmailOutbox.objects.filter(
+        status=EmailOutboxStatusChoices.PENDING,
+        next_attempt_at__lte=now,
+    ).order_by("next_attempt_at", "id")
+
+    db_alias = router.db_for_write(EmailOutbox)
+    if connections[db_alias].features.has_select_for_update_skip_locked:
+        # 여러 워커가 동시에 돌아도 서로 다른 row 를 가져감 (잠긴 row 는 건너뜀)
+        with transaction.atomic(using=db_alias):
+            rows = list(due.select_for_update(skip_locked=True)[:batch_size])
+            EmailOutbox.objects.filter(pk__in=[row.pk for row in rows]).update(
+                status=EmailOutboxStatusChoices.SENDING, locked_at=now
+            )
+    else:
+        # SKIP LOCKED 미지원(SQLite): 후보를 읽은 뒤 조건부 UPDATE 로 하나씩 점유
+        rows = [
+            row
+            for row in due[:batch_size]
+            if EmailOutbox.objects.filter(
+                pk=row.pk, status=EmailOutboxStatusChoices.PENDING
+            ).update(status=EmailOutboxStatusChoices.SENDING, locked_at=now)
+        ]
+
+    for row in rows:
+        row.status = EmailOutboxStatusChoices.SENDING
+        row.locked_at = now
+    return rows
+
+
+def _schedule_retry(row: EmailOutbox, error: str) -> str:
+    attempts = row.attempts + 1
+    max_attempts = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 5)
+
+    if attempts >= max_attempts:
+        new_status = EmailOutboxStatusChoices.FAILED
+        next_attempt_at = row.next_attempt_at
+    else:
+        new_status = EmailOutboxStatusChoices.PENDING
+        next_attempt_at = timezone.now() + _retry_delay(attempts)
+
+    EmailOutbox.objects.filter(pk=row.pk).update(
+        status=new_status,
+        attempts=attempts,
+        next_attempt_at=next_attempt_at,
+        locked_at=None,
+        last_error=error[:2000],
+    )
+    logger.warning(
+        "Email delivery failed",
+        extra={"outbox_id": row.pk, "attempts": attempts, "status": new_status},
+    )
+    return new_status
+
+
+def deliver_emails(rows: list[EmailOutbox]) -> dict:
+    """점유한 row 들을 send_messages_batched 로 발송하고 결과 통계를 반환."""
+    stats = {"sent": 0, "retry": 0, "failed": 0}
+    if not rows:
+        return stats
+
+    result = send_messages_batched([build_message(row) for row in rows])
+
+    sent_ids = []
+    for row, error in zip(rows, result["errors"]):
+        if error is None:
+            sent_ids.append(row.pk)
+        elif _schedule_retry(row, error) == EmailOutboxStatusChoices.FAILED:
+            stats["failed"] += 1
+        else:
+            stats["retry"] += 1
+
+    EmailOutbox.objects.filter(pk__in=sent_ids).update(
+        status=EmailOutboxStatusChoices.SENT,
+        sent_at=timezone.now(),
+        locked_at=None,
+        last_error="",
+    )
+    stats["sent"] = len(sent_ids)
+    return stats
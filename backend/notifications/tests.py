@@ -0,0 +1,335 @@
+import socket
+import threading
+import time
+from datetime import timedelta
+
+from aiosmtpd.controller import Controller
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from .backends import ThreadedSMTPPoolEmailBackend, get_rate_limiter
+from .delivery import send_messages_batched
+from .models import EmailOutbox, EmailOutboxStatusChoices
+from .outbox import claim_due_emails, deliver_emails, enqueue_email
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError("smtp down")
+
+
+@override_settings(
+    EMAIL_OUTBOX_ENABLED=True,
+    EMAIL_OUTBOX_MAX_ATTEMPTS=3,
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS=30,
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS=3600,
+    EMAIL_OUTBOX_LOCK_TIMEOUT_SECONDS=600,
+)
+class EmailOutboxTests(TestCase):
+    def test_enqueue_only_inserts_row(self):
+        row = enqueue_email("제목", "본문", [" a@example.com ", "a@example.com"])
+
+        self.assertEqual(row.to, ["a@example.com"])
+        self.assertEqual(row.status, EmailOutboxStatusChoices.PENDING)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_claim_takes_due_rows_once(self):
+        due = enqueue_email("due", "본문", "a@example.com")
+        later = enqueue_email("later", "본문", "b@example.com")
+        EmailOutbox.objects.filter(pk=later.pk).update(
+            next_attempt_at=timezone.now() + timedelta(minutes=5)
+        )
+
+        rows = claim_due_emails(batch_size=10)
+
+        self.assertEqual([row.pk for row in rows], [due.pk])
+        due.refresh_from_db()
+        self.assertEqual(due.status, EmailOutboxStatusChoices.SENDING)
+        self.assertIsNotNone(due.locked_at)
+        # 이미 점유한 row 는 다시 가져가지 않음
+        self.assertEqual(claim_due_emails(batch_size=10), [])
+
+    def test_claim_respects_batch_size_and_order(self):
+        first = enqueue_email("1", "본문", "a@example.com")
+        second = enqueue_email("2", "본문", "b@example.com")
+        enqueue_email("3", "본문", "c@example.com")
+
+        rows = claim_due_emails(batch_size=2)
+
+        self.assertEqual([row.pk for row in rows], [first.pk, second.pk])
+
+    def test_claim_recovers_stale_sending_rows(self):
+        row = enqueue_email("stale", "본문", "a@example.com")
+        EmailOutbox.objects.filter(pk=row.pk).update(
+            status=EmailOutboxStatusChoices.SENDING,
+            locked_at=timezone.now() - timedelta(seconds=601),
+        )
+
+        self.assertEqual([r.pk for r in claim_due_emails(batch_size=10)], [row.pk])
+
+    def test_deliver_marks_sent(self):
+        enqueue_email("제목", "본문", "a@example.com", html_body="<p>본문</p>")
+
+        stats = deliver_emails(claim_due_emails(batch_size=10))
+
+        self.assertEqual(stats, {"sent": 1, "retry": 0, "failed": 0})
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        row = EmailOutbox.objects.get()
+        self.assertEqual(row.status, EmailOutboxStatusChoices.SENT)
+        self.assertIsNotNone(row.sent_at)
+        self.assertIsNone(row.locked_at)
+
+    @override_settings(EMAIL_BACKEND="notifications.tests.FailingEmailBackend")
+    def test_failed_delivery_is_retried_with_backoff_then_failed(self):
+        row = enqueue_email("제목", "본문", "a@example.com")
+
+        before = timezone.now()
+        stats = deliver_emails(claim_due_emails(batch_size=10))
+        self.assertEqual(stats, {"sent": 0, "retry": 1, "failed": 0})
+        row.refresh_from_db()
+        self.assertEqual(row.status, EmailOutboxStatusChoices.PENDING)
+        self.assertEqual(row.attempts, 1)
+        self.assertIn("ConnectionRefusedError", row.last_error)
+        self.assertGreaterEqual(row.next_attempt_at, before + timedelta(seconds=30))
+        # backoff 시각 전에는 다시 점유되지 않음
+        self.assertEqual(claim_due_emails(batch_size=10), [])
+
+        EmailOutbox.objects.filter(pk=row.pk).update(next_attempt_at=timezone.now())
+        before = timezone.now()
+        deliver_emails(claim_due_emails(batch_size=10))
+        row.refresh_from_db()
+        self.assertEqual(row.attempts, 2)
+        self.assertGreaterEqual(row.next_attempt_at, before + timedelta(seconds=60))
+
+        EmailOutbox.objects.filter(pk=row.pk).update(next_attempt_at=timezone.now())
+        stats = deliver_emails(claim_due_emails(batch_size=10))
+        self.assertEqual(stats, {"sent": 0, "retry": 0, "failed": 1})
+        row.refresh_from_db()
+        self.assertEqual(row.status, EmailOutboxStatusChoices.FAILED)
+        self.assertEqual(row.attempts, 3)
+        self.assertEqual(claim_due_emails(batch_size=10), [])
+
+    @override_settings(EMAIL_OUTBOX_ENABLED=False)
+    def test_disabled_outbox_sends_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertIsNone(enqueue_email("제목", "본문", "a@example.com"))
+            self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(EmailOutbox.objects.exists())
+
+
+class _RecordingHandler:
+    """aiosmtpd handler: 받은 메시지 수신자 기록, reject@ 수신자는 거부"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sessions = 0
+        self.recipients = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        with self._lock:
+            self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("reject@"):
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        with self._lock:
+            self.recipients.extend(envelope.rcpt_tos)
+        return "250 Message accepted for delivery"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _SMTPServerMixin:
+    """테스트마다 로컬 aiosmtpd 서버 (self.port, 수신 기록은 self.handler)"""
+
+    def setUp(self):
+        super().setUp()
+        self.handler = _RecordingHandler()
+        self.port = _free_port()
+        self.controller = Controller(self.handler, hostname="127.0.0.1", port=self.port)
+        self.controller.start()
+        self.addCleanup(self.controller.stop)
+
+    @staticmethod
+    def _messages(*recipients):
+        return [
+            mail.EmailMessage("제목", "본문", "from@example.com", [to])
+            for to in recipients
+        ]
+
+
+class _FailingOpenBackend(BaseEmailBackend):
+    def open(self):
+        raise ConnectionRefusedError("smtp down")
+
+    def send_messages(self, email_messages):
+        raise AssertionError("send without open")
+
+
+class SendMessagesBatchedTests(_SMTPServerMixin, SimpleTestCase):
+    def _connection(self):
+        return get_connection(
+            "django.core.mail.backends.smtp.EmailBackend",
+            host="127.0.0.1",
+            port=self.port,
+            username="",
+            password="",
+            use_tls=False,
+            use_ssl=False,
+            timeout=5,
+        )
+
+    def test_fan_out_reuses_one_connection(self):
+        recipients = [f"user{i}@example.com" for i in range(5)]
+
+        result = send_messages_batched(
+            self._messages(*recipients), connection=self._connection()
+        )
+
+        self.assertEqual(
+            (result["sent_count"], result["failed_count"], result["connection_count"]),
+            (5, 0, 1),
+        )
+        self.assertEqual(self.handler.sessions, 1)
+        self.assertEqual(self.handler.recipients, recipients)
+
+    def test_chunks_open_a_connection_each(self):
+        recipients = [f"user{i}@example.com" for i in range(5)]
+
+        result = send_messages_batched(
+            self._messages(*recipients), chunk_size=2, connection=self._connection()
+        )
+
+        self.assertEqual((result["sent_count"], result["connection_count"]), (5, 3))
+        self.assertEqual(self.handler.sessions, 3)
+
+    def test_partial_failure_counts(self):
+        messages = self._messages(
+            "a@example.com", "reject@example.com", "b@example.com", "a@example.com"
+        )
+
+        result = send_messages_batched(messages, connection=self._connection())
+
+        self.assertEqual(
+            (result["message_count"], result["sent_count"], result["failed_count"]),
+            (4, 3, 1),
+        )
+        self.assertEqual(
+            [error is None for error in result["errors"]], [True, False, True, True]
+        )
+        self.assertIn("SMTPRecipientsRefused", result["errors"][1])
+        self.assertEqual(
+            result["recipients"],
+            {
+                "a@example.com": "sent",
+                "reject@example.com": "failed",
+                "b@example.com": "sent",
+            },
+        )
+        # 오류 뒤에는 세션 상태를 알 수 없어 한 번 다시 연결
+        self.assertEqual(result["connection_count"], 2)
+        self.assertEqual(self.handler.sessions, 2)
+        self.assertEqual(
+            self.handler.recipients, ["a@example.com", "b@example.com", "a@example.com"]
+        )
+
+    def test_locmem_backend(self):
+        result = send_messages_batched(
+            self._messages("a@example.com", "b@example.com"),
+            connection=get_connection("django.core.mail.backends.locmem.EmailBackend"),
+        )
+
+        self.assertEqual((result["sent_count"], result["failed_count"]), (2, 0))
+        self.assertEqual(
+            [msg.to for msg in mail.outbox], [["a@example.com"], ["b@example.com"]]
+        )
+
+    def test_failed_open_marks_whole_chunk_failed(self):
+        result = send_messages_batched(
+            self._messages("a@example.com", "b@example.com", "c@example.com"),
+            chunk_size=2,
+            connection=_FailingOpenBackend(),
+        )
+
+        self.assertEqual(
+            (result["sent_count"], result["failed_count"], result["connection_count"]),
+            (0, 3, 0),
+        )
+        self.assertTrue(all("ConnectionRefusedError" in e for e in result["errors"]))
+        self.assertEqual(set(result["recipients"].values()), {"failed"})
+
+
+class ThreadedSMTPPoolEmailBackendTests(_SMTPServerMixin, SimpleTestCase):
+    def _backend(self, **kwargs):
+        kwargs.setdefault("pool_size", 3)
+        kwargs.setdefault("rate_limit_per_second", 0)
+        kwargs.setdefault("username", "")
+        return ThreadedSMTPPoolEmailBackend(
+            host="127.0.0.1",
+            port=self.port,
+            password="",
+            use_tls=False,
+            use_ssl=False,
+            timeout=5,
+            **kwargs,
+        )
+
+    def test_sends_through_pooled_sessions(self):
+        recipients = [f"user{i}@example.com" for i in range(9)]
+
+        sent = self._backend().send_messages(self._messages(*recipients))
+
+        self.assertEqual(sent, 9)
+        self.assertCountEqual(self.handler.recipients, recipients)
+        # 세션 수는 pool_size 이하 (메시지마다 새로 연결하지 않음)
+        self.assertLessEqual(self.handler.sessions, 3)
+
+    def test_reports_errors_per_message(self):
+        messages = self._messages(
+            "a@example.com", "reject@example.com", "b@example.com"
+        )
+
+        result = send_messages_batched(messages, connection=self._backend())
+
+        self.assertEqual(result["sent_count"], 2)
+        self.assertIsNone(result["errors"][0])
+        self.assertIn("SMTPRecipientsRefused", result["errors"][1])
+        self.assertIsNone(result["errors"][2])
+        self.assertEqual(result["recipients"]["reject@example.com"], "failed")
+        self.assertCountEqual(
+            self.handler.recipients, ["a@example.com", "b@example.com"]
+        )
+
+    def test_rate_limiter_is_shared_per_host_and_user(self):
+        first = self._backend(username="limiter-shared", rate_limit_per_second=20)
+        second = self._backend(username="limiter-shared", rate_limit_per_second=20)
+        other = self._backend(username="limiter-other", rate_limit_per_second=20)
+
+        self.assertIs(first._limiter, second._limiter)
+        self.assertIsNot(first._limiter, other._limiter)
+        self.assertIs(
+            first._limiter, get_rate_limiter("127.0.0.1", "limiter-shared", 20)
+        )
+
+        # 인스턴스가 달라도 같은 간격(0.05초)을 이어서 사용 → 4통에 최소 3 간격
+        started = time.monotonic()
+        first.send_messages(self._messages("a@example.com", "b@example.com"))
+        second.send_messages(self._messages("c@example.com", "d@example.com"))
+        self.assertGreaterEqual(time.monotonic() - started, 0.14)
+        self.assertEqual(len(self.handler.recipients), 4)
@@ -2,6 +2,7 @@
 
 # Django migrations and static files
 python manage.py migrate
+python manage.py backfill_geo_cells
 python manage.py collectstatic --noinput
 python manage.py create_superuser
 
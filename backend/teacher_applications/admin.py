@@ -1,11 +1,14 @@
 from django.contrib import admin
 from django.utils.html import format_html
+
+from config.db_router import ReplicaChangelistMixin
+
 from .models import TeacherApplication
 from .admin_forms import TeacherApplicationAdminForm
 
 
 @admin.register(TeacherApplication)
-class TeacherApplicationAdmin(admin.ModelAdmin):
+class TeacherApplicationAdmin(ReplicaChangelistMixin, admin.ModelAdmin):
     form = TeacherApplicationAdminForm
 
     list_display = [
@@ -32,7 +35,13 @@ class TeacherApplicationAdmin(admin.ModelAdmin):
         "phone_number",
         "nationality",
     ]
-    readonly_fields = ["user", "created_at", "updated_at", "profile_image_preview"]
+    readonly_fields = [
+        "user",
+        "created_at",
+        "updated_at",
+        "profile_image_preview",
+        "profile_image_status",
+    ]
 
     fieldsets = (
         (
@@ -42,6 +51,7 @@ class TeacherApplicationAdmin(admin.ModelAdmin):
                     "user",
                     "profile_image",
                     "profile_image_preview",
+                    "profile_image_status",
                     "first_name",
                     "last_name",
                     "korean_name",
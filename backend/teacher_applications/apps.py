@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class TeacherApplicationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "teacher_applications"
+
+    def ready(self):
+        from config.cache import invalidate_on_change
+
+        # 공간 인덱스 invalidate signal 등록
+        from . import spatial_index  # noqa: F401
+        from .models import TeacherApplication
+
+        invalidate_on_change(TeacherApplication, "teacher_applications")
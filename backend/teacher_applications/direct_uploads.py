@@ -0,0 +1,160 @@
+# backend/teacher_applications/direct_uploads.py
+"""
+버킷 직접 업로드 (S3 presigned POST).
+
+1) issue_upload: 업로드할 key 를 정하고 presigned POST(url + fields)와 서명 토큰 발급
+   - 브라우저가 url 로 직접 multipart POST → Django 워커는 파일 바이트를 받지 않음
+   - 버킷 정책 조건: content-length-range(최대 2MB), Content-Type, ACL
+2) finalize_upload: 지원서 생성/수정 시 토큰을 검증하고 업로드된 객체를 확인
+   - 객체 존재 / 크기 / 앞부분(range GET)만 읽어서 이미지 헤더 검사(uploads.inspect_image)
+   - 반환된 storage name 을 ImageField 에 그대로 대입 (재업로드 없음)
+
+default storage 가 S3(django-storages) 가 아니면(로컬 개발) 사용할 수 없음.
+"""
+from __future__ import annotations
+
+import io
+import os
+import uuid
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+
+from .models import TeacherApplication
+from .uploads import IMAGE_UPLOAD_MAX_BYTES, inspect_image
+
+DIRECT_UPLOAD_FIELDS = ("profile_image", "visa_scan")
+ALLOWED_CONTENT_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+}
+# 헤더 검사용으로 앞부분만 읽음 (JPEG EXIF(APP1) 최대 64KB 이후의 SOF 까지 포함)
+_HEADER_RANGE_BYTES = 128 * 1024
+_TOKEN_SALT = "teacher_applications.direct_upload"
+
+
+class DirectUploadUnavailable(Exception):
+    """default storage 가 presigned POST 를 지원하지 않을 때."""
+
+
+def _storage():
+    storage = TeacherApplication._meta.get_field("profile_image").storage
+    # django-storages S3Boto3Storage 만 지원 (bucket / _normalize_name 사용)
+    if not hasattr(storage, "bucket"):
+        raise DirectUploadUnavailable(
+            "Direct uploads require S3 media storage. "
+            "S3 스토리지에서만 직접 업로드를 사용할 수 있습니다."
+        )
+    return storage
+
+
+def is_available() -> bool:
+    try:
+        _storage()
+    except DirectUploadUnavailable:
+        return False
+    return True
+
+
+def _s3_key(storage, name: str) -> str:
+    return storage._normalize_name(name)
+
+
+def issue_upload(user, field_name: str, filename: str) -> dict:
+    """
+    presigned POST 발급.
+
+    returns: {"field", "url", "fields", "token", "expires_in", "max_size"}
+    raises: ValidationError (field/확장자 오류), DirectUploadUnavailable
+    """
+    if field_name not in DIRECT_UPLOAD_FIELDS:
+        raise ValidationError(
+            f"field must be one of {', '.join(DIRECT_UPLOAD_FIELDS)}.", code="field"
+        )
+    ext = os.path.splitext(filename or "")[1].lower().lstrip(".")
+    content_type = ALLOWED_CONTENT_TYPES.get(ext)
+    if not content_type:
+        raise ValidationError(
+            "Only JPG/PNG images are allowed. JPG/PNG 이미지만 업로드할 수 있습니다.",
+            code="unsupported",
+        )
+
+    storage = _storage()
+    model_field = TeacherApplication._meta.get_field(field_name)
+    # upload_to 아래 추측 불가능한 이름 (업로드 후 그대로 storage name 으로 사용)
+    name = model_field.generate_filename(None, f"{uuid.uuid4().hex}.{ext}")
+    expires_in = getattr(settings, "DIRECT_UPLOAD_EXPIRES_SECONDS", 600)
+
+    fields = {"Content-Type": content_type}
+    conditions = [
+        {"Content-Type": content_type},
+        ["content-length-range", 1, IMAGE_UPLOAD_MAX_BYTES],
+    ]
+    acl = getattr(storage, "default_acl", None)
+    if acl:
+        fields["acl"] = acl
+        conditions.append({"acl": acl})
+
+    presigned = storage.bucket.meta.client.generate_presigned_post(
+        Bucket=storage.bucket.name,
+        Key=_s3_key(storage, name),
+        Fields=fields,
+        Conditions=conditions,
+        ExpiresIn=expires_in,
+    )
+    token = signing.dumps(
+        {"user": user.pk, "field": field_name, "name": name}, salt=_TOKEN_SALT
+    )
+    return {
+        "field": field_name,
+        "url": presigned["url"],
+        "fields": presigned["fields"],
+        "token": token,
+        "expires_in": expires_in,
+        "max_size": IMAGE_UPLOAD_MAX_BYTES,
+    }
+
+
+def finalize_upload(user, field_name: str, token: str) -> str:
+    """
+    issue_upload 토큰을 검증하고 업로드된 객체를 확인한 뒤 storage name 반환.
+    raises: ValidationError
+    """
+    max_age = getattr(settings, "DIRECT_UPLOAD_TOKEN_MAX_AGE_SECONDS", 24 * 3600)
+    try:
+        payload = signing.loads(token, salt=_TOKEN_SALT, max_age=max_age)
+    except signing.BadSignature:
+        raise ValidationError(
+            "Upload token is invalid or expired. 업로드 토큰이 유효하지 않습니다.",
+            code="invalid_token",
+        )
+    if payload.get("user") != user.pk or payload.get("field") != field_name:
+        raise ValidationError(
+            "Upload token does not match this field. 업로드 토큰이 올바르지 않습니다.",
+            code="invalid_token",
+        )
+
+    storage = _storage()
+    name = payload["name"]
+    try:
+        obj = storage.bucket.Object(_s3_key(storage, name))
+        size = obj.content_length
+        head = obj.get(Range=f"bytes=0-{_HEADER_RANGE_BYTES - 1}")["Body"].read()
+    except Exception:
+        raise ValidationError(
+            "Uploaded file was not found. 업로드된 파일을 찾을 수 없습니다.",
+            code="missing",
+        )
+
+    header = io.BytesIO(head)
+    header.size = size
+    try:
+        inspect_image(header)
+    except ValidationError:
+        # 검증에 실패한 객체는 버킷에 남기지 않음
+        storage.delete(name)
+        raise
+    return name
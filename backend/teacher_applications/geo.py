@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import math
-from django.db.models import F, FloatField, Value
+
+from django.conf import settings
+from django.db.models import F, FloatField, Q, Value
 from django.db.models.functions import (
     ACos,
     Cos,
@@ -13,42 +15,29 @@ from django.db.models.functions import (
     Cast,
 )
 from django.db.models.expressions import ExpressionWrapper
-from .models import TeacherApplication
+from .geo_cells import (
+    CELL_SIZE_DEG,
+    EARTH_RADIUS_KM,
+    cells_within_radius,
+    radius_deltas,
+)
+from .models import ApplicationStatusChoices, TeacherApplication
+from .spatial_index import get_teacher_spatial_index
 
 
-EARTH_RADIUS_KM = 6371.0088
+# cell IN (...) 목록이 이보다 커지면(아주 큰 반경) 위경도 bounding box 로 대체
+MAX_CELLS_PER_QUERY = 2000
 
 
-def teachers_within_radius(
-    *,
-    center_lat: float,
-    center_lng: float,
-    radius_km: float = 5.0,
-):
+def distance_km_expression(center_lat: float, center_lng: float, prefix: str = ""):
     """
-    반경(radius_km) 이내 TeacherApplication queryset을
-    distance_km로 annotate 후 거리순 정렬해서 반환.
+    (center_lat, center_lng) ~ {prefix}latitude/longitude 사이 거리(km) SQL 식.
+    Haversine(여기서는 acos 기반 great-circle)
     """
-    # 1) bounding box (대략적인 사각형 필터)
-    lat_delta = radius_km / 111.32
-    # 위도에 따른 경도 1도 길이 보정
-    cos_lat = math.cos(math.radians(center_lat))
-    lng_delta = radius_km / (111.32 * cos_lat) if abs(cos_lat) > 1e-12 else 180.0
-
-    qs = TeacherApplication.objects.filter(
-        latitude__isnull=False,
-        longitude__isnull=False,
-        latitude__gte=center_lat - lat_delta,
-        latitude__lte=center_lat + lat_delta,
-        longitude__gte=center_lng - lng_delta,
-        longitude__lte=center_lng + lng_delta,
-    )
-
-    # 2) Haversine(여기서는 acos 기반 great-circle) 거리 계산 (km)
     lat1 = Radians(Value(float(center_lat), output_field=FloatField()))
     lng1 = Radians(Value(float(center_lng), output_field=FloatField()))
-    lat2 = Radians(Cast(F("latitude"), FloatField()))
-    lng2 = Radians(Cast(F("longitude"), FloatField()))
+    lat2 = Radians(Cast(F(f"{prefix}latitude"), FloatField()))
+    lng2 = Radians(Cast(F(f"{prefix}longitude"), FloatField()))
 
     cos_angle = Cos(lat1) * Cos(lat2) * Cos(lng2 - lng1) + Sin(lat1) * Sin(lat2)
 
@@ -58,18 +47,190 @@ def teachers_within_radius(
         Greatest(Value(-1.0, output_field=FloatField()), cos_angle),
     )
 
-    distance_km = ExpressionWrapper(
+    return ExpressionWrapper(
         Value(float(EARTH_RADIUS_KM), output_field=FloatField())
         * ACos(cos_angle_clamped),
         output_field=FloatField(),
     )
 
-    qs = (
-        qs.annotate(
-            distance_km=distance_km,
+
+def _longitude_range(center_lng: float, lng_delta: float, prefix: str = "") -> Q:
+    """경도 구간 조건 (±180 날짜변경선을 넘으면 양쪽 구간을 OR)"""
+    lng_min = center_lng - lng_delta
+    lng_max = center_lng + lng_delta
+    gte, lte = f"{prefix}longitude__gte", f"{prefix}longitude__lte"
+    if lng_min < -180.0:
+        return Q(**{gte: lng_min + 360.0}) | Q(**{lte: lng_max})
+    if lng_max > 180.0:
+        return Q(**{gte: lng_min}) | Q(**{lte: lng_max - 360.0})
+    return Q(**{gte: lng_min, lte: lng_max})
+
+
+def filter_within_radius(
+    qs,
+    *,
+    center_lat: float,
+    center_lng: float,
+    radius_km: float,
+    prefix: str = "",
+):
+    """
+    geo_cell / latitude / longitude 를 가진 모델(또는 prefix 로 연결된 관계)의 queryset을
+    반경(radius_km) 이내로 필터하고 distance_km 로 annotate.
+
+    1) 후보 추출: {prefix}geo_cell IN (반경을 덮는 셀들) — 정수 인덱스 lookup
+    2) 정확한 거리 계산은 후보 row 에만 적용
+    """
+    lat_delta, lng_delta = radius_deltas(center_lat, radius_km)
+    approx_cells = (2 * lat_delta / CELL_SIZE_DEG + 2) * (
+        2 * lng_delta / CELL_SIZE_DEG + 2
+    )
+
+    if approx_cells <= MAX_CELLS_PER_QUERY:
+        qs = qs.filter(
+            **{
+                f"{prefix}geo_cell__in": cells_within_radius(
+                    center_lat, center_lng, radius_km
+                )
+            }
         )
-        .filter(distance_km__lte=float(radius_km))
-        .order_by("distance_km")
+    else:
+        qs = qs.filter(
+            **{
+                f"{prefix}latitude__isnull": False,
+                f"{prefix}longitude__isnull": False,
+                f"{prefix}latitude__gte": center_lat - lat_delta,
+                f"{prefix}latitude__lte": center_lat + lat_delta,
+            }
+        )
+        if lng_delta < 180.0:
+            qs = qs.filter(_longitude_range(center_lng, lng_delta, prefix))
+
+    return qs.annotate(
+        distance_km=distance_km_expression(center_lat, center_lng, prefix)
+    ).filter(distance_km__lte=float(radius_km))
+
+
+def teachers_within_radius(
+    *,
+    center_lat: float,
+    center_lng: float,
+    radius_km: float = 5.0,
+):
+    """
+    반경(radius_km) 이내 TeacherApplication queryset을
+    distance_km로 annotate 후 거리순 정렬해서 반환.
+    """
+    return filter_within_radius(
+        TeacherApplication.objects.all(),
+        center_lat=center_lat,
+        center_lng=center_lng,
+        radius_km=radius_km,
+    ).order_by("distance_km")
+
+
+def _load_teacher_hits(
+    hits: list[tuple[int, float]], teaching_language: str | None
+) -> list[TeacherApplication]:
+    """공간 인덱스 결과 (teacher_id, distance_km) -> 거리순 TeacherApplication 목록"""
+    if not hits:
+        return []
+
+    distances = dict(hits)
+    # 인덱스 build 이후 상태가 바뀐 강사가 섞이지 않도록 status도 다시 확인
+    qs = TeacherApplication.objects.filter(
+        pk__in=list(distances),
+        status=ApplicationStatusChoices.ACCEPTED,
     )
+    if teaching_language:
+        qs = qs.filter(teaching_languages=teaching_language)
+
+    teachers = list(qs)
+    for teacher in teachers:
+        teacher.distance_km = distances[teacher.pk]
+    teachers.sort(key=lambda t: t.distance_km)
+    return teachers
 
-    return qs
+
+def accepted_teachers_within_radius(
+    *,
+    center_lat: float,
+    center_lng: float,
+    radius_km: float = 5.0,
+    teaching_language: str | None = None,
+) -> list[TeacherApplication]:
+    """
+    반경(radius_km) 이내 ACCEPTED 강사 목록(거리순, 각 객체에 distance_km 세팅).
+
+    - 기본: in-memory 공간 인덱스로 후보 id/거리를 구한 뒤 해당 id만 DB 조회
+    - TEACHER_GEO_INDEX_ENABLED=False 이면 기존 ORM(teachers_within_radius) 경로 사용
+    """
+    if not getattr(settings, "TEACHER_GEO_INDEX_ENABLED", True):
+        qs = teachers_within_radius(
+            center_lat=center_lat,
+            center_lng=center_lng,
+            radius_km=radius_km,
+        ).filter(status=ApplicationStatusChoices.ACCEPTED)
+        if teaching_language:
+            qs = qs.filter(teaching_languages=teaching_language)
+        return list(qs)
+
+    hits = get_teacher_spatial_index().query_radius(
+        float(center_lat), float(center_lng), float(radius_km)
+    )
+    return _load_teacher_hits(hits, teaching_language)
+
+
+NEAREST_TEACHERS_FILTERS = {"teaching_languages"}
+
+
+def nearest_teachers(
+    center,
+    k: int = 10,
+    filters: dict | None = None,
+    max_radius_km: float | None = None,
+) -> list[TeacherApplication]:
+    """
+    center(latitude/longitude 를 가진 객체, 예: CultureCenter)에서 가장 가까운
+    ACCEPTED 강사 최대 k명 (거리순, 각 객체에 distance_km 세팅).
+
+    - filters: {"teaching_languages": "English"} 형태 (NEAREST_TEACHERS_FILTERS 만 지원)
+    - 공간 인덱스에서 링 단위로 반경을 넓혀 k명을 찾으므로 전체 강사 수와 무관하게 동작
+    - TEACHER_GEO_INDEX_ENABLED=False 이면 ORM 으로 거리 정렬 후 k개 slicing
+    """
+    filters = dict(filters or {})
+    unknown = set(filters) - NEAREST_TEACHERS_FILTERS
+    if unknown:
+        raise ValueError(f"Unsupported filter(s): {sorted(unknown)}")
+    if max_radius_km is not None and not (
+        math.isfinite(max_radius_km) and max_radius_km >= 0
+    ):
+        raise ValueError("max_radius_km must be a finite number >= 0")
+
+    if center is None or center.latitude is None or center.longitude is None:
+        return []
+
+    center_lat = float(center.latitude)
+    center_lng = float(center.longitude)
+    teaching_language = filters.get("teaching_languages") or None
+
+    if not getattr(settings, "TEACHER_GEO_INDEX_ENABLED", True):
+        qs = teachers_within_radius(
+            center_lat=center_lat,
+            center_lng=center_lng,
+            radius_km=(
+                math.pi * EARTH_RADIUS_KM if max_radius_km is None else max_radius_km
+            ),
+        ).filter(status=ApplicationStatusChoices.ACCEPTED)
+        if teaching_language:
+            qs = qs.filter(teaching_languages=teaching_language)
+        return list(qs[:k])
+
+    hits = get_teacher_spatial_index().query_nearest(
+        center_lat,
+        center_lng,
+        k,
+        teaching_language=teaching_language,
+        max_radius_km=max_radius_km,
+    )
+    return _load_teacher_hits(hits, teaching_language)
@@ -0,0 +1,112 @@
+# backend/teacher_applications/geo_batch.py
+"""
+NumPy 기반 일괄(batch) 거리 계산 엔진.
+
+- 강사 좌표를 연속(contiguous) float64 배열로 보관 (radians / sin / cos 미리 계산)
+- 구면 코사인 법칙: cos(c) = sinφ1·sinφ2 + cosφ1·cosφ2·cos(λ2-λ1)
+  → 단위 벡터(x, y, z)의 내적과 같으므로, 센터 → 강사 거리를 행렬-벡터 곱 한 번으로
+    계산 (geo.teachers_within_radius 의 SQL acos 식과 동일한 공식)
+- top-k 는 전체 정렬 대신 argpartition 으로 선택 후 k개만 정렬
+"""
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from .geo_cells import (
+    CELL_SIZE_DEG,
+    EARTH_RADIUS_KM,
+    GRID_COLS,
+    GRID_ROWS,
+    cell_key_from_row_col,
+)
+
+
+def _unit_vectors(sin_lat, cos_lat, lng_rad) -> np.ndarray:
+    return np.ascontiguousarray(
+        np.stack(
+            [cos_lat * np.cos(lng_rad), cos_lat * np.sin(lng_rad), sin_lat], axis=-1
+        )
+    )
+
+
+def _centers_to_vectors(centers: Sequence[tuple[float, float]]) -> np.ndarray:
+    arr = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    lat_rad = np.radians(arr[:, 0])
+    lng_rad = np.radians(arr[:, 1])
+    return _unit_vectors(np.sin(lat_rad), np.cos(lat_rad), lng_rad)
+
+
+def _angles_to_km(cos_angle: np.ndarray) -> np.ndarray:
+    # 부동소수점 오차로 arccos 입력이 [-1,1]을 벗어나는 것 방지
+    np.clip(cos_angle, -1.0, 1.0, out=cos_angle)
+    return EARTH_RADIUS_KM * np.arccos(cos_angle)
+
+
+def cell_keys_array(lat_deg: np.ndarray, lng_deg: np.ndarray) -> np.ndarray:
+    """geo_cells.cell_key 의 벡터화 버전."""
+    rows = np.clip(np.floor((lat_deg + 90.0) / CELL_SIZE_DEG), 0, GRID_ROWS - 1)
+    cols = np.mod(np.floor((lng_deg + 180.0) / CELL_SIZE_DEG), GRID_COLS)
+    return cell_key_from_row_col(rows.astype(np.int64), cols.astype(np.int64))
+
+
+class TeacherCoordinates:
+    """강사 id / 좌표를 연속 배열로 보관하는 거리 계산기."""
+
+    def __init__(self, ids: np.ndarray, lat_deg: np.ndarray, lng_deg: np.ndarray):
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.lat_deg = np.ascontiguousarray(lat_deg, dtype=np.float64)
+        self.lng_deg = np.ascontiguousarray(lng_deg, dtype=np.float64)
+
+        self.lat_rad = np.radians(self.lat_deg)
+        self.lng_rad = np.radians(self.lng_deg)
+        self.sin_lat = np.sin(self.lat_rad)
+        self.cos_lat = np.cos(self.lat_rad)
+        self._xyz = _unit_vectors(self.sin_lat, self.cos_lat, self.lng_rad)
+
+    @classmethod
+    def from_points(cls, points: Iterable[tuple[int, float, float]]):
+        """(teacher_id, lat, lng) iterable 로부터 생성."""
+        arr = np.array(list(points), dtype=np.float64).reshape(-1, 3)
+        return cls(arr[:, 0].astype(np.int64), arr[:, 1], arr[:, 2])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def distances_km(
+        self, center_lat: float, center_lng: float, rows: np.ndarray | None = None
+    ) -> np.ndarray:
+        """한 센터 → 강사(전체 또는 rows 부분집합) 거리(km) 배열."""
+        xyz = self._xyz if rows is None else self._xyz[rows]
+        return _angles_to_km(xyz @ _centers_to_vectors([(center_lat, center_lng)])[0])
+
+    def top_k(
+        self,
+        center_lat: float,
+        center_lng: float,
+        k: int,
+        max_km: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """가까운 순 최대 k명의 (teacher_id, distance_km)."""
+        return self._select_top_k(self.distances_km(center_lat, center_lng), k, max_km)
+
+    def _select_top_k(
+        self, distances: np.ndarray, k: int, max_km: float | None
+    ) -> list[tuple[int, float]]:
+        rows = np.arange(len(distances))
+        if max_km is not None:
+            rows = np.flatnonzero(distances <= max_km)
+            distances = distances[rows]
+
+        if k <= 0 or len(distances) == 0:
+            return []
+        if k < len(distances):
+            part = np.argpartition(distances, k - 1)[:k]
+        else:
+            part = np.arange(len(distances))
+
+        order = part[np.argsort(distances[part], kind="stable")]
+        return [
+            (int(self.ids[rows[i]]), float(distances[i])) for i in order
+        ]
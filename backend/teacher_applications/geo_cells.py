@@ -0,0 +1,132 @@
+# backend/teacher_applications/geo_cells.py
+"""
+위경도 격자(grid) 셀 계산 유틸.
+
+- ORM/모델에 의존하지 않는 순수 계산 모듈 (spatial_index / geo 에서 공용으로 사용)
+- 지구 전체를 CELL_SIZE_DEG 간격의 격자로 나누고, 각 셀을 정수 key로 표현
+"""
+from __future__ import annotations
+
+import math
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG_LAT = 111.32
+
+# 0.05도 ≈ 위도 방향 5.5km (한국 위도에서 경도 방향 ≈ 4.4km)
+CELL_SIZE_DEG = 0.05
+
+# 격자 크기 (geo_batch.cell_keys_array 도 이 값과 cell_key_from_row_col 을 사용)
+GRID_ROWS = int(round(180 / CELL_SIZE_DEG))
+GRID_COLS = int(round(360 / CELL_SIZE_DEG))
+
+
+def cell_key_from_row_col(row, col):
+    """(row, col) → 셀 key (int / NumPy 정수 배열 모두 가능)"""
+    return row * GRID_COLS + col
+
+
+def cell_row_col(lat: float, lng: float) -> tuple[int, int]:
+    row = int(math.floor((lat + 90.0) / CELL_SIZE_DEG))
+    col = int(math.floor((lng + 180.0) / CELL_SIZE_DEG))
+    # 위도 90 / 경도 180 경계값 보정
+    return min(max(row, 0), GRID_ROWS - 1), col % GRID_COLS
+
+
+def cell_key(lat: float, lng: float) -> int:
+    """좌표가 속한 격자 셀의 정수 key."""
+    return cell_key_from_row_col(*cell_row_col(lat, lng))
+
+
+def radius_deltas(center_lat: float, radius_km: float) -> tuple[float, float]:
+    """
+    반경(radius_km)을 덮는 (위도 delta, 경도 delta) 도 단위 값.
+    경도 delta는 bounding box의 극 쪽 가장자리 위도 기준으로 계산(누락 방지).
+    """
+    lat_delta = radius_km / KM_PER_DEG_LAT
+    edge_lat = min(90.0, abs(center_lat) + lat_delta)
+    cos_lat = math.cos(math.radians(edge_lat))
+    lng_delta = radius_km / (KM_PER_DEG_LAT * cos_lat) if cos_lat > 1e-12 else 180.0
+    return lat_delta, min(lng_delta, 180.0)
+
+
+def cells_within_radius(center_lat: float, center_lng: float, radius_km: float) -> list[int]:
+    """반경(radius_km) bounding box와 겹치는 모든 셀 key 목록."""
+    lat_delta, lng_delta = radius_deltas(center_lat, radius_km)
+
+    row_min, _ = cell_row_col(center_lat - lat_delta, center_lng)
+    row_max, _ = cell_row_col(center_lat + lat_delta, center_lng)
+
+    if lng_delta >= 180.0:
+        cols = range(GRID_COLS)
+    else:
+        col_min = int(math.floor((center_lng - lng_delta + 180.0) / CELL_SIZE_DEG))
+        col_max = int(math.floor((center_lng + lng_delta + 180.0) / CELL_SIZE_DEG))
+        cols = [c % GRID_COLS for c in range(col_min, col_max + 1)]
+
+    return [
+        cell_key_from_row_col(row, col)
+        for row in range(row_min, row_max + 1)
+        for col in cols
+    ]
+
+
+def ring_cells(row0: int, col0: int, ring: int) -> list[int]:
+    """(row0, col0) 셀에서 체비쇼프 거리가 정확히 ring 인 셀 key 목록."""
+    if ring == 0:
+        return [cell_key_from_row_col(row0, col0)]
+
+    coords = set()
+    for col in range(col0 - ring, col0 + ring + 1):
+        coords.add((row0 - ring, col))
+        coords.add((row0 + ring, col))
+    for row in range(row0 - ring + 1, row0 + ring):
+        coords.add((row, col0 - ring))
+        coords.add((row, col0 + ring))
+
+    return sorted(
+        {
+            cell_key_from_row_col(row, col % GRID_COLS)
+            for row, col in coords
+            if 0 <= row < GRID_ROWS
+        }
+    )
+
+
+def ring_covered_km(lat: float, lng: float, ring: int) -> float:
+    """
+    중심 셀 기준 0..ring 링을 모두 탐색했을 때, 누락 없이 보장되는 반경(km).
+    - 위도 방향: 탐색 영역 위/아래 경계까지의 거리
+    - 경도 방향: 좌/우 경계 자오선(meridian)까지의 대원 거리
+    """
+    row0, col0 = cell_row_col(lat, lng)
+    if 2 * ring + 1 >= GRID_COLS:
+        return math.pi * EARTH_RADIUS_KM
+
+    km_per_deg = math.pi * EARTH_RADIUS_KM / 180
+
+    lat_lo = (row0 - ring) * CELL_SIZE_DEG - 90.0
+    lat_hi = (row0 + ring + 1) * CELL_SIZE_DEG - 90.0
+    d_lat = min(
+        lat - lat_lo if lat_lo > -90.0 else math.inf,
+        lat_hi - lat if lat_hi < 90.0 else math.inf,
+    )
+
+    lng_lo = (col0 - ring) * CELL_SIZE_DEG - 180.0
+    lng_hi = (col0 + ring + 1) * CELL_SIZE_DEG - 180.0
+    d_lng = min(lng - lng_lo, lng_hi - lng)
+    if d_lng >= 90.0:
+        d_lng_km = math.inf
+    else:
+        d_lng_km = EARTH_RADIUS_KM * math.asin(
+            min(1.0, math.sin(math.radians(d_lng)) * math.cos(math.radians(lat)))
+        )
+
+    return min(d_lat * km_per_deg, d_lng_km, math.pi * EARTH_RADIUS_KM)
+
+
+def cell_key_or_none(lat, lng) -> int | None:
+    """모델 저장용: 좌표(Decimal/None)가 모두 있을 때만 셀 key."""
+    if lat is None or lng is None:
+        return None
+    return cell_key(float(lat), float(lng))
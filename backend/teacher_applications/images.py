@@ -0,0 +1,395 @@
+# backend/teacher_applications/images.py
+"""
+프로필 이미지 후처리(썸네일/메타) 파이프라인.
+
+- 업로드 요청에서는 원본만 저장하고 profile_image_status=PENDING 으로 표시
+- run_image_worker 가 PENDING row 를 점유(PROCESSING)해서 썸네일/메타 생성 후 READY
+- render_profile_image 는 ORM 에 의존하지 않는 순수 함수 (bytes in → bytes/메타 out)
+  한 번의 decode 로 256px JPEG 썸네일 + 해상도(PROFILE_IMAGE_DERIVATIVE_SIZES) x
+  포맷(PROFILE_IMAGE_DERIVATIVE_FORMATS, WebP/JPEG/AVIF) 파생 이미지를 생성
+- 결과 반영은 QuerySet.update() (signal 없음) → 반영 후 직접 "teacher_applications" cache tag invalidate
+"""
+from __future__ import annotations
+
+import io
+import logging
+import os
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, router, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps, features
+
+from config.cache import invalidate_tags
+
+from .models import ProfileImageStatusChoices, TeacherApplication
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = (256, 256)
+_EXIF_ORIENTATION = 0x0112
+
+# Pillow 저장 포맷 / 확장자 / 인코딩 옵션
+_FORMAT_OPTIONS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", {"quality": 85, "optimize": True, "progressive": True}),
+    "avif": ("AVIF", "avif", {"quality": 60}),
+}
+
+
+def derivative_sizes() -> list[int]:
+    sizes = getattr(settings, "PROFILE_IMAGE_DERIVATIVE_SIZES", [64, 128, 256, 512])
+    return sorted({int(size) for size in sizes}, reverse=True)
+
+
+def derivative_formats() -> list[str]:
+    """설정된 포맷 중 현재 Pillow 빌드가 인코딩할 수 있는 것만 (jpeg 는 항상 포함)."""
+    formats = getattr(settings, "PROFILE_IMAGE_DERIVATIVE_FORMATS", ["webp", "jpeg"])
+    available = []
+    for fmt in formats:
+        fmt = fmt.lower()
+        if fmt not in _FORMAT_OPTIONS or fmt in available:
+            continue
+        if fmt != "jpeg" and not features.check(fmt):
+            continue
+        available.append(fmt)
+    if "jpeg" not in available:
+        available.append("jpeg")
+    return available
+
+
+def _encode(img: Image.Image, fmt: str) -> bytes:
+    pil_format, _ext, options = _FORMAT_OPTIONS[fmt]
+    buffer = io.BytesIO()
+    img.save(buffer, format=pil_format, **options)
+    return buffer.getvalue()
+
+
+def render_profile_image(fileobj, sizes=None, formats=None) -> dict:
+    """
+    원본 이미지를 한 번만 decode 해서 썸네일 + 해상도별 파생 이미지 생성.
+    JPEG 는 draft 모드로 필요한 해상도까지만 decode.
+
+    returns:
+        {
+            "format", "width", "height",
+            "thumbnail": 256px JPEG bytes (profile_image_thumbnail 호환),
+            "derivatives": [{"size", "format", "width", "height", "content"}, ...],
+        }
+    256px JPEG 파생 이미지는 썸네일과 같은 이미지 → 다시 encode 하지 않고 "thumbnail": True 로 표시
+    (store_rendered_images 가 썸네일 파일을 그대로 가리키게 함)
+    """
+    sizes = derivative_sizes() if sizes is None else sorted(sizes, reverse=True)
+    formats = derivative_formats() if formats is None else formats
+
+    with Image.open(fileobj) as img:
+        image_format = (img.format or "").upper()
+        width, height = img.size
+        orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+        if image_format == "JPEG":
+            # draft: 가장 큰 파생 크기 이상을 유지하는 선에서 JPEG 를 축소 decode (DCT scaling)
+            largest = max([*sizes, THUMBNAIL_SIZE[0]])
+            img.draft("RGB", (largest, largest))
+        img = ImageOps.exif_transpose(img)  # 회전 EXIF 보정
+        current = img.convert("RGB")
+
+    # 메타는 원본 기준 (업로드 검사 uploads.inspect_image 와 동일한 값)
+    if orientation in (5, 6, 7, 8):
+        width, height = height, width
+
+    derivatives = []
+    thumbnail = None
+    # 큰 크기부터 차례로 줄여 나가므로 매 크기마다 원본 전체를 다시 resample 하지 않음
+    for size in sorted({*sizes, THUMBNAIL_SIZE[0]}, reverse=True):
+        current = current.copy()
+        current.thumbnail((size, size), Image.Resampling.LANCZOS)
+        if size == THUMBNAIL_SIZE[0]:
+            thumbnail = _encode(current, "jpeg")
+        if size not in sizes:
+            continue
+        for fmt in formats:
+            item = {
+                "size": size,
+                "format": fmt,
+                "width": current.width,
+                "height": current.height,
+            }
+            if size == THUMBNAIL_SIZE[0] and fmt == "jpeg":
+                item.update(content=thumbnail, thumbnail=True)
+            else:
+                item["content"] = _encode(current, fmt)
+            derivatives.append(item)
+
+    return {
+        "format": image_format,
+        "width": width,
+        "height": height,
+        "thumbnail": thumbnail,
+        "derivatives": derivatives,
+    }
+
+
+def derivative_names(derivatives) -> list[str]:
+    """파생 이미지 파일 이름 (썸네일을 가리키는 항목은 제외 — 파일은 썸네일 한 개)."""
+    return [
+        item["name"]
+        for item in derivatives or []
+        if item.get("name") and not item.get("thumbnail")
+    ]
+
+
+def derivatives_outdated(app: TeacherApplication) -> bool:
+    """현재 설정(크기 x 포맷)과 저장된 파생 이미지 구성이 다르면 True."""
+    expected = {(size, fmt) for size in derivative_sizes() for fmt in derivative_formats()}
+    current = {
+        (item.get("size"), item.get("format"))
+        for item in app.profile_image_derivatives or []
+    }
+    return current != expected
+
+
+def build_srcset(derivatives, url_for) -> dict:
+    """
+    profile_image_derivatives → 포맷별 srcset 문자열
+    e.g. {"webp": "https://.../a_64.webp 64w, ...", "jpeg": "..."}
+    """
+    srcset: dict[str, list[str]] = {}
+    for item in sorted(derivatives or [], key=lambda d: d["width"]):
+        srcset.setdefault(item["format"], []).append(
+            f"{url_for(item['name'])} {item['width']}w"
+        )
+    return {fmt: ", ".join(entries) for fmt, entries in srcset.items()}
+
+
+def render_profile_image_bytes(data: bytes, sizes=None, formats=None) -> dict:
+    """render_profile_image 의 bytes 버전 (ProcessPoolExecutor 에 넘기기 위한 top-level 함수)."""
+    return render_profile_image(io.BytesIO(data), sizes=sizes, formats=formats)
+
+
+def _delete_quietly(storage, names) -> None:
+    for name in names:
+        try:
+            storage.delete(name)
+        except Exception:
+            pass
+
+
+def store_rendered_images(
+    app: TeacherApplication, source_name: str, result: dict, filesize: int | None
+) -> dict:
+    """
+    render 결과(썸네일/파생 이미지)를 스토리지에 저장하고 모델에 반영할 필드 값을 반환.
+    저장 도중 실패하면 이미 저장한 파일은 지우고 예외를 그대로 던짐.
+    """
+    thumb_field = app.profile_image_thumbnail.field
+    storage = thumb_field.storage
+    base, _ext = os.path.splitext(os.path.basename(source_name))
+
+    saved: list[str] = []
+    try:
+        thumb_name = storage.save(
+            thumb_field.generate_filename(app, f"{base}_thumb.jpg"),
+            ContentFile(result["thumbnail"]),
+        )
+        saved.append(thumb_name)
+
+        derivatives = []
+        for item in result["derivatives"]:
+            entry = {
+                "size": item["size"],
+                "format": item["format"],
+                "width": item["width"],
+                "height": item["height"],
+            }
+            if item.get("thumbnail"):
+                # 썸네일과 같은 이미지 → 따로 저장하지 않고 썸네일 파일을 가리킴
+                entry.update(name=thumb_name, thumbnail=True)
+            else:
+                _pil_format, ext, _options = _FORMAT_OPTIONS[item["format"]]
+                entry["name"] = storage.save(
+                    thumb_field.generate_filename(app, f"{base}_{item['size']}.{ext}"),
+                    ContentFile(item["content"]),
+                )
+                saved.append(entry["name"])
+            derivatives.append(entry)
+    except Exception:
+        _delete_quietly(storage, saved)
+        raise
+
+    return {
+        "profile_image_thumbnail": thumb_name,
+        "profile_image_derivatives": derivatives,
+        "profile_image_width": result["width"],
+        "profile_image_height": result["height"],
+        "profile_image_format": result["format"],
+        "profile_image_filesize": filesize,
+        "profile_image_status": ProfileImageStatusChoices.READY,
+        "profile_image_claimed_at": None,
+    }
+
+
+def stored_image_names(app_or_fields) -> list[str]:
+    """
+    썸네일 + 파생 이미지 파일 이름 (모델 인스턴스 또는 store_rendered_images 결과).
+    content-addressed 스토리지에서는 같은 이름이 여러 번 참조될 수 있어 중복을 유지.
+    """
+    if isinstance(app_or_fields, dict):
+        thumb = app_or_fields.get("profile_image_thumbnail")
+        derivatives = app_or_fields.get("profile_image_derivatives")
+    else:
+        thumb = app_or_fields.profile_image_thumbnail.name
+        derivatives = app_or_fields.profile_image_derivatives
+    return [name for name in (thumb, *derivative_names(derivatives)) if name]
+
+
+def delete_stored_images(names) -> None:
+    storage = TeacherApplication._meta.get_field("profile_image_thumbnail").storage
+    _delete_quietly(storage, names)
+
+
+def _invalidate_cache() -> None:
+    # update() 는 post_save 를 보내지 않으므로 apps.py 의 invalidate_on_change 대신 직접 (커밋 이후)
+    transaction.on_commit(lambda: invalidate_tags("teacher_applications"))
+
+
+def process_profile_image(app: TeacherApplication) -> str:
+    """
+    app.profile_image 의 썸네일/파생 이미지/메타를 생성해서 저장하고 최종 상태를 반환.
+    처리 도중 원본이 다른 파일로 교체됐다면 결과를 버리고 새 파일은 다시 PENDING 으로 둔다.
+    """
+    source_name = app.profile_image.name if app.profile_image else None
+    if not source_name:
+        if TeacherApplication.objects.filter(pk=app.pk).update(
+            profile_image_status="", profile_image_claimed_at=None
+        ):
+            _invalidate_cache()
+        return ""
+
+    storage = app.profile_image.storage
+    try:
+        with storage.open(source_name, "rb") as fh:
+            result = render_profile_image(fh)
+        try:
+            filesize = storage.size(source_name)
+        except Exception:
+            # 스토리지/환경에 따라 size 접근이 실패할 수 있어 방어적으로 처리
+            filesize = None
+
+        fields = store_rendered_images(app, source_name, result, filesize)
+    except Exception:
+        logger.exception(
+            "Profile image processing failed", extra={"application_id": app.pk}
+        )
+        if TeacherApplication.objects.filter(
+            pk=app.pk, profile_image=source_name
+        ).update(
+            profile_image_status=ProfileImageStatusChoices.FAILED,
+            profile_image_claimed_at=None,
+        ):
+            _invalidate_cache()
+        app.profile_image_status = ProfileImageStatusChoices.FAILED
+        return ProfileImageStatusChoices.FAILED
+
+    old_names = stored_image_names(app)
+    new_names = stored_image_names(fields)
+    # save() 를 거치지 않고 UPDATE (원본이 그 사이 바뀌지 않았을 때만 반영)
+    updated = TeacherApplication.objects.filter(
+        pk=app.pk, profile_image=source_name
+    ).update(**fields)
+
+    if not updated:
+        delete_stored_images(new_names)
+        return ProfileImageStatusChoices.PENDING
+    _invalidate_cache()
+
+    for name, value in fields.items():
+        setattr(app, name, value)
+    # 기존 썸네일/파생 이미지 삭제(파일 교체 시 찌꺼기 방지)
+    # 새 이름과 같더라도(같은 내용) 참조 카운트를 맞추기 위해 delete 호출
+    delete_stored_images(old_names)
+    return ProfileImageStatusChoices.READY
+
+
+def claim_pending_profile_images(batch_size: int) -> list[TeacherApplication]:
+    """PENDING 상태 row 를 최대 batch_size 개 점유(PROCESSING)해서 반환."""
+    now = timezone.now()
+
+    # 워커가 처리 도중 죽어서 PROCESSING 으로 남아 있는 row 복구
+    lock_timeout = getattr(settings, "PROFILE_IMAGE_LOCK_TIMEOUT_SECONDS", 600)
+    TeacherApplication.objects.filter(
+        profile_image_status=ProfileImageStatusChoices.PROCESSING,
+        profile_image_claimed_at__lt=now - timedelta(seconds=lock_timeout),
+    ).update(
+        profile_image_status=ProfileImageStatusChoices.PENDING,
+        profile_image_claimed_at=None,
+    )
+
+    pending = TeacherApplication.objects.filter(
+        profile_image_status=ProfileImageStatusChoices.PENDING
+    ).order_by("updated_at", "id")
+
+    db_alias = router.db_for_write(TeacherApplication)
+    if connections[db_alias].features.has_select_for_update_skip_locked:
+        with transaction.atomic(using=db_alias):
+            apps = list(
+                pending.select_for_update(skip_locked=True, of=("self",))[:batch_size]
+            )
+            TeacherApplication.objects.filter(pk__in=[a.pk for a in apps]).update(
+                profile_image_status=ProfileImageStatusChoices.PROCESSING,
+                profile_image_claimed_at=now,
+            )
+    else:
+        # SKIP LOCKED 미지원(SQLite): 후보를 읽은 뒤 조건부 UPDATE 로 하나씩 점유
+        apps = [
+            app
+            for app in pending[:batch_size]
+            if TeacherApplication.objects.filter(
+                pk=app.pk, profile_image_status=ProfileImageStatusChoices.PENDING
+            ).update(
+                profile_image_status=ProfileImageStatusChoices.PROCESSING,
+                profile_image_claimed_at=now,
+            )
+        ]
+
+    for app in apps:
+        app.profile_image_status = ProfileImageStatusChoices.PROCESSING
+        app.profile_image_claimed_at = now
+    return apps
+
+
+def claim_profile_images_for_regeneration(
+    ids, fields=()
+) -> tuple[list[tuple[TeacherApplication, str]], datetime]:
+    """
+    regenerate_profile_images 용: ids 중 PENDING / PROCESSING 이 아닌 row 를 점유(PROCESSING).
+    - PENDING 은 run_image_worker 가 처리, PROCESSING 은 이미 누군가 처리 중 → 건너뜀
+    - 같은 chunk 는 같은 claimed_at 으로 점유 → 반영할 때 (PROCESSING, claimed_at) 로 소유 확인
+
+    returns: ([(app, 점유 전 profile_image_status), ...], claimed_at)
+    """
+    now = timezone.now()
+    busy = (ProfileImageStatusChoices.PENDING, ProfileImageStatusChoices.PROCESSING)
+    prior = dict(
+        TeacherApplication.objects.filter(pk__in=list(ids))
+        .exclude(profile_image_status__in=busy)
+        .values_list("id", "profile_image_status")
+    )
+    if not prior:
+        return [], now
+
+    TeacherApplication.objects.filter(pk__in=list(prior)).exclude(
+        profile_image_status__in=busy
+    ).update(
+        profile_image_status=ProfileImageStatusChoices.PROCESSING,
+        profile_image_claimed_at=now,
+    )
+    claimed = TeacherApplication.objects.filter(
+        pk__in=list(prior),
+        profile_image_status=ProfileImageStatusChoices.PROCESSING,
+        profile_image_claimed_at=now,
+    ).order_by("id")
+    if fields:
+        claimed = claimed.only(*fields)
+    return [(app, prior[app.pk]) for app in claimed], now
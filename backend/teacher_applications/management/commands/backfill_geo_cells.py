@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from culture_centers.models import CultureCenter
+from teacher_applications.geo_cells import cell_key_or_none
+from teacher_applications.models import TeacherApplication
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill geo_cell (spatial cell key) for TeacherApplication and CultureCenter "
+        "rows from latitude/longitude."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every row (default: only rows whose geo_cell is missing)",
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        for model in (TeacherApplication, CultureCenter):
+            updated = self._backfill(model, options["all"], options["batch_size"])
+            self.stdout.write(
+                self.style.SUCCESS(f"{model.__name__}: {updated} row(s) updated")
+            )
+
+    def _backfill(self, model, recompute_all: bool, batch_size: int) -> int:
+        qs = model.objects.all()
+        if not recompute_all:
+            qs = qs.filter(
+                geo_cell__isnull=True,
+                latitude__isnull=False,
+                longitude__isnull=False,
+            )
+
+        updated = 0
+        pending = []
+        rows = qs.order_by("pk").values_list("pk", "latitude", "longitude", "geo_cell")
+        for pk, lat, lng, geo_cell in rows.iterator(chunk_size=batch_size):
+            new_cell = cell_key_or_none(lat, lng)
+            if new_cell != geo_cell:
+                pending.append(model(pk=pk, geo_cell=new_cell))
+
+            if len(pending) >= batch_size:
+                updated += self._flush(model, pending, batch_size)
+                pending = []
+
+        if pending:
+            updated += self._flush(model, pending, batch_size)
+        return updated
+
+    def _flush(self, model, objs, batch_size: int) -> int:
+        with transaction.atomic():
+            model.objects.bulk_update(objs, ["geo_cell"], batch_size=batch_size)
+        return len(objs)
+
+
+# python manage.py backfill_geo_cells
+# python manage.py backfill_geo_cells --all
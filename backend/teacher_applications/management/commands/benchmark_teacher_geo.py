@@ -0,0 +1,156 @@
+import random
+import statistics
+import time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from teacher_applications.geo import teachers_within_radius
+from teacher_applications.geo_cells import cell_key_or_none
+from teacher_applications.models import ApplicationStatusChoices, TeacherApplication
+from teacher_applications.spatial_index import (
+    TeacherSpatialIndex,
+    load_accepted_teacher_points,
+)
+
+# 대한민국 대략적인 bounding box
+KR_LAT_RANGE = (33.1, 38.6)
+KR_LNG_RANGE = (124.6, 131.9)
+
+BATCH_SIZE = 5000
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark ORM radius search vs in-memory spatial index on synthetic "
+        "ACCEPTED teachers. All rows are created inside a transaction and rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[10_000, 100_000, 1_000_000],
+            help="Synthetic teacher counts to benchmark",
+        )
+        parser.add_argument(
+            "--queries", type=int, default=50, help="Radius queries per size"
+        )
+        parser.add_argument(
+            "--radius-km", type=float, default=15.0, help="Search radius (km)"
+        )
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        radius_km = options["radius_km"]
+        centers = [
+            (rng.uniform(*KR_LAT_RANGE), rng.uniform(*KR_LNG_RANGE))
+            for _ in range(options["queries"])
+        ]
+
+        self.stdout.write(
+            f"{'teachers':>10} | {'index build':>11} | {'orm p50':>9} | {'orm p99':>9} "
+            f"| {'index p50':>9} | {'index p99':>9} | match"
+        )
+
+        for size in options["sizes"]:
+            with transaction.atomic():
+                self._seed(size, rng)
+                row = self._run(centers, radius_km)
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{size:>10} | {row['build_ms']:>9.1f}ms | {row['orm_p50']:>7.2f}ms "
+                f"| {row['orm_p99']:>7.2f}ms | {row['index_p50']:>7.3f}ms "
+                f"| {row['index_p99']:>7.3f}ms | {row['match']}"
+            )
+
+    def _seed(self, size: int, rng: random.Random) -> None:
+        User = get_user_model()
+        q = Decimal("0.000001")
+        run_tag = rng.getrandbits(32)
+
+        for start in range(0, size, BATCH_SIZE):
+            end = min(size, start + BATCH_SIZE)
+            users = User.objects.bulk_create(
+                [
+                    User(email=f"bench-{run_tag}-{i}@example.invalid", password="!")
+                    for i in range(start, end)
+                ]
+            )
+            teachers = []
+            for i, user in zip(range(start, end), users):
+                lat = Decimal(rng.uniform(*KR_LAT_RANGE)).quantize(q)
+                lng = Decimal(rng.uniform(*KR_LNG_RANGE)).quantize(q)
+                teachers.append(
+                    TeacherApplication(
+                        user=user,
+                        first_name="Bench",
+                        last_name=str(i),
+                        nationality="OTHER",
+                        native_language="ENGLISH",
+                        email=user.email,
+                        phone_number="010-0000-0000",
+                        address_line1="-",
+                        city="-",
+                        district="-",
+                        latitude=lat,
+                        longitude=lng,
+                        # bulk_create 는 save() 를 거치지 않으므로 직접 계산
+                        geo_cell=cell_key_or_none(lat, lng),
+                        visa_type="OTHER",
+                        teaching_languages="English",
+                        self_introduction="-",
+                        education_history="-",
+                        experience_history="-",
+                        status=ApplicationStatusChoices.ACCEPTED,
+                    )
+                )
+            TeacherApplication.objects.bulk_create(teachers)
+
+    def _run(self, centers, radius_km: float) -> dict:
+        started = time.perf_counter()
+        index = TeacherSpatialIndex(load_accepted_teacher_points())
+        build_ms = (time.perf_counter() - started) * 1000
+
+        orm_ms, index_ms = [], []
+        mismatches = 0
+        for lat, lng in centers:
+            started = time.perf_counter()
+            orm_ids = set(
+                teachers_within_radius(
+                    center_lat=lat, center_lng=lng, radius_km=radius_km
+                )
+                .filter(status=ApplicationStatusChoices.ACCEPTED)
+                .values_list("id", flat=True)
+            )
+            orm_ms.append((time.perf_counter() - started) * 1000)
+
+            started = time.perf_counter()
+            index_ids = {pk for pk, _ in index.query_radius(lat, lng, radius_km)}
+            index_ms.append((time.perf_counter() - started) * 1000)
+
+            if orm_ids != index_ids:
+                mismatches += 1
+
+        return {
+            "build_ms": build_ms,
+            "orm_p50": statistics.median(orm_ms),
+            "orm_p99": _percentile(orm_ms, 99),
+            "index_p50": statistics.median(index_ms),
+            "index_p99": _percentile(index_ms, 99),
+            "match": "ok" if not mismatches else f"{mismatches} differ",
+        }
+
+
+# python manage.py benchmark_teacher_geo --sizes 10000 100000 1000000 --queries 50
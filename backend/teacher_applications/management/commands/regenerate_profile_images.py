@@ -0,0 +1,239 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from config.cache import invalidate_tags
+from teacher_applications.images import (
+    claim_profile_images_for_regeneration,
+    delete_stored_images,
+    derivative_formats,
+    derivative_sizes,
+    derivatives_outdated,
+    render_profile_image_bytes,
+    store_rendered_images,
+    stored_image_names,
+)
+from teacher_applications.models import ProfileImageStatusChoices, TeacherApplication
+
+# 재생성 대상 판단 / 결과 반영에 필요한 컬럼만 로드
+_LOAD_FIELDS = (
+    "id",
+    "profile_image",
+    "profile_image_thumbnail",
+    "profile_image_derivatives",
+)
+_UPDATE_FIELDS = (
+    "profile_image_thumbnail",
+    "profile_image_derivatives",
+    "profile_image_width",
+    "profile_image_height",
+    "profile_image_format",
+    "profile_image_filesize",
+    "profile_image_status",
+    "profile_image_claimed_at",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerate profile image thumbnails, WebP/JPEG derivatives and metadata for "
+        "existing TeacherApplication rows. Pillow decode/resize/encode runs in a "
+        "process pool and results are written back with bulk_update per chunk. "
+        "Rows that are PENDING/PROCESSING (run_image_worker) are skipped; the rest "
+        "are claimed as PROCESSING while they are rendered."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate every profile image, even if derivatives are up to date",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=100,
+            help="Rows per chunk (one bulk_update per chunk)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Processes for Pillow work (default: all cores)",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            default=0,
+            help="Only rows with id greater than this",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default="",
+            help="File storing the last finished id; resumes from it when present",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the rows that would be regenerated",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = max(1, options["chunk_size"])
+        checkpoint = Path(options["checkpoint"]) if options["checkpoint"] else None
+
+        start_after = options["start_after"]
+        if checkpoint and checkpoint.exists():
+            try:
+                start_after = max(start_after, int(checkpoint.read_text().strip() or 0))
+            except ValueError:
+                raise CommandError(f"Invalid checkpoint file: {checkpoint}")
+            self.stdout.write(f"Resuming after id={start_after}")
+
+        ids = (
+            TeacherApplication.objects.exclude(profile_image="")
+            .exclude(profile_image__isnull=True)
+            .filter(id__gt=start_after)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+        sizes = derivative_sizes()
+        formats = derivative_formats()
+        totals = {"scanned": 0, "regenerated": 0, "skipped": 0, "failed": 0}
+        started = time.perf_counter()
+
+        executor = None
+        if not options["dry_run"]:
+            # spawn/forkserver 에서도 worker 가 모델을 import 할 수 있도록 django.setup
+            executor = ProcessPoolExecutor(
+                max_workers=max(1, options["workers"]), initializer=django.setup
+            )
+        try:
+            chunk = []
+            for app_id in ids.iterator(chunk_size=chunk_size):
+                chunk.append(app_id)
+                if len(chunk) >= chunk_size:
+                    self._run_chunk(chunk, executor, sizes, formats, options, totals)
+                    self._save_checkpoint(checkpoint, chunk[-1], options)
+                    self._report(totals, started)
+                    chunk = []
+            if chunk:
+                self._run_chunk(chunk, executor, sizes, formats, options, totals)
+                self._save_checkpoint(checkpoint, chunk[-1], options)
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"Done: {self._summary(totals, started)}"))
+
+    def _run_chunk(self, ids, executor, sizes, formats, options, totals):
+        apps = list(
+            TeacherApplication.objects.filter(id__in=ids).only(*_LOAD_FIELDS).order_by("id")
+        )
+        totals["scanned"] += len(apps)
+        if not options["all"]:
+            apps = [app for app in apps if derivatives_outdated(app)]
+        totals["skipped"] += len(ids) - len(apps)
+        if not apps:
+            return
+        if options["dry_run"]:
+            totals["regenerated"] += len(apps)
+            return
+
+        # run_image_worker 와 같은 row 를 동시에 render 하지 않도록 PROCESSING 으로 점유
+        claimed, claimed_at = claim_profile_images_for_regeneration(
+            [app.pk for app in apps], fields=_LOAD_FIELDS
+        )
+        totals["skipped"] += len(apps) - len(claimed)
+        if not claimed:
+            return
+
+        # 원본 읽기(I/O)는 이 프로세스에서, decode/resize/encode(CPU)는 process pool 에서
+        jobs, failed = [], []
+        for app, prior_status in claimed:
+            source_name = app.profile_image.name
+            try:
+                with app.profile_image.storage.open(source_name, "rb") as fh:
+                    data = fh.read()
+            except Exception as exc:
+                self.stderr.write(f"id={app.pk}: cannot read {source_name}: {exc}")
+                failed.append((app, prior_status))
+                continue
+            future = executor.submit(render_profile_image_bytes, data, sizes, formats)
+            jobs.append((app, prior_status, source_name, len(data), future))
+
+        done = []
+        for app, prior_status, source_name, filesize, future in jobs:
+            try:
+                fields = store_rendered_images(app, source_name, future.result(), filesize)
+            except Exception as exc:
+                self.stderr.write(f"id={app.pk}: {type(exc).__name__}: {exc}")
+                failed.append((app, prior_status))
+                continue
+            old_names = stored_image_names(app)
+            for name, value in fields.items():
+                setattr(app, name, value)
+            done.append((app, source_name, old_names))
+
+        with transaction.atomic():
+            # 점유가 유지된 row 만 반영 (처리 도중 원본이 교체되면 save() 가 PENDING 으로 바꿈
+            # → run_image_worker 가 새 원본을 처리)
+            owned = {
+                pk: name
+                for pk, name in TeacherApplication.objects.select_for_update()
+                .filter(
+                    id__in=[app.pk for app, _ in claimed],
+                    profile_image_status=ProfileImageStatusChoices.PROCESSING,
+                    profile_image_claimed_at=claimed_at,
+                )
+                .values_list("id", "profile_image")
+            }
+            stale = [app for app, source, _ in done if owned.get(app.pk) != source]
+            done = [item for item in done if owned.get(item[0].pk) == item[1]]
+            TeacherApplication.objects.bulk_update(
+                [app for app, _, _ in done], _UPDATE_FIELDS
+            )
+            # 실패해도 기존 썸네일/파생 이미지는 그대로 유효 → 점유 전 상태로 되돌림
+            for prior_status in {prior for _, prior in failed}:
+                TeacherApplication.objects.filter(
+                    id__in=[
+                        app.pk for app, prior in failed if prior == prior_status
+                    ],
+                    profile_image_status=ProfileImageStatusChoices.PROCESSING,
+                    profile_image_claimed_at=claimed_at,
+                ).update(
+                    profile_image_status=prior_status, profile_image_claimed_at=None
+                )
+            # bulk_update / update 는 post_save 가 없음 → 직접 invalidate (커밋 이후)
+            transaction.on_commit(lambda: invalidate_tags("teacher_applications"))
+
+        for app in stale:
+            delete_stored_images(stored_image_names(app))
+        for app, _, old_names in done:
+            delete_stored_images(old_names)
+
+        totals["regenerated"] += len(done)
+        totals["failed"] += len(failed)
+        totals["skipped"] += len(stale)
+
+    def _save_checkpoint(self, checkpoint, last_id, options):
+        if checkpoint and not options["dry_run"]:
+            checkpoint.write_text(str(last_id))
+
+    def _summary(self, totals, started):
+        elapsed = time.perf_counter() - started
+        rate = totals["regenerated"] / elapsed if elapsed > 0 else 0.0
+        counts = " ".join(f"{key}={value}" for key, value in totals.items())
+        return f"{counts} elapsed={elapsed:.1f}s rate={rate:.1f} images/s"
+
+    def _report(self, totals, started):
+        self.stdout.write(self._summary(totals, started))
+
+
+# python manage.py regenerate_profile_images --workers 8 --checkpoint /tmp/regen.ckpt
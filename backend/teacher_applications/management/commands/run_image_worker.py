@@ -0,0 +1,63 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from teacher_applications.images import (
+    claim_pending_profile_images,
+    process_profile_image,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate profile image thumbnails/metadata for TeacherApplication rows "
+        "marked PENDING by the upload request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=getattr(settings, "PROFILE_IMAGE_WORKER_BATCH_SIZE", 20),
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=getattr(settings, "PROFILE_IMAGE_WORKER_POLL_SECONDS", 2.0),
+            help="Seconds to sleep when nothing is pending",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process currently pending images and exit",
+        )
+
+    def handle(self, *args, **options):
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        totals = {}
+        while not self._stopping:
+            apps = claim_pending_profile_images(options["batch_size"])
+            if not apps:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            for app in apps:
+                result = str(process_profile_image(app) or "SKIPPED")
+                totals[result] = totals.get(result, 0) + 1
+            self.stdout.write(f"processed={len(apps)} totals={totals}")
+
+        self.stdout.write(self.style.SUCCESS(f"Stopped: {totals}"))
+
+    def _stop(self, signum, frame):
+        # 진행 중인 배치는 마저 처리하고 종료
+        self._stopping = True
+
+
+# python manage.py run_image_worker
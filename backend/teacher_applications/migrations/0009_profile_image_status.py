@@ -0,0 +1,54 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:47
+
+from django.db import migrations, models
+
+
+def set_initial_profile_image_status(apps, schema_editor):
+    """기존 row: 썸네일이 있으면 READY, 원본만 있으면 워커가 처리하도록 PENDING."""
+    TeacherApplication = apps.get_model("teacher_applications", "TeacherApplication")
+    with_image = TeacherApplication.objects.exclude(profile_image="")
+    with_image.exclude(profile_image_thumbnail__isnull=True).exclude(
+        profile_image_thumbnail=""
+    ).update(profile_image_status="READY")
+    with_image.filter(profile_image_status="").update(profile_image_status="PENDING")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teacher_applications", "0008_teacherapplication_geo_cell"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="teacherapplication",
+            name="profile_image_claimed_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="Profile image worker claimed at",
+            ),
+        ),
+        migrations.AddField(
+            model_name="teacherapplication",
+            name="profile_image_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("PENDING", "Pending / 처리 대기"),
+                    ("PROCESSING", "Processing / 처리 중"),
+                    ("READY", "Ready / 완료"),
+                    ("FAILED", "Failed / 실패"),
+                ],
+                db_index=True,
+                default="",
+                editable=False,
+                max_length=10,
+                verbose_name="Profile image processing status / 프로필 이미지 처리 상태",
+            ),
+        ),
+        migrations.RunPython(
+            set_initial_profile_image_status, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-17 03:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teacher_applications", "0009_profile_image_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="teacherapplication",
+            name="profile_image_derivatives",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                editable=False,
+                verbose_name="Profile image derivatives / 프로필 파생 이미지",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-17 04:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teacher_applications", "0010_teacherapplication_profile_image_derivatives"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="teacherapplication",
+            index=models.Index(
+                fields=["status", "created_at", "id"], name="ta_status_created_idx"
+            ),
+        ),
+    ]
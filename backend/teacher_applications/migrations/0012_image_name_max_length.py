@@ -0,0 +1,57 @@
+# Generated by Django 5.2.9 on 2026-10-17 05:11
+
+import django.core.validators
+import teacher_applications.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teacher_applications", "0011_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="teacherapplication",
+            name="profile_image",
+            field=models.ImageField(
+                max_length=255,
+                upload_to="teacher_applications/profile_images/",
+                validators=[
+                    teacher_applications.models.validate_image_size_under_2mb,
+                    django.core.validators.FileExtensionValidator(
+                        ["jpg", "jpeg", "png"]
+                    ),
+                ],
+                verbose_name="Profile image (2MB max, JPG/PNG) / 프로필 이미지 (최대 2MB, JPG/PNG)",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="teacherapplication",
+            name="profile_image_thumbnail",
+            field=models.ImageField(
+                blank=True,
+                editable=False,
+                max_length=255,
+                null=True,
+                upload_to="teacher_applications/profile_images/thumbnails/",
+                verbose_name="Profile image thumbnail / 프로필 썸네일",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="teacherapplication",
+            name="visa_scan",
+            field=models.ImageField(
+                max_length=255,
+                upload_to="teacher_applications/visa_scans/",
+                validators=[
+                    teacher_applications.models.validate_image_size_under_2mb,
+                    django.core.validators.FileExtensionValidator(
+                        ["jpg", "jpeg", "png"]
+                    ),
+                ],
+                verbose_name="Visa copy (2MB max, JPG/PNG) / 비자 사본 (최대 2MB, JPG/PNG)",
+            ),
+        ),
+    ]
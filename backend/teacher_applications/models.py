@@ -4,15 +4,13 @@ from django.core.validators import FileExtensionValidator, URLValidator
 from django.db import models
 from datetime import date
 
-from django.core.files.base import ContentFile
-from PIL import Image, ImageOps
-import io
-import os
 from urllib.parse import urlparse
 
-from django.db.models.signals import post_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+from .geo_cells import cell_key_or_none
+
 # ✅ added
 from django.core.validators import MinValueValidator, MaxValueValidator
 
@@ -119,6 +117,26 @@ class ApplicationStatusChoices(models.TextChoices):
     REJECTED = "REJECTED", "Rejected / 불합격"
 
 
+class ProfileImageStatusChoices(models.TextChoices):
+    PENDING = "PENDING", "Pending / 처리 대기"
+    PROCESSING = "PROCESSING", "Processing / 처리 중"
+    READY = "READY", "Ready / 완료"
+    FAILED = "FAILED", "Failed / 실패"
+
+
+# run_image_worker 가 채우는 파생 필드 (일반 save() 에서는 덮어쓰지 않음)
+PROFILE_IMAGE_DERIVED_FIELDS = (
+    "profile_image_thumbnail",
+    "profile_image_derivatives",
+    "profile_image_width",
+    "profile_image_height",
+    "profile_image_format",
+    "profile_image_filesize",
+    "profile_image_status",
+    "profile_image_claimed_at",
+)
+
+
 class TeacherApplication(models.Model):
     """
     Foreign language teacher resume application.
@@ -138,6 +156,7 @@ class TeacherApplication(models.Model):
 
     profile_image = models.ImageField(
         upload_to="teacher_applications/profile_images/",
+        max_length=255,
         validators=[
             validate_image_size_under_2mb,
             FileExtensionValidator(["jpg", "jpeg", "png"]),
@@ -147,11 +166,20 @@ class TeacherApplication(models.Model):
 
     profile_image_thumbnail = models.ImageField(
         upload_to="teacher_applications/profile_images/thumbnails/",
+        max_length=255,
         blank=True,
         null=True,
         editable=False,
         verbose_name="Profile image thumbnail / 프로필 썸네일",
     )
+    # 해상도/포맷별 파생 이미지 (srcset 용)
+    # [{"size": 256, "format": "webp", "width": 256, "height": 192, "name": "..."}, ...]
+    profile_image_derivatives = models.JSONField(
+        blank=True,
+        default=list,
+        editable=False,
+        verbose_name="Profile image derivatives / 프로필 파생 이미지",
+    )
 
     profile_image_width = models.PositiveIntegerField(
         blank=True,
@@ -177,6 +205,22 @@ class TeacherApplication(models.Model):
         editable=False,
         verbose_name="Profile image file size (bytes)",
     )
+    # 썸네일/메타 후처리 상태 (run_image_worker 가 PENDING → PROCESSING → READY/FAILED)
+    profile_image_status = models.CharField(
+        max_length=10,
+        choices=ProfileImageStatusChoices.choices,
+        blank=True,
+        default="",
+        editable=False,
+        db_index=True,
+        verbose_name="Profile image processing status / 프로필 이미지 처리 상태",
+    )
+    profile_image_claimed_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name="Profile image worker claimed at",
+    )
 
     first_name = models.CharField(
         max_length=50,
@@ -264,6 +308,14 @@ class TeacherApplication(models.Model):
         verbose_name="Longitude / 경도",
         help_text="e.g. 127.081270 (WGS84). Optional for now. / 예: 127.081270 (선택)",
     )
+    # 위경도에서 파생되는 공간 격자 셀 key (save 시 자동 계산, 반경 검색 cell IN 조회용)
+    geo_cell = models.BigIntegerField(
+        blank=True,
+        null=True,
+        editable=False,
+        db_index=True,
+        verbose_name="Geo cell / 공간 셀",
+    )
 
     # --- 2. 비자 정보 (Visa Information / 비자 정보) ---
 
@@ -279,6 +331,7 @@ class TeacherApplication(models.Model):
     )
     visa_scan = models.ImageField(
         upload_to="teacher_applications/visa_scans/",
+        max_length=255,
         validators=[
             validate_image_size_under_2mb,
             FileExtensionValidator(["jpg", "jpeg", "png"]),
@@ -440,88 +493,101 @@ class TeacherApplication(models.Model):
         help_text="e.g. https://youtu.be/kkkUVYjxN1U?si=... / 예: 유튜브 소개 영상 링크",
     )
 
-    def _generate_profile_thumbnail_and_meta(self):
-        """
-        - 썸네일: 256x256 (비율 유지, 긴 변 기준 thumbnail)
-        - 포맷: JPEG로 통일 (프론트에서 다루기 쉬움)
-        """
-        if not self.profile_image:
-            return
-
-        # 원본 파일명 기반으로 썸네일 파일명 생성
-        base, _ext = os.path.splitext(os.path.basename(self.profile_image.name))
-        thumb_name = f"{base}_thumb.jpg"
-
-        # Pillow로 열기
-        self.profile_image.open("rb")
-        with Image.open(self.profile_image) as img:
-            img = ImageOps.exif_transpose(img)  # 회전 EXIF 보정
-            self.profile_image_format = (img.format or "").upper()
-
-            # 메타 저장(원본 기준)
-            self.profile_image_width, self.profile_image_height = img.size
-
-            # 썸네일 생성
-            img = img.convert("RGB")
-            img.thumbnail((256, 256), Image.Resampling.LANCZOS)
-
-            buffer = io.BytesIO()
-            img.save(buffer, format="JPEG", quality=85, optimize=True)
-            buffer.seek(0)
-
-        # filesize 저장(원본)
-        try:
-            self.profile_image_filesize = self.profile_image.size
-        except Exception:
-            # 스토리지/환경에 따라 size 접근이 실패할 수 있어 방어적으로 처리
-            self.profile_image_filesize = None
-
-        # 기존 썸네일이 있으면 삭제(파일 교체 시 찌꺼기 방지)
-        if self.profile_image_thumbnail and self.profile_image_thumbnail.name:
-            try:
-                self.profile_image_thumbnail.delete(save=False)
-            except Exception:
-                pass
-
-        self.profile_image_thumbnail.save(
-            thumb_name,
-            ContentFile(buffer.getvalue()),
-            save=False,
-        )
+    def _non_derived_field_names(self) -> list[str]:
+        return [
+            f.name
+            for f in self._meta.concrete_fields
+            if not f.primary_key and f.name not in PROFILE_IMAGE_DERIVED_FIELDS
+        ]
 
     def save(self, *args, **kwargs):
+        self.geo_cell = cell_key_or_none(self.latitude, self.longitude)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geo_cell"}
+
         # profile_image 변경 여부 확인(기존 레코드가 있을 때만)
         old_profile_name = None
+        old_profile_status = ""
+        exists = False
         if self.pk:
             try:
-                old_profile_name = (
+                row = (
                     TeacherApplication.objects.filter(pk=self.pk)
-                    .values_list("profile_image", flat=True)
+                    .values_list("profile_image", "profile_image_status")
                     .first()
                 )
+                exists = row is not None
+                if row:
+                    old_profile_name = row[0] or None
+                    old_profile_status = row[1]
             except Exception:
                 old_profile_name = None
 
-        super().save(*args, **kwargs)
-
         # 새 업로드/변경 시에만 생성 (또는 썸네일이 없으면 생성)
+        # → 요청 안에서는 PENDING 표시만 하고 실제 처리는 run_image_worker 가 담당
         new_profile_name = self.profile_image.name if self.profile_image else None
-        should_regenerate = new_profile_name and (
-            old_profile_name != new_profile_name or not self.profile_image_thumbnail
+        should_regenerate = bool(new_profile_name) and (
+            old_profile_name != new_profile_name
+            or (
+                not self.profile_image_thumbnail
+                and self.profile_image_status
+                not in (
+                    ProfileImageStatusChoices.PENDING,
+                    ProfileImageStatusChoices.PROCESSING,
+                )
+            )
         )
-
         if should_regenerate:
-            self._generate_profile_thumbnail_and_meta()
-            super().save(
-                update_fields=[
-                    "profile_image_thumbnail",
+            self.profile_image_status = ProfileImageStatusChoices.PENDING
+            self.profile_image_claimed_at = None
+            changed = {"profile_image_status", "profile_image_claimed_at"}
+            # 업로드 검사(uploads.inspect_image)에서 헤더로 읽은 메타는 바로 저장
+            # → 워커 처리 전에도 크기/포맷 제공, 같은 파일을 다시 열지 않음
+            upload = getattr(self.profile_image, "_file", None)
+            meta = getattr(upload, "image_meta", None)
+            if meta:
+                self.profile_image_width = meta["width"]
+                self.profile_image_height = meta["height"]
+                self.profile_image_format = meta["format"]
+                self.profile_image_filesize = meta["size"]
+                changed |= {
                     "profile_image_width",
                     "profile_image_height",
                     "profile_image_format",
                     "profile_image_filesize",
-                ]
+                }
+            if update_fields is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], *changed}
+            elif exists:
+                # 썸네일/파생 이미지는 워커가 교체하면서 기존 파일을 정리하므로 덮어쓰지 않음
+                kwargs["update_fields"] = [*self._non_derived_field_names(), *changed]
+        elif exists and update_fields is None:
+            # 원본이 그대로면 워커가 채우는 파생 필드는 덮어쓰지 않음
+            # (워커 처리 전에 읽어 둔 인스턴스를 저장해도 썸네일/상태가 되돌아가지 않도록)
+            kwargs["update_fields"] = self._non_derived_field_names()
+
+        super().save(*args, **kwargs)
+
+        if (
+            should_regenerate
+            and old_profile_status == ProfileImageStatusChoices.READY
+            and self.profile_image.name == old_profile_name
+        ):
+            # content-addressed 스토리지: 같은 내용을 다시 올리면 이름이 그대로 → 썸네일도 그대로 사용
+            should_regenerate = False
+            self.profile_image_status = ProfileImageStatusChoices.READY
+            TeacherApplication.objects.filter(pk=self.pk).update(
+                profile_image_status=ProfileImageStatusChoices.READY
             )
 
+        if should_regenerate and not getattr(
+            settings, "PROFILE_IMAGE_ASYNC_PROCESSING", True
+        ):
+            from .images import process_profile_image
+
+            process_profile_image(self)
+
         # ✅ profile_image가 새 파일로 교체된 경우: 기존 원본 파일도 스토리지에서 삭제
         # (주의) self.profile_image.delete()를 호출하면 "현재" 파일(새 파일)을 지울 수 있어
         #        old 파일명으로 스토리지에서 직접 삭제합니다.
@@ -566,12 +632,30 @@ class TeacherApplication(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["latitude", "longitude"], name="ta_lat_lng_idx"),
+            # keyset pagination (admin 목록: status 필터 + created_at, id 정렬)
+            models.Index(
+                fields=["status", "created_at", "id"], name="ta_status_created_idx"
+            ),
         ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.email})"
 
 
+def get_teacher_application(user) -> TeacherApplication | None:
+    """
+    user 의 이력서 (없으면 None).
+    user.teacher_application 은 "없음"까지 user 인스턴스에 cache 되므로
+    request.user 로 여러 번 호출해도 요청당 조회 1회.
+    """
+    if user is None or not user.is_authenticated:
+        return None
+    try:
+        return user.teacher_application
+    except TeacherApplication.DoesNotExist:
+        return None
+
+
 def _safe_delete_file_field(file_field) -> None:
     """
     FileField/ImageField가 가리키는 스토리지 파일을 안전하게 삭제.
@@ -601,6 +685,14 @@ def teacher_application_delete_files(sender, instance: TeacherApplication, **kwa
     (Admin 삭제 / queryset.delete / cascade 등 모든 삭제 경로에 적용)
     """
     _safe_delete_file_field(instance.profile_image_thumbnail)
+    storage = instance.profile_image_thumbnail.field.storage
+    for item in instance.profile_image_derivatives or []:
+        if item.get("thumbnail"):
+            continue  # 썸네일 파일을 가리키는 항목 (위에서 이미 삭제)
+        try:
+            storage.delete(item["name"])
+        except Exception:
+            pass
     _safe_delete_file_field(instance.profile_image)
     _safe_delete_file_field(instance.visa_scan)
 
@@ -613,19 +705,32 @@ def teacher_application_delete_replaced_files(
     수정 시 파일이 '교체'되는 경우, 예전 파일이 스토리지에 남지 않도록 삭제.
     - profile_image는 기존 save()에서 old_profile_name 삭제 로직이 있으니
       여기서는 visa_scan 교체 케이스만 보완(필요 시 확장 가능).
+    - 실제 삭제는 새 파일 저장 이후(post_save)에 수행
+      (content-addressed 스토리지에서 같은 내용을 다시 올릴 때 참조 카운트가 먼저 0 이 되지 않도록)
     """
+    instance._replaced_visa_name = None
     if not instance.pk:
         return
 
-    try:
-        old = TeacherApplication.objects.get(pk=instance.pk)
-    except TeacherApplication.DoesNotExist:
-        return
-
-    old_visa = getattr(old.visa_scan, "name", None)
+    old_visa = (
+        TeacherApplication.objects.filter(pk=instance.pk)
+        .values_list("visa_scan", flat=True)
+        .first()
+    )
     new_visa = getattr(instance.visa_scan, "name", None)
     if old_visa and old_visa != new_visa:
-        try:
-            old.visa_scan.storage.delete(old_visa)
-        except Exception:
-            pass
+        instance._replaced_visa_name = old_visa
+
+
+@receiver(post_save, sender=TeacherApplication)
+def teacher_application_delete_replaced_files_after_save(
+    sender, instance: TeacherApplication, **kwargs
+):
+    old_visa = getattr(instance, "_replaced_visa_name", None)
+    if not old_visa:
+        return
+    instance._replaced_visa_name = None
+    try:
+        instance.visa_scan.storage.delete(old_visa)
+    except Exception:
+        pass
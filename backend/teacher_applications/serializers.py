@@ -1,6 +1,15 @@
 from rest_framework import serializers
 from datetime import date
+from django.core.exceptions import ValidationError as DjangoValidationError
+
+from .direct_uploads import (
+    DIRECT_UPLOAD_FIELDS,
+    DirectUploadUnavailable,
+    finalize_upload,
+)
+from .images import build_srcset
 from .models import TeacherApplication
+from .uploads import InspectedImageField
 import json  # ✅ added
 
 
@@ -10,22 +19,37 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
     외국인 어학 강사 이력서 지원서 Serializer
     """
 
-    profile_image = serializers.ImageField(
+    # 헤더만 검사 (uploads.InspectedImageField: 2MB / JPG·PNG / 해상도)
+    profile_image = InspectedImageField(
         write_only=False,
-        required=True,
+        required=False,
         help_text="Profile image (max 2MB, JPG/PNG) / 프로필 이미지 (최대 2MB, JPG/PNG)",
     )
     profile_image_thumbnail = serializers.ImageField(
         read_only=True,
         help_text="Profile image thumbnail / 프로필 썸네일",
     )
+    # 포맷별 srcset 문자열 {"webp": "url 64w, url 128w, ...", "jpeg": "..."}
+    profile_image_srcset = serializers.SerializerMethodField(read_only=True)
 
-    visa_scan = serializers.ImageField(
+    visa_scan = InspectedImageField(
         write_only=False,
-        required=True,
+        required=False,
         help_text="Visa copy (max 2MB, JPG/PNG) / 비자 사본 (최대 2MB, JPG/PNG)",
     )
 
+    # 버킷 직접 업로드(direct_uploads.issue_upload) 토큰 — 파일 대신 전송하면 업로드된 객체를 연결
+    profile_image_upload = serializers.CharField(
+        write_only=True,
+        required=False,
+        help_text="Direct upload token for profile_image / 프로필 이미지 직접 업로드 토큰",
+    )
+    visa_scan_upload = serializers.CharField(
+        write_only=True,
+        required=False,
+        help_text="Direct upload token for visa_scan / 비자 사본 직접 업로드 토큰",
+    )
+
     # 읽기 전용 필드로 추가 정보 제공
     age = serializers.SerializerMethodField(read_only=True)
     is_visa_expiring_soon = serializers.SerializerMethodField(read_only=True)
@@ -35,7 +59,10 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TeacherApplication
-        fields = "__all__"
+        # 이전의 fields = "__all__" 과 같음 (새 모델 컬럼은 자동으로 포함) — 단,
+        # 워커 내부용 점유 시각(profile_image_claimed_at)은 API 에 노출하지 않음.
+        # 이 serializer 를 상속하는 TeacherApplicationListSerializer 의 ?fields= 선택지에서도 빠짐
+        exclude = ("profile_image_claimed_at",)
         read_only_fields = (
             "id",
             "user",
@@ -47,10 +74,13 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
             "memo",
             "evaluation_result",
             "profile_image_thumbnail",
+            "profile_image_derivatives",
+            "profile_image_srcset",
             "profile_image_width",
             "profile_image_height",
             "profile_image_format",
             "profile_image_filesize",
+            "profile_image_status",
         )
 
     # -------------------------------
@@ -70,6 +100,21 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
             )
         return None
 
+    def get_profile_image_srcset(self, obj):
+        """파생 이미지(profile_image_derivatives)로 포맷별 srcset 생성"""
+        if not obj.profile_image_derivatives:
+            return {}
+
+        storage = obj.profile_image_thumbnail.field.storage
+        request = self.context.get("request")
+
+        def url_for(name):
+            url = storage.url(name)
+            # S3 는 절대 URL, 로컬 MEDIA_URL 은 상대 경로 → ImageField 와 동일하게 절대화
+            return request.build_absolute_uri(url) if request else url
+
+        return build_srcset(obj.profile_image_derivatives, url_for)
+
     def get_is_visa_expiring_soon(self, obj):
         """비자가 3개월 이내 만료인지 확인"""
         if obj.visa_expiry_date:
@@ -183,7 +228,23 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
                     "해당 동의는 지원서를 제출하기 위해 반드시 필요합니다."
                 )
 
-        # === 3. 기본 이미지 필수 확인 ===
+        # === 3. 직접 업로드 토큰 → 업로드된 객체 연결 (finalize) ===
+        for field in DIRECT_UPLOAD_FIELDS:
+            token = attrs.pop(f"{field}_upload", None)
+            if not token:
+                continue
+            if attrs.get(field):
+                errors[field] = (
+                    "Send either a file or an upload token, not both. "
+                    "파일과 업로드 토큰 중 하나만 보내 주세요."
+                )
+                continue
+            try:
+                attrs[field] = finalize_upload(user, field, token)
+            except (DjangoValidationError, DirectUploadUnavailable) as exc:
+                errors[field] = " ".join(getattr(exc, "messages", [str(exc)]))
+
+        # === 4. 기본 이미지 필수 확인 ===
         if self.instance is None:  # create일 때만
             if not attrs.get("profile_image"):
                 errors["profile_image"] = (
@@ -192,7 +253,7 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
             if not attrs.get("visa_scan"):
                 errors["visa_scan"] = "Visa copy is required. 비자 사본은 필수입니다."
 
-        # === 4. 비자 만료일 검증 ===
+        # === 5. 비자 만료일 검증 ===
         if attrs.get("visa_expiry_date"):
             if attrs["visa_expiry_date"] <= date.today():
                 errors["visa_expiry_date"] = (
@@ -200,7 +261,7 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
                     "비자 만료일은 미래 날짜여야 합니다."
                 )
 
-        # === 5. 근무 경력 검증 ===
+        # === 6. 근무 경력 검증 ===
         total_exp = attrs.get("total_teaching_experience_years", 0) or 0
         korea_exp = attrs.get("korea_teaching_experience_years", 0) or 0
         if korea_exp > total_exp:
@@ -239,3 +300,85 @@ class TeacherApplicationSerializer(serializers.ModelSerializer):
             validated_data["user"] = user
 
         return super().create(validated_data)
+
+
+class TeacherApplicationListSerializer(TeacherApplicationSerializer):
+    """
+    관리자 목록(table/card view)용 slim serializer.
+
+    - 기본: LIST_FIELDS 만 직렬화 (self_introduction / education_history 등 대용량 TextField 제외)
+    - ?fields=a,b,c: TeacherApplicationSerializer 의 읽기 필드 중 원하는 것만 선택
+    - model_columns(): 선택된 필드에 필요한 DB 컬럼 → view 에서 queryset.only() 로 사용
+    """
+
+    LIST_FIELDS = (
+        "id",
+        "first_name",
+        "last_name",
+        "korean_name",
+        "gender",
+        "age",
+        "nationality",
+        "teaching_languages",
+        "city",
+        "district",
+        "visa_type",
+        "visa_expiry_date",
+        "is_visa_expiring_soon",
+        "status",
+        "profile_image_thumbnail",
+        "created_at",
+    )
+    # 계산 필드(SerializerMethodField) → 읽는 모델 컬럼
+    SOURCE_COLUMNS = {
+        "age": ("date_of_birth",),
+        "is_visa_expiring_soon": ("visa_expiry_date",),
+        "profile_image_srcset": ("profile_image_derivatives", "profile_image_thumbnail"),
+    }
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = set(fields or self.LIST_FIELDS)
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+
+    @classmethod
+    def selectable_fields(cls) -> list[str]:
+        """?fields= 로 선택 가능한 필드 (write_only 제외)"""
+        return [
+            name
+            for name, field in TeacherApplicationSerializer().fields.items()
+            if not field.write_only
+        ]
+
+    @classmethod
+    def parse_fields(cls, raw: str | None) -> tuple[str, ...]:
+        """
+        ?fields= 값 파싱. 비어 있으면 LIST_FIELDS.
+        raises: serializers.ValidationError (알 수 없는 필드)
+        """
+        if not raw:
+            return cls.LIST_FIELDS
+        requested = [name.strip() for name in raw.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(cls.selectable_fields()))
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": f"Unknown fields: {', '.join(unknown)}. 알 수 없는 필드입니다."}
+            )
+        # id 는 항상 포함 (목록 key / 상세 조회 링크)
+        return tuple(dict.fromkeys(["id", *requested]))
+
+    @classmethod
+    def model_columns(cls, fields) -> list[str]:
+        """직렬화에 필요한 모델 컬럼 (queryset.only() 인자)"""
+        concrete = {
+            field.name
+            for field in TeacherApplication._meta.concrete_fields
+        }
+        columns = []
+        for name in fields:
+            for column in cls.SOURCE_COLUMNS.get(name, (name,)):
+                if column in concrete and column not in columns:
+                    columns.append(column)
+        return columns
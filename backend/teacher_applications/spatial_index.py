@@ -0,0 +1,228 @@
+# backend/teacher_applications/spatial_index.py
+"""
+ACCEPTED 강사 좌표에 대한 프로세스 내(in-memory) 격자 공간 인덱스.
+
+- 첫 조회 시 lazy build, TeacherApplication 저장/삭제 시 invalidate
+- 다른 gunicorn worker에서 발생한 변경은 signal이 닿지 않으므로
+  TEACHER_GEO_INDEX_MAX_AGE_SECONDS 가 지나면 다시 build
+- 반경 조회: 셀 단위 후보 추출 → 후보에 대해서만 정확한 거리 검사(geo_batch)
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Iterable
+
+import numpy as np
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .geo_batch import TeacherCoordinates, cell_keys_array
+from .geo_cells import cell_row_col, cells_within_radius, ring_cells, ring_covered_km
+from .models import ApplicationStatusChoices, TeacherApplication
+
+
+class TeacherSpatialIndex:
+    """
+    격자 셀 key -> 좌표 배열(TeacherCoordinates)의 행 번호 배열.
+    후보 행에 대해서만 geo_batch 의 벡터화 거리 계산을 수행.
+    """
+
+    def __init__(self, rows: Iterable[tuple[int, float, float, str]]):
+        rows = list(rows)
+        self.coords = TeacherCoordinates.from_points(
+            (pk, lat, lng) for pk, lat, lng, _ in rows
+        )
+        self.teaching_languages = np.array([lang for *_, lang in rows], dtype=str)
+        self.size = len(self.coords)
+
+        keys = cell_keys_array(self.coords.lat_deg, self.coords.lng_deg)
+        order = np.argsort(keys, kind="stable")
+        unique_keys, starts = np.unique(keys[order], return_index=True)
+        self._cells = {
+            int(key): rows
+            for key, rows in zip(unique_keys, np.split(order, starts[1:]))
+        }
+
+    def query_radius(
+        self, center_lat: float, center_lng: float, radius_km: float
+    ) -> list[tuple[int, float]]:
+        """반경 이내 (teacher_id, distance_km) 목록을 거리순으로 반환."""
+        buckets = [
+            self._cells[key]
+            for key in cells_within_radius(center_lat, center_lng, radius_km)
+            if key in self._cells
+        ]
+        if not buckets:
+            return []
+
+        rows = np.concatenate(buckets)
+        distances = self.coords.distances_km(center_lat, center_lng, rows=rows)
+        inside = np.flatnonzero(distances <= radius_km)
+        inside = inside[np.argsort(distances[inside], kind="stable")]
+        return [
+            (int(self.coords.ids[rows[i]]), float(distances[i])) for i in inside
+        ]
+
+    def query_nearest(
+        self,
+        center_lat: float,
+        center_lng: float,
+        k: int,
+        teaching_language: str | None = None,
+        max_radius_km: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        가까운 순 최대 k명의 (teacher_id, distance_km).
+
+        중심 셀에서 링(ring) 단위로 탐색 범위를 넓히다가 아래 중 하나면 중단.
+        - "누락 없이 보장되는 반경" 안에 조건을 만족하는 강사가 k명 모임
+        - 조건을 만족하는 강사를 모두 확인함
+        - 탐색한 셀 수가 강사가 있는 셀 수를 넘음 → 조건을 만족하는 전체 강사와 직접 거리 계산
+          (조건에 맞는 강사가 적고 멀리 있을 때 지구 전체 격자를 도는 것 방지)
+        """
+        if max_radius_km is not None and not (
+            math.isfinite(max_radius_km) and max_radius_km >= 0
+        ):
+            raise ValueError("max_radius_km must be a finite number >= 0")
+        if k <= 0 or self.size == 0:
+            return []
+
+        if teaching_language:
+            matching = int(np.count_nonzero(self.teaching_languages == teaching_language))
+        else:
+            matching = self.size
+        if matching == 0:
+            return []
+
+        row0, col0 = cell_row_col(center_lat, center_lng)
+        found_rows: list[np.ndarray] = []
+        found_distances: list[np.ndarray] = []
+        found = 0
+        scanned_cells = 0
+        ring = 0
+
+        while True:
+            keys = ring_cells(row0, col0, ring)
+            scanned_cells += len(keys)
+            buckets = [self._cells[key] for key in keys if key in self._cells]
+            if buckets:
+                rows = np.concatenate(buckets)
+                if teaching_language:
+                    rows = rows[self.teaching_languages[rows] == teaching_language]
+                if len(rows):
+                    found += len(rows)
+                    found_rows.append(rows)
+                    found_distances.append(
+                        self.coords.distances_km(center_lat, center_lng, rows=rows)
+                    )
+
+            if found >= matching:
+                break
+            covered_km = ring_covered_km(center_lat, center_lng, ring)
+            if max_radius_km is not None and covered_km >= max_radius_km:
+                break
+            if found_distances:
+                within = sum(
+                    int(np.count_nonzero(d <= covered_km)) for d in found_distances
+                )
+                if within >= k:
+                    break
+            if scanned_cells > len(self._cells):
+                return self._nearest_all(
+                    center_lat, center_lng, k, teaching_language, max_radius_km
+                )
+            ring += 1
+
+        if not found_rows:
+            return []
+
+        rows = np.concatenate(found_rows)
+        distances = np.concatenate(found_distances)
+        return self._select_nearest(rows, distances, k, max_radius_km)
+
+    def _nearest_all(
+        self,
+        center_lat: float,
+        center_lng: float,
+        k: int,
+        teaching_language: str | None,
+        max_radius_km: float | None,
+    ) -> list[tuple[int, float]]:
+        """셀 탐색 없이 조건을 만족하는 전체 강사와 거리 계산"""
+        if teaching_language:
+            rows = np.flatnonzero(self.teaching_languages == teaching_language)
+        else:
+            rows = np.arange(self.size)
+        distances = self.coords.distances_km(center_lat, center_lng, rows=rows)
+        return self._select_nearest(rows, distances, k, max_radius_km)
+
+    def _select_nearest(
+        self,
+        rows: np.ndarray,
+        distances: np.ndarray,
+        k: int,
+        max_radius_km: float | None,
+    ) -> list[tuple[int, float]]:
+        if max_radius_km is not None:
+            inside = distances <= max_radius_km
+            rows, distances = rows[inside], distances[inside]
+
+        order = np.argsort(distances, kind="stable")[:k]
+        return [
+            (int(self.coords.ids[rows[i]]), float(distances[i])) for i in order
+        ]
+
+
+def load_accepted_teacher_points() -> list[tuple[int, float, float, str]]:
+    rows = TeacherApplication.objects.filter(
+        status=ApplicationStatusChoices.ACCEPTED,
+        latitude__isnull=False,
+        longitude__isnull=False,
+    ).values_list("id", "latitude", "longitude", "teaching_languages")
+    return [
+        (pk, float(lat), float(lng), lang) for pk, lat, lng, lang in rows.iterator()
+    ]
+
+
+_lock = threading.Lock()
+_index: TeacherSpatialIndex | None = None
+_built_at = 0.0
+
+
+def get_teacher_spatial_index() -> TeacherSpatialIndex:
+    """캐시된 인덱스 반환 (없거나 만료되었으면 다시 build)."""
+    global _index, _built_at
+
+    max_age = getattr(settings, "TEACHER_GEO_INDEX_MAX_AGE_SECONDS", 300)
+    index = _index
+    if index is not None and time.monotonic() - _built_at < max_age:
+        return index
+
+    with _lock:
+        if _index is None or time.monotonic() - _built_at >= max_age:
+            _index = TeacherSpatialIndex(load_accepted_teacher_points())
+            _built_at = time.monotonic()
+        return _index
+
+
+def get_teacher_coordinates() -> TeacherCoordinates:
+    """ACCEPTED 강사 좌표 배열 (공간 인덱스와 같은 캐시/무효화 주기를 공유)."""
+    return get_teacher_spatial_index().coords
+
+
+def invalidate_teacher_spatial_index() -> None:
+    global _index
+    with _lock:
+        _index = None
+
+
+@receiver(post_save, sender=TeacherApplication)
+@receiver(post_delete, sender=TeacherApplication)
+def teacher_application_invalidate_spatial_index(sender, **kwargs):
+    # 커밋 전 다른 스레드가 예전 데이터로 다시 build 하지 않도록 커밋 이후에 무효화
+    transaction.on_commit(invalidate_teacher_spatial_index)
@@ -1,3 +1,1064 @@
-from django.test import TestCase
+import base64
+import io
+import itertools
+import json
+import math
+import shutil
+import tempfile
+import warnings
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+import boto3
+import numpy as np
+import requests
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from moto import mock_aws
+from PIL import Image
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from config.cache import tag_tokens
+
+from .direct_uploads import finalize_upload
+from .geo_batch import TeacherCoordinates, cell_keys_array
+from .geo import accepted_teachers_within_radius, distance_km_expression
+from .geo_cells import EARTH_RADIUS_KM, cell_key, cell_key_or_none, ring_cells
+from .images import (
+    build_srcset,
+    process_profile_image,
+    render_profile_image,
+    stored_image_names,
+)
+from .models import ProfileImageStatusChoices, TeacherApplication
+from .serializers import (
+    TeacherApplicationListSerializer,
+    TeacherApplicationSerializer,
+)
+from .spatial_index import TeacherSpatialIndex, invalidate_teacher_spatial_index
+from .uploads import (
+    IMAGE_UPLOAD_MAX_BYTES,
+    REJECT_MESSAGES,
+    InspectedImageField,
+    inspect_image,
+)
+
+
+class CellKeyTests(SimpleTestCase):
+    def test_vectorized_cell_keys_match_cell_key(self):
+        # DB geo_cell 컬럼(cell_key)과 in-memory 인덱스(cell_keys_array)가 같은 셀을 가리켜야 함
+        rng = np.random.default_rng(0)
+        lat = np.concatenate([rng.uniform(-90, 90, 500), [-90.0, 90.0, 0.0, 37.5]])
+        lng = np.concatenate([rng.uniform(-180, 180, 500), [-180.0, 180.0, 0.0, 127.0]])
+
+        expected = [cell_key(float(a), float(b)) for a, b in zip(lat, lng)]
+        self.assertEqual(cell_keys_array(lat, lng).tolist(), expected)
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def random_points(n, seed=0, lat=(33.0, 38.5), lng=(125.0, 130.0)):
+    """(id, lat, lng, teaching_language) — 기본값은 한국 주변"""
+    rng = np.random.default_rng(seed)
+    languages = ["English", "Japanese", "Chinese"]
+    return [
+        (i + 1, float(a), float(b), languages[int(c)])
+        for i, (a, b, c) in enumerate(
+            zip(rng.uniform(*lat, n), rng.uniform(*lng, n), rng.integers(0, 3, n))
+        )
+    ]
+
+
+class TeacherCoordinatesTests(SimpleTestCase):
+    """geo_batch 벡터화 거리 / top_k 가 스칼라 haversine 과 같은지"""
+
+    def setUp(self):
+        self.points = random_points(500, seed=3)
+        self.coords = TeacherCoordinates.from_points(
+            (pk, lat, lng) for pk, lat, lng, _ in self.points
+        )
+
+    def _brute_force(self, lat, lng):
+        return sorted((haversine_km(lat, lng, a, b), pk) for pk, a, b, _ in self.points)
+
+    def test_distances_match_haversine(self):
+        for lat, lng in ((37.5665, 126.978), (35.1796, 129.0756), (-33.9, 151.2)):
+            with self.subTest(center=(lat, lng)):
+                distances = self.coords.distances_km(lat, lng)
+                for (_, a, b, _), distance in zip(self.points, distances):
+                    self.assertAlmostEqual(
+                        distance, haversine_km(lat, lng, a, b), delta=1e-3
+                    )
+
+    def test_top_k_matches_haversine(self):
+        center = (37.5665, 126.978)
+        expected = self._brute_force(*center)
+        for k, max_km in ((1, None), (10, None), (600, None), (50, 30.0), (5, 0.0)):
+            with self.subTest(k=k, max_km=max_km):
+                hits = self.coords.top_k(*center, k, max_km=max_km)
+                rows = [(d, pk) for d, pk in expected if max_km is None or d <= max_km][
+                    :k
+                ]
+                self.assertEqual([pk for pk, _ in hits], [pk for _, pk in rows])
+                for (_, distance), (expected_distance, _) in zip(hits, rows):
+                    self.assertAlmostEqual(distance, expected_distance, delta=1e-3)
+
+    def test_top_k_without_candidates(self):
+        self.assertEqual(self.coords.top_k(37.5, 127.0, 0), [])
+        empty = TeacherCoordinates.from_points([])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.top_k(37.5, 127.0, 5), [])
+
+
+class SpatialIndexNearestTests(SimpleTestCase):
+    """query_nearest 결과가 전체 강사 haversine 정렬(brute force)과 같은지"""
+
+    @staticmethod
+    def _brute_force(points, lat, lng, k, language=None, max_radius_km=None):
+        hits = [
+            (pk, haversine_km(lat, lng, a, b))
+            for pk, a, b, lang in points
+            if not language or lang == language
+        ]
+        if max_radius_km is not None:
+            hits = [hit for hit in hits if hit[1] <= max_radius_km]
+        return sorted(hits, key=lambda hit: hit[1])[:k]
+
+    def assertSameHits(self, actual, expected):
+        self.assertEqual([pk for pk, _ in actual], [pk for pk, _ in expected])
+        for (_, got), (_, want) in zip(actual, expected):
+            self.assertAlmostEqual(got, want, places=6)
+
+    def test_matches_brute_force(self):
+        points = random_points(1500)
+        index = TeacherSpatialIndex(points)
+        centers = [
+            (37.5665, 126.978),
+            (35.1796, 129.0756),
+            (33.2, 126.5),
+            (40.0, 120.0),
+        ]
+
+        for lat, lng in centers:
+            for k in (1, 7, 60):
+                for language in (None, "Japanese"):
+                    for max_radius_km in (None, 3.0, 40.0):
+                        with self.subTest(
+                            center=(lat, lng), k=k, language=language, r=max_radius_km
+                        ):
+                            self.assertSameHits(
+                                index.query_nearest(
+                                    lat, lng, k, language, max_radius_km=max_radius_km
+                                ),
+                                self._brute_force(
+                                    points, lat, lng, k, language, max_radius_km
+                                ),
+                            )
+
+    def test_matches_brute_force_worldwide(self):
+        # 극 / 날짜변경선 부근 포함 전 세계 분포
+        points = random_points(800, seed=1, lat=(-90.0, 90.0), lng=(-180.0, 180.0))
+        index = TeacherSpatialIndex(points)
+
+        for lat, lng in [(89.9, 0.0), (-89.5, 100.0), (0.0, 179.99), (10.0, -179.99)]:
+            with self.subTest(center=(lat, lng)):
+                self.assertSameHits(
+                    index.query_nearest(lat, lng, 5),
+                    self._brute_force(points, lat, lng, 5),
+                )
+
+    def test_few_distant_matches_do_not_walk_whole_grid(self):
+        points = [(pk, a, b, "English") for pk, a, b, _ in random_points(500)]
+        points.append((9999, -33.87, 151.21, "Japanese"))  # 시드니
+        index = TeacherSpatialIndex(points)
+
+        with mock.patch(
+            "teacher_applications.spatial_index.ring_cells", wraps=ring_cells
+        ) as rings:
+            hits = index.query_nearest(37.5665, 126.978, 10, "Japanese")
+
+        self.assertEqual([pk for pk, _ in hits], [9999])
+        self.assertLess(rings.call_count, 50)
+        self.assertEqual(index.query_nearest(37.5665, 126.978, 10, "French"), [])
+
+    def test_invalid_max_radius_is_rejected(self):
+        index = TeacherSpatialIndex(random_points(10))
+
+        for value in (float("nan"), float("inf"), -1.0):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                index.query_nearest(37.5, 127.0, 3, max_radius_km=value)
+        self.assertEqual(index.query_nearest(37.5, 127.0, 3, max_radius_km=0.0), [])
+
+
+_emails = itertools.count()
+
+
+class RadiusIndexEquivalenceTests(TestCase):
+    """
+    공간 인덱스(accepted_teachers_within_radius) == ORM 경로(TEACHER_GEO_INDEX_ENABLED=False)
+    == 전체 row 에 SQL 거리식만 적용한 결과 (셀 / bounding box 후보 추출 없음)
+    """
+
+    def setUp(self):
+        invalidate_teacher_spatial_index()
+        self.addCleanup(invalidate_teacher_spatial_index)
+
+    @staticmethod
+    def _create(points, status="ACCEPTED"):
+        users = User.objects.bulk_create(
+            [
+                User(email=f"geo{next(_emails)}@example.com", role="teacher")
+                for _ in points
+            ]
+        )
+        rows = []
+        for user, (lat, lng) in zip(users, points):
+            lat, lng = Decimal(f"{lat:.6f}"), Decimal(f"{lng:.6f}")
+            rows.append(
+                TeacherApplication(
+                    user=user,
+                    first_name="T",
+                    last_name="G",
+                    nationality="OTHER",
+                    native_language="ENGLISH",
+                    email=user.email,
+                    phone_number="010-1111-2222",
+                    address_line1="-",
+                    city="-",
+                    district="-",
+                    latitude=lat,
+                    longitude=lng,
+                    # bulk_create 는 save() 를 거치지 않으므로 직접 계산
+                    geo_cell=cell_key_or_none(lat, lng),
+                    visa_type="F-2",
+                    teaching_languages="English",
+                    self_introduction="-",
+                    education_history="-",
+                    experience_history="-",
+                    status=status,
+                )
+            )
+        return TeacherApplication.objects.bulk_create(rows)
+
+    @staticmethod
+    def _full_scan_ids(lat, lng, radius_km):
+        return set(
+            TeacherApplication.objects.filter(status="ACCEPTED")
+            .annotate(d=distance_km_expression(lat, lng))
+            .filter(d__lte=radius_km)
+            .values_list("id", flat=True)
+        )
+
+    def assertEquivalent(self, lat, lng, radius_km, expected=None):
+        truth = self._full_scan_ids(lat, lng, radius_km)
+        if expected is not None:
+            self.assertEqual(truth, expected)
+        for enabled in (True, False):
+            with self.subTest(center=(lat, lng), r=radius_km, index=enabled):
+                with self.settings(TEACHER_GEO_INDEX_ENABLED=enabled):
+                    teachers = accepted_teachers_within_radius(
+                        center_lat=lat, center_lng=lng, radius_km=radius_km
+                    )
+                self.assertEqual({t.pk for t in teachers}, truth)
+                distances = [t.distance_km for t in teachers]
+                self.assertEqual(distances, sorted(distances))
+
+    def test_random_points_in_korea(self):
+        points = [(lat, lng) for _, lat, lng, _ in random_points(400, seed=3)]
+        self._create(points)
+        self._create(points[:20], status="IN_REVIEW")
+
+        for lat, lng in [(37.5665, 126.978), (35.18, 129.08), (36.0, 127.5)]:
+            # 150km 는 셀 목록 대신 bounding box 경로
+            for radius_km in (0.5, 5.0, 25.0, 150.0):
+                self.assertEquivalent(lat, lng, radius_km)
+
+    def test_antimeridian(self):
+        east, west, far = self._create([(10.0, 179.99), (10.0, -179.99), (10.0, 170.0)])
+
+        for lng in (179.999, -179.999):
+            self.assertEquivalent(10.0, lng, 5.0, expected={east.pk, west.pk})
+            # bounding box 경로도 ±180 을 넘어 감싸야 함
+            self.assertEquivalent(
+                10.0, lng, 1200.0, expected={east.pk, west.pk, far.pk}
+            )
+
+    def test_poles(self):
+        north = self._create([(89.99, 0.0), (89.99, 180.0), (89.99, -90.0)])
+        south = self._create([(-89.99, 45.0), (-89.99, -135.0)])
+
+        self.assertEquivalent(89.995, 60.0, 3.0, expected={t.pk for t in north})
+        self.assertEquivalent(-89.999, 0.0, 3.0, expected={t.pk for t in south})
+        self.assertEquivalent(90.0, 0.0, 2.0, expected={t.pk for t in north})
+
+    def test_radius_boundary(self):
+        center = (37.5, 127.0)
+        inside, outside = self._create([(37.545, 127.0), (37.5, 127.06)])
+        d_inside = haversine_km(*center, 37.545, 127.0)
+        d_outside = haversine_km(*center, 37.5, 127.06)
+
+        # 반경 = 거리 (±1mm) 인 경계값
+        self.assertEquivalent(*center, d_inside + 1e-6, expected={inside.pk})
+        self.assertEquivalent(*center, d_inside - 1e-6, expected=set())
+        self.assertEquivalent(
+            *center, d_outside + 1e-6, expected={inside.pk, outside.pk}
+        )
+
+
+def make_application(email="teacher@example.com", **fields):
+    user = User.objects.create_user(email=email, password="pw", role="teacher")
+    fields = {
+        "nationality": "OTHER",
+        "city": "-",
+        "district": "-",
+        "latitude": Decimal("37.5"),
+        "longitude": Decimal("127.0"),
+        "teaching_languages": "English",
+        **fields,
+    }
+    return TeacherApplication.objects.create(
+        user=user,
+        first_name="T",
+        last_name="1",
+        native_language="ENGLISH",
+        email=user.email,
+        phone_number="010-1111-2222",
+        address_line1="-",
+        visa_type="F-2",
+        self_introduction="-",
+        education_history="-",
+        experience_history="-",
+        **fields,
+    )
+
+
+def jpeg_bytes(size=(600, 400)):
+    buf = io.BytesIO()
+    Image.new("RGB", size, "red").save(buf, "JPEG")
+    return buf.getvalue()
+
+
+def png_bytes(size=(300, 200)):
+    buf = io.BytesIO()
+    Image.new("RGBA", size, "blue").save(buf, "PNG")
+    return buf.getvalue()
+
+
+class _ImageSerializer(serializers.Serializer):
+    image = InspectedImageField()
+
+
+class InspectedImageFieldTests(SimpleTestCase):
+    def _validate(self, content, name="p.jpg", context=None):
+        serializer = _ImageSerializer(
+            data={"image": SimpleUploadedFile(name, content)}, context=context or {}
+        )
+        serializer.is_valid()
+        return serializer
+
+    def _error_code(self, content, **kwargs):
+        serializer = self._validate(content, **kwargs)
+        self.assertFalse(serializer.is_valid())
+        return serializer.errors["image"][0].code
+
+    def test_allowed_formats_pass_with_header_meta(self):
+        for content, name, image_format in (
+            (jpeg_bytes((600, 400)), "p.jpg", "JPEG"),
+            (png_bytes((300, 200)), "p.png", "PNG"),
+        ):
+            with self.subTest(image_format=image_format):
+                serializer = self._validate(content, name=name)
+                self.assertTrue(serializer.is_valid(), serializer.errors)
+                meta = serializer.validated_data["image"].image_meta
+                self.assertEqual(meta["format"], image_format)
+                self.assertEqual(
+                    (meta["width"], meta["height"]),
+                    Image.open(io.BytesIO(content)).size,
+                )
+                self.assertEqual(meta["size"], len(content))
+
+    def test_exif_rotation_swaps_dimensions(self):
+        buf = io.BytesIO()
+        exif = Image.Exif()
+        exif[0x0112] = 6  # 90도 회전
+        Image.new("RGB", (600, 400), "red").save(buf, "JPEG", exif=exif)
+
+        meta = inspect_image(SimpleUploadedFile("p.jpg", buf.getvalue()))
+
+        self.assertEqual(
+            (meta["width"], meta["height"], meta["orientation"]), (400, 600, 6)
+        )
+
+    def test_non_image_and_truncated_files_are_invalid(self):
+        for content in (
+            b"not an image",
+            b"\xff\xd8\xff" + b"\0" * 20,
+            jpeg_bytes()[:20],
+        ):
+            with self.subTest(content=content[:12]):
+                self.assertEqual(self._error_code(content), "invalid")
+
+    def test_unsupported_format_is_rejected(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (10, 10)).save(buf, "GIF")
+
+        self.assertEqual(self._error_code(buf.getvalue(), name="p.gif"), "unsupported")
+
+    def test_oversized_file_is_rejected(self):
+        content = jpeg_bytes() + b"\0" * IMAGE_UPLOAD_MAX_BYTES
+
+        self.assertEqual(self._error_code(content), "too_large")
+
+    def test_oversized_dimensions_are_rejected(self):
+        content = jpeg_bytes((600, 400))  # 240,000 px
+        # MAX 초과: inspect_image 의 픽셀 수 검사, 2배 초과: Pillow DecompressionBombError
+        for max_pixels in (200_000, 100_000):
+            with self.subTest(max_pixels=max_pixels), mock.patch.object(
+                Image, "MAX_IMAGE_PIXELS", max_pixels
+            ), warnings.catch_warnings():
+                warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+                self.assertEqual(self._error_code(content), "too_many_pixels")
+
+    def test_upload_handler_rejection_is_reported(self):
+        request = mock.Mock(rejected_uploads={"image": "unsupported"})
+
+        code = self._error_code(jpeg_bytes(), context={"request": request})
+
+        self.assertEqual(code, "unsupported")
+
+
+class ImageUploadLimitHandlerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="upload@example.com", password="pw", role="teacher"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _submit(self, content, name):
+        return self.client.post(
+            "/api/teacher-applications/",
+            {"profile_image": SimpleUploadedFile(name, content)},
+            format="multipart",
+        )
+
+    def test_rejects_by_signature_and_size_while_parsing(self):
+        cases = (
+            (b"GIF89a" + b"\0" * 100, "p.gif", REJECT_MESSAGES["unsupported"]),
+            (
+                jpeg_bytes() + b"\0" * IMAGE_UPLOAD_MAX_BYTES,
+                "p.jpg",
+                REJECT_MESSAGES["too_large"],
+            ),
+        )
+        for content, name, message in cases:
+            with self.subTest(name=name):
+                response = self._submit(content, name)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()["errors"]["profile_image"], [message])
+
+    def test_valid_image_passes_field_validation(self):
+        response = self._submit(jpeg_bytes(), "p.jpg")
+
+        # 다른 필수 항목이 없어서 400 이지만 profile_image 는 통과
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("first_name", response.json()["errors"])
+        self.assertNotIn("profile_image", response.json()["errors"])
+        self.assertFalse(TeacherApplication.objects.exists())
+
+
+class RenderProfileImageTests(SimpleTestCase):
+    sizes = [64, 128, 256, 512]
+    formats = ["webp", "jpeg"]
+
+    def _render(self, content):
+        return render_profile_image(
+            io.BytesIO(content), sizes=self.sizes, formats=self.formats
+        )
+
+    def test_derivative_sizes_and_formats(self):
+        result = self._render(jpeg_bytes((600, 400)))
+
+        self.assertEqual(
+            (result["format"], result["width"], result["height"]), ("JPEG", 600, 400)
+        )
+        self.assertEqual(
+            [(item["size"], item["format"]) for item in result["derivatives"]],
+            [(size, fmt) for size in (512, 256, 128, 64) for fmt in self.formats],
+        )
+        for item in result["derivatives"]:
+            with self.subTest(size=item["size"], format=item["format"]):
+                with Image.open(io.BytesIO(item["content"])) as img:
+                    self.assertEqual(img.format, item["format"].upper())
+                    self.assertEqual(img.size, (item["width"], item["height"]))
+                # 긴 변이 size, 비율 유지
+                self.assertEqual(item["width"], item["size"])
+                self.assertAlmostEqual(
+                    item["height"], item["size"] * 400 / 600, delta=1
+                )
+
+    def test_jpeg_256_derivative_reuses_thumbnail(self):
+        result = self._render(jpeg_bytes((600, 400)))
+
+        [reused] = [item for item in result["derivatives"] if item.get("thumbnail")]
+        self.assertEqual((reused["size"], reused["format"]), (256, "jpeg"))
+        self.assertIs(reused["content"], result["thumbnail"])
+        with Image.open(io.BytesIO(result["thumbnail"])) as img:
+            self.assertEqual((img.format, img.size), ("JPEG", (256, 171)))
+
+    def test_small_source_is_not_upscaled(self):
+        result = self._render(png_bytes((100, 50)))
+
+        self.assertEqual(result["format"], "PNG")
+        for item in result["derivatives"]:
+            expected = (100, 50) if item["size"] >= 100 else (64, 32)
+            self.assertEqual((item["width"], item["height"]), expected)
+
+    def test_build_srcset_groups_by_format_in_width_order(self):
+        derivatives = [
+            {"format": fmt, "width": width, "name": f"a_{width}.{fmt}"}
+            for width in (512, 64, 256)
+            for fmt in ("webp", "jpeg")
+        ]
+
+        srcset = build_srcset(derivatives, lambda name: f"https://cdn/{name}")
+
+        self.assertEqual(
+            srcset,
+            {
+                fmt: ", ".join(
+                    f"https://cdn/a_{width}.{fmt} {width}w" for width in (64, 256, 512)
+                )
+                for fmt in ("webp", "jpeg")
+            },
+        )
+        self.assertEqual(build_srcset(None, str), {})
+
+
+class ProfileImageProcessingTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        storage = override_settings(
+            MEDIA_ROOT=media_root,
+            STORAGES={
+                "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+                "staticfiles": {
+                    "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+                },
+            },
+            PROFILE_IMAGE_ASYNC_PROCESSING=True,
+        )
+        storage.enable()
+        self.addCleanup(storage.disable)
+
+    @staticmethod
+    def _image():
+        return SimpleUploadedFile("p.jpg", jpeg_bytes(), content_type="image/jpeg")
+
+    def test_worker_update_invalidates_cache_tag(self):
+        app = make_application(profile_image=self._image())
+        self.assertEqual(app.profile_image_status, ProfileImageStatusChoices.PENDING)
+        [before] = tag_tokens(["teacher_applications"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            status = process_profile_image(app)
+
+        self.assertEqual(status, ProfileImageStatusChoices.READY)
+        app.refresh_from_db()
+        self.assertEqual(app.profile_image_status, ProfileImageStatusChoices.READY)
+        self.assertTrue(app.profile_image_thumbnail)
+        # QuerySet.update() 는 signal 이 없으므로 process_profile_image 가 직접 invalidate
+        self.assertNotEqual(tag_tokens(["teacher_applications"]), [before])
+
+    @override_settings(
+        PROFILE_IMAGE_DERIVATIVE_SIZES=[128, 256],
+        PROFILE_IMAGE_DERIVATIVE_FORMATS=["webp", "jpeg"],
+    )
+    def test_thumbnail_is_stored_once_and_used_in_srcset(self):
+        app = make_application(profile_image=self._image())
+        with self.captureOnCommitCallbacks(execute=True):
+            process_profile_image(app)
+        app.refresh_from_db()
+
+        thumb = app.profile_image_thumbnail.name
+        by_key = {(d["size"], d["format"]): d for d in app.profile_image_derivatives}
+        self.assertEqual(by_key[(256, "jpeg")]["name"], thumb)
+        self.assertNotEqual(by_key[(256, "webp")]["name"], thumb)
+        names = stored_image_names(app)
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(len(names), 4)  # 썸네일 + 128 webp/jpeg + 256 webp
+        storage = app.profile_image_thumbnail.storage
+        self.assertTrue(all(storage.exists(name) for name in names))
+
+        srcset = TeacherApplicationListSerializer(
+            app, fields=["profile_image_srcset"]
+        ).data["profile_image_srcset"]
+        self.assertEqual(
+            srcset["jpeg"],
+            f"{storage.url(by_key[(128, 'jpeg')]['name'])} 128w, {storage.url(thumb)} 256w",
+        )
+        self.assertIn("256w", srcset["webp"])
+
+        app.delete()
+        self.assertFalse(any(storage.exists(name) for name in names))
+
+
+class RegenerateProfileImagesTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        storage = override_settings(
+            MEDIA_ROOT=self.media_root,
+            STORAGES={
+                "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+                "staticfiles": {
+                    "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+                },
+            },
+            PROFILE_IMAGE_ASYNC_PROCESSING=True,
+        )
+        storage.enable()
+        self.addCleanup(storage.disable)
+
+    def _ready_application(self, **fields):
+        app = make_application(
+            profile_image=SimpleUploadedFile(
+                "p.jpg", jpeg_bytes(), content_type="image/jpeg"
+            ),
+            **fields,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            process_profile_image(app)
+        app.refresh_from_db()
+        self.assertEqual(app.profile_image_status, ProfileImageStatusChoices.READY)
+        return app
+
+    def _regenerate(self, *args):
+        out, err = io.StringIO(), io.StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command(
+                "regenerate_profile_images",
+                "--workers",
+                "1",
+                *args,
+                stdout=out,
+                stderr=err,
+            )
+        return out.getvalue(), err.getvalue()
+
+    def test_outdated_row_is_regenerated_and_cache_invalidated(self):
+        app = self._ready_application()
+        old_thumbnail = app.profile_image_thumbnail.name
+        TeacherApplication.objects.filter(pk=app.pk).update(
+            profile_image_derivatives=[]
+        )
+        [before] = tag_tokens(["teacher_applications"])
+
+        out, _ = self._regenerate()
+
+        self.assertIn("regenerated=1", out)
+        app.refresh_from_db()
+        self.assertEqual(app.profile_image_status, ProfileImageStatusChoices.READY)
+        self.assertIsNone(app.profile_image_claimed_at)
+        self.assertTrue(app.profile_image_derivatives)
+        storage = app.profile_image_thumbnail.storage
+        new_names = {app.profile_image_thumbnail.name} | {
+            item["name"] for item in app.profile_image_derivatives
+        }
+        for name in new_names:
+            self.assertTrue(storage.exists(name))
+        # 교체된 이전 썸네일은 삭제
+        self.assertNotIn(old_thumbnail, new_names)
+        self.assertFalse(storage.exists(old_thumbnail))
+        # bulk_update 는 post_save 가 없으므로 command 가 직접 invalidate
+        self.assertNotEqual(tag_tokens(["teacher_applications"]), [before])
+
+    def test_pending_and_processing_rows_are_skipped(self):
+        pending = make_application(
+            profile_image=SimpleUploadedFile(
+                "p.jpg", jpeg_bytes(), content_type="image/jpeg"
+            )
+        )
+        self.assertEqual(
+            pending.profile_image_status, ProfileImageStatusChoices.PENDING
+        )
+        processing = self._ready_application(email="processing@example.com")
+        TeacherApplication.objects.filter(pk=processing.pk).update(
+            profile_image_status=ProfileImageStatusChoices.PROCESSING
+        )
+        processing.refresh_from_db()
+
+        out, _ = self._regenerate("--all")
+
+        self.assertIn("regenerated=0", out)
+        self.assertIn("skipped=2", out)
+        pending.refresh_from_db()
+        self.assertEqual(
+            pending.profile_image_status, ProfileImageStatusChoices.PENDING
+        )
+        self.assertFalse(pending.profile_image_thumbnail)
+        row = TeacherApplication.objects.get(pk=processing.pk)
+        self.assertEqual(row.profile_image_status, ProfileImageStatusChoices.PROCESSING)
+        self.assertEqual(
+            row.profile_image_thumbnail.name, processing.profile_image_thumbnail.name
+        )
+        self.assertEqual(
+            row.profile_image_derivatives, processing.profile_image_derivatives
+        )
+
+    def test_render_failure_keeps_ready_row_and_derivatives(self):
+        app = self._ready_application()
+        storage = app.profile_image.storage
+        with open(storage.path(app.profile_image.name), "wb") as fh:
+            fh.write(b"not an image")
+
+        out, err = self._regenerate("--all")
+
+        self.assertIn("failed=1", out)
+        self.assertIn(f"id={app.pk}", err)
+        row = TeacherApplication.objects.get(pk=app.pk)
+        # 기존 썸네일/파생 이미지는 여전히 유효 → FAILED 로 바꾸지 않음
+        self.assertEqual(row.profile_image_status, ProfileImageStatusChoices.READY)
+        self.assertIsNone(row.profile_image_claimed_at)
+        self.assertEqual(
+            row.profile_image_thumbnail.name, app.profile_image_thumbnail.name
+        )
+        self.assertEqual(row.profile_image_derivatives, app.profile_image_derivatives)
+        self.assertTrue(storage.exists(app.profile_image_thumbnail.name))
+
+    def test_dry_run_does_not_claim(self):
+        app = self._ready_application()
+
+        out, _ = self._regenerate("--all", "--dry-run")
+
+        self.assertIn("regenerated=1", out)
+        row = TeacherApplication.objects.get(pk=app.pk)
+        self.assertEqual(row.profile_image_status, ProfileImageStatusChoices.READY)
+        self.assertIsNone(row.profile_image_claimed_at)
+        self.assertEqual(
+            row.profile_image_thumbnail.name, app.profile_image_thumbnail.name
+        )
+
+
+@override_settings(API_CACHE_ENABLED=False)
+class TeacherApplicationListFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com", password="pw", role="admin", is_staff=True
+        )
+        today = date.today()
+
+        def born(age):
+            return today.replace(year=today.year - age) - timedelta(days=1)
+
+        rows = [
+            ("서울특별시", "강남구", "English", "MALE", "USA", born(25)),
+            ("서울특별시", "마포구", "English", "FEMALE", "UK", born(34)),
+            ("부산광역시", "해운대구", "Japanese", "FEMALE", "JAPAN", born(30)),
+            ("서울특별시", "강남구", "english", "FEMALE", "CANADA", born(39)),
+            ("서울특별시", "강남구", "English", "FEMALE", "CANADA", born(40)),
+        ]
+        cls.apps = [
+            make_application(
+                email=f"list{i}@example.com",
+                status="ACCEPTED",
+                city=city,
+                district=district,
+                teaching_languages=language,
+                gender=gender,
+                nationality=nationality,
+                date_of_birth=date_of_birth,
+            )
+            for i, (
+                city,
+                district,
+                language,
+                gender,
+                nationality,
+                date_of_birth,
+            ) in enumerate(rows)
+        ]
+        make_application(
+            email="pending@example.com", city="서울특별시", district="강남구"
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _ids(self, **params):
+        # page_size=1: 필터가 불러온 페이지가 아닌 전체 목록에 적용되는지 확인
+        url, params = "/api/teacher-applications/admin/list/", {
+            **params,
+            "page_size": 1,
+        }
+        ids = []
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            ids += [row["id"] for row in response.json()["results"]]
+            url, params = response.json()["next"], None
+        return sorted(ids)
+
+    def _expected(self, *indexes):
+        return sorted(self.apps[i].pk for i in indexes)
+
+    def test_filters_apply_to_whole_list(self):
+        cases = [
+            ({"location": ["서울특별시", "강남구"]}, (0, 3, 4)),
+            ({"location": "해운대"}, (2,)),
+            ({"teaching_language": "English"}, (0, 1, 3, 4)),
+            ({"gender": "FEMALE", "nationality": "CANADA"}, (3, 4)),
+            ({"age_min": 30, "age_max": 39}, (1, 2, 3)),
+            ({"age_min": 40}, (4,)),
+            ({"location": "서울특별시", "gender": "FEMALE", "age_max": 39}, (1, 3)),
+            ({"search": "list2@"}, (2,)),
+        ]
+        for params, expected in cases:
+            with self.subTest(params=params):
+                self.assertEqual(self._ids(**params), self._expected(*expected))
+
+    def test_invalid_age_is_rejected(self):
+        for value in ("abc", "-1", "200"):
+            with self.subTest(value=value):
+                response = self.client.get(
+                    "/api/teacher-applications/admin/list/", {"age_min": value}
+                )
+                self.assertEqual(response.status_code, 400)
+
+
+class TeacherApplicationListFieldsTests(TestCase):
+    url = "/api/teacher-applications/admin/list/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            email="admin@example.com", password="pw", role="admin", is_staff=True
+        )
+        cls.apps = [
+            make_application(email=f"fields{i}@example.com", status="ACCEPTED")
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def _get(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params)
+        return response, queries
+
+    def test_default_fields(self):
+        response, _ = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        for row in response.json()["results"]:
+            self.assertEqual(
+                set(row), set(TeacherApplicationListSerializer.LIST_FIELDS)
+            )
+
+    def test_selected_fields_always_include_id(self):
+        response, _ = self._get(fields="first_name, age")
+
+        self.assertEqual(response.status_code, 200)
+        for row in response.json()["results"]:
+            self.assertEqual(set(row), {"id", "first_name", "age"})
+
+    def test_unknown_field_is_rejected(self):
+        for fields in ("first_name,nope", "password", "profile_image_claimed_at"):
+            with self.subTest(fields=fields):
+                response, _ = self._get(fields=fields)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("fields", response.json())
+
+    def test_only_selects_needed_columns_without_per_row_queries(self):
+        response, queries = self._get(fields="first_name,is_visa_expiring_soon")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 3)
+        # 계산 필드가 읽는 visa_expiry_date 도 .only() 에 포함 → 행마다 지연 로딩 쿼리 없음
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]["sql"]
+        self.assertIn('"visa_expiry_date"', sql)
+        self.assertNotIn('"self_introduction"', sql)
+        self.assertNotIn('"education_history"', sql)
+
+        make_application(email="fields3@example.com", status="ACCEPTED")
+        response, more = self._get(fields="first_name,is_visa_expiring_soon")
+        self.assertEqual(len(response.json()["results"]), 4)
+        self.assertEqual(len(more), len(queries))
+
+    def test_claimed_at_is_hidden(self):
+        app = self.apps[0]
+        app.profile_image_claimed_at = timezone.now()
+        app.save(update_fields=["profile_image_claimed_at"])
+
+        self.assertNotIn(
+            "profile_image_claimed_at", TeacherApplicationSerializer(app).data
+        )
+        self.assertNotIn(
+            "profile_image_claimed_at",
+            TeacherApplicationListSerializer.selectable_fields(),
+        )
+        response = self.client.get(f"/api/teacher-applications/admin/{app.pk}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("profile_image_claimed_at", response.json())
+
+
+@override_settings(
+    AWS_STORAGE_BUCKET_NAME="test-bucket",
+    AWS_S3_REGION_NAME="ap-northeast-2",
+    STORAGES={
+        "default": {"BACKEND": "config.storages.PublicMediaStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+    PROFILE_IMAGE_ASYNC_PROCESSING=True,
+)
+class DirectUploadTests(TestCase):
+    consents = {
+        "consent_personal_data": True,
+        "consent_data_retention": True,
+        "confirmation_info_true": True,
+    }
+
+    def setUp(self):
+        aws = mock_aws()
+        aws.start()
+        self.addCleanup(aws.stop)
+        self.s3 = boto3.client("s3", region_name="ap-northeast-2")
+        self.s3.create_bucket(
+            Bucket="test-bucket",
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+        )
+        self.app = make_application()
+        self.client = APIClient()
+        self.client.force_authenticate(self.app.user)
+
+    def _issue(self, field="profile_image", filename="me.JPG"):
+        return self.client.post(
+            "/api/teacher-applications/uploads/",
+            {"field": field, "filename": filename},
+            format="json",
+        )
+
+    def _upload(self, upload, body):
+        return requests.post(
+            upload["url"],
+            data=upload["fields"],
+            files={"file": ("upload.jpg", body, "image/jpeg")},
+        )
+
+    def _object_key(self, upload):
+        return upload["fields"]["key"]
+
+    def test_issue_returns_presigned_post_with_policy(self):
+        response = self._issue()
+
+        self.assertEqual(response.status_code, 200)
+        upload = response.json()["data"]
+        self.assertEqual(
+            upload["url"], "https://test-bucket.s3.ap-northeast-2.amazonaws.com/"
+        )
+        self.assertTrue(
+            self._object_key(upload).startswith(
+                "media/teacher_applications/profile_images/"
+            )
+        )
+        self.assertEqual(upload["fields"]["Content-Type"], "image/jpeg")
+        self.assertEqual(upload["fields"]["acl"], "public-read")
+        policy = json.loads(base64.b64decode(upload["fields"]["policy"]))
+        self.assertIn(
+            ["content-length-range", 1, upload["max_size"]], policy["conditions"]
+        )
+        self.assertIn({"Content-Type": "image/jpeg"}, policy["conditions"])
+
+    def test_issue_rejects_unsupported_extension(self):
+        self.assertEqual(self._issue(filename="me.gif").status_code, 400)
+        self.assertEqual(self._issue(field="first_name").status_code, 400)
+
+    def test_finalize_assigns_uploaded_object_without_reupload(self):
+        upload = self._issue().json()["data"]
+        self.assertEqual(self._upload(upload, jpeg_bytes()).status_code, 204)
+
+        response = self.client.patch(
+            "/api/teacher-applications/my/",
+            {"profile_image_upload": upload["token"], **self.consents},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200, response.json())
+        self.app.refresh_from_db()
+        self.assertEqual(
+            "media/" + self.app.profile_image.name, self._object_key(upload)
+        )
+        self.assertEqual(
+            self.app.profile_image_status, ProfileImageStatusChoices.PENDING
+        )
+        # 버킷에는 직접 올린 객체 1개만 (Django 가 다시 올리지 않음)
+        listed = self.s3.list_objects_v2(Bucket="test-bucket")
+        self.assertEqual(
+            [o["Key"] for o in listed["Contents"]], [self._object_key(upload)]
+        )
+
+    def test_finalize_rejects_token_for_other_field(self):
+        upload = self._issue().json()["data"]
+        self._upload(upload, jpeg_bytes())
+
+        response = self.client.patch(
+            "/api/teacher-applications/my/",
+            {"visa_scan_upload": upload["token"], **self.consents},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("visa_scan", response.json()["errors"])
+
+    def test_finalize_rejects_missing_object(self):
+        upload = self._issue(field="visa_scan", filename="v.png").json()["data"]
+
+        with self.assertRaises(ValidationError) as ctx:
+            finalize_upload(self.app.user, "visa_scan", upload["token"])
+        self.assertEqual(ctx.exception.code, "missing")
+
+    def test_finalize_deletes_invalid_object(self):
+        upload = self._issue().json()["data"]
+        self._upload(upload, b"not an image")
+
+        with self.assertRaises(ValidationError) as ctx:
+            finalize_upload(self.app.user, "profile_image", upload["token"])
+        self.assertEqual(ctx.exception.code, "invalid")
+        self.assertEqual(self.s3.list_objects_v2(Bucket="test-bucket")["KeyCount"], 0)
+
+    def test_finalize_rejects_oversized_object(self):
+        # moto 는 content-length-range 를 검사하지 않으므로 finalize 의 크기 검사 확인
+        upload = self._issue().json()["data"]
+        self.s3.put_object(
+            Bucket="test-bucket",
+            Key=self._object_key(upload),
+            Body=jpeg_bytes() + b"0" * (upload["max_size"] + 1),
+        )
+
+        with self.assertRaises(ValidationError) as ctx:
+            finalize_upload(self.app.user, "profile_image", upload["token"])
+        self.assertEqual(ctx.exception.code, "too_large")
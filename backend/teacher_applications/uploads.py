@@ -0,0 +1,181 @@
+# backend/teacher_applications/uploads.py
+"""
+이미지 업로드 검사 (헤더만 읽고 전체 decode 는 하지 않음).
+
+- ImageUploadLimitHandler: multipart 파싱 중 첫 chunk 의 시그니처(JPEG/PNG)와 누적 크기를 검사,
+  통과하지 못하면 SkipFile 로 나머지 본문을 버퍼링하지 않고 버림
+- inspect_image: Pillow lazy open 으로 format / 크기 / EXIF orientation 만 읽고
+  업로드 파일 객체에 image_meta 로 캐시 → serializer 검증과 모델 save() 가 같은 결과를 공유
+- InspectedMultiPartParser / InspectedImageField: 위 두 가지를 DRF 에 연결
+"""
+from __future__ import annotations
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile
+from PIL import Image, UnidentifiedImageError
+from rest_framework import serializers
+from rest_framework.parsers import MultiPartParser
+
+IMAGE_UPLOAD_MAX_BYTES = 2 * 1024 * 1024  # 2MB
+# 업로드 단계에서 검사하는 multipart 필드
+INSPECTED_UPLOAD_FIELDS = ("profile_image", "visa_scan")
+# Pillow format → 파일 시그니처
+_SIGNATURES = {
+    "JPEG": (b"\xff\xd8\xff",),
+    "PNG": (b"\x89PNG\r\n\x1a\n",),
+}
+_EXIF_ORIENTATION = 0x0112
+
+REJECT_MESSAGES = {
+    "too_large": "이미지 파일 크기는 2MB 이하여야 합니다. (Max size is 2MB)",
+    "unsupported": (
+        "Only JPG/PNG images are allowed. JPG/PNG 이미지만 업로드할 수 있습니다."
+    ),
+    "invalid": (
+        "Upload a valid image. The file is not an image or is corrupted. "
+        "올바른 이미지 파일이 아닙니다."
+    ),
+    "too_many_pixels": (
+        "Image dimensions are too large. 이미지 해상도가 너무 큽니다."
+    ),
+}
+
+
+def sniff_image_format(head: bytes) -> str | None:
+    for image_format, signatures in _SIGNATURES.items():
+        if head.startswith(signatures):
+            return image_format
+    return None
+
+
+def inspect_image(fileobj) -> dict:
+    """
+    이미지 헤더만 읽어서 메타 추출 (픽셀 데이터 decode 없음).
+
+    returns: {"format", "width", "height", "orientation", "size"}
+    raises: django ValidationError (code: too_large / unsupported / invalid / too_many_pixels)
+    """
+    cached = getattr(fileobj, "image_meta", None)
+    if cached is not None:
+        return cached
+
+    size = getattr(fileobj, "size", None)
+    if size is not None and size > IMAGE_UPLOAD_MAX_BYTES:
+        raise ValidationError(REJECT_MESSAGES["too_large"], code="too_large")
+
+    position = fileobj.tell() if hasattr(fileobj, "tell") else None
+    try:
+        fileobj.seek(0)
+        # Image.open 은 헤더만 파싱하고 픽셀은 load() 전까지 읽지 않음
+        with Image.open(fileobj) as img:
+            image_format = (img.format or "").upper()
+            width, height = img.size
+            orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+    except (UnidentifiedImageError, OSError, SyntaxError, ValueError):
+        raise ValidationError(REJECT_MESSAGES["invalid"], code="invalid")
+    except Image.DecompressionBombError:
+        raise ValidationError(REJECT_MESSAGES["too_many_pixels"], code="too_many_pixels")
+    finally:
+        if position is not None:
+            fileobj.seek(position)
+
+    if image_format not in _SIGNATURES:
+        raise ValidationError(REJECT_MESSAGES["unsupported"], code="unsupported")
+    if Image.MAX_IMAGE_PIXELS and width * height > Image.MAX_IMAGE_PIXELS:
+        raise ValidationError(REJECT_MESSAGES["too_many_pixels"], code="too_many_pixels")
+
+    # EXIF 회전(5~8)이면 화면에 보이는 가로/세로가 바뀜 (썸네일러 exif_transpose 결과와 동일)
+    if orientation in (5, 6, 7, 8):
+        width, height = height, width
+
+    meta = {
+        "format": image_format,
+        "width": width,
+        "height": height,
+        "orientation": orientation,
+        "size": size,
+    }
+    try:
+        fileobj.image_meta = meta
+    except AttributeError:
+        pass
+    return meta
+
+
+class ImageUploadLimitHandler(FileUploadHandler):
+    """
+    INSPECTED_UPLOAD_FIELDS 파일을 받는 도중 검사.
+    - 첫 chunk 시그니처가 JPEG/PNG 가 아니면 즉시 버림
+    - 누적 크기가 IMAGE_UPLOAD_MAX_BYTES 를 넘는 순간 버림 (메모리/임시파일에 끝까지 쌓지 않음)
+    버린 필드와 사유는 request.rejected_uploads 에 기록 → InspectedImageField 가 오류로 변환
+    """
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        self.inspecting = field_name in INSPECTED_UPLOAD_FIELDS
+        if (
+            self.inspecting
+            and self.content_length
+            and self.content_length > IMAGE_UPLOAD_MAX_BYTES
+        ):
+            self._reject("too_large")
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.inspecting:
+            return raw_data
+        if start == 0 and sniff_image_format(raw_data) is None:
+            self._reject("unsupported")
+        if start + len(raw_data) > IMAGE_UPLOAD_MAX_BYTES:
+            self._reject("too_large")
+        return raw_data
+
+    def file_complete(self, file_size):
+        # 실제 파일 객체는 뒤의 기본 handler(Memory/TemporaryFile)가 만든다
+        return None
+
+    def _reject(self, reason: str):
+        rejected = getattr(self.request, "rejected_uploads", None)
+        if rejected is None:
+            rejected = self.request.rejected_uploads = {}
+        rejected[self.field_name] = reason
+        raise SkipFile()
+
+
+class InspectedMultiPartParser(MultiPartParser):
+    """multipart 파싱 전에 ImageUploadLimitHandler 를 맨 앞에 끼워 넣는 parser."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = parser_context["request"]
+        django_request = getattr(request, "_request", request)
+        if not any(
+            isinstance(handler, ImageUploadLimitHandler)
+            for handler in django_request.upload_handlers
+        ):
+            django_request.upload_handlers.insert(
+                0, ImageUploadLimitHandler(django_request)
+            )
+        return super().parse(stream, media_type, parser_context)
+
+
+class InspectedImageField(serializers.FileField):
+    """
+    DRF ImageField 대체: Pillow verify()(전체 읽기) 대신 inspect_image 로 헤더만 검사.
+    응답 표현(to_representation)은 ImageField 와 동일.
+    """
+
+    def run_validation(self, data=serializers.empty):
+        request = self.context.get("request")
+        reason = (getattr(request, "rejected_uploads", None) or {}).get(
+            self.field_name
+        )
+        if reason:
+            raise serializers.ValidationError(REJECT_MESSAGES[reason], code=reason)
+        return super().run_validation(data)
+
+    def to_internal_value(self, data):
+        file = super().to_internal_value(data)
+        try:
+            inspect_image(file)
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.messages, code=exc.code)
+        return file
@@ -4,6 +4,7 @@ from .views import (
     TeacherApplicationUpdateView,
     TeacherApplicationListView,
     TeacherApplicationDetailView,
+    TeacherApplicationUploadURLView,
 )
 
 app_name = "teacher_applications"
@@ -21,6 +22,12 @@ urlpatterns = [
         TeacherApplicationUpdateView.as_view(),
         name="teacher-application-update",
     ),
+    # 버킷 직접 업로드용 presigned POST 발급
+    path(
+        "uploads/",
+        TeacherApplicationUploadURLView.as_view(),
+        name="teacher-application-upload-url",
+    ),
     # 관리자용 지원서 목록 조회
     path(
         "admin/list/",
@@ -1,19 +1,34 @@
 from rest_framework import generics, permissions, filters, status
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.parsers import FormParser, JSONParser
+from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.exceptions import (
     ValidationError as DRFValidationError,
     NotFound,
     PermissionDenied,
 )
-from django.core.mail import send_mail
-from django.conf import settings
+
+from datetime import date
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+
+from config.db_router import ReplicaReadMixin
+from notifications.outbox import enqueue_email
 
-from .models import TeacherApplication, ApplicationStatusChoices
-from .serializers import TeacherApplicationSerializer
+from .models import (
+    TeacherApplication,
+    ApplicationStatusChoices,
+    get_teacher_application,
+)
+from .serializers import (
+    TeacherApplicationListSerializer,
+    TeacherApplicationSerializer,
+)
+from .direct_uploads import DirectUploadUnavailable, issue_upload
+from .uploads import InspectedMultiPartParser
 
 import logging
 
@@ -29,27 +44,13 @@ class TeacherApplicationCreateView(generics.CreateAPIView):
     queryset = TeacherApplication.objects.all()
     serializer_class = TeacherApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]  # 로그인 필수
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [InspectedMultiPartParser, FormParser, JSONParser]
 
     def get(self, request, *args, **kwargs):
         """기존 이력서 조회"""
         user = request.user
-        try:
-            application = TeacherApplication.objects.get(user=user)
-            serializer = self.get_serializer(application)
-            logger.info(
-                "Teacher application retrieved",
-                extra={"user_id": getattr(user, "id", None)},
-            )
-            return Response(
-                {
-                    "success": True,
-                    "message": "이력서를 조회했습니다.",
-                    "data": serializer.data,
-                    "exists": True,
-                }
-            )
-        except TeacherApplication.DoesNotExist:
+        application = get_teacher_application(user)
+        if application is None:
             logger.info(
                 "Teacher application not found",
                 extra={"user_id": getattr(user, "id", None)},
@@ -63,11 +64,25 @@ class TeacherApplicationCreateView(generics.CreateAPIView):
                 }
             )
 
+        serializer = self.get_serializer(application)
+        logger.info(
+            "Teacher application retrieved",
+            extra={"user_id": getattr(user, "id", None)},
+        )
+        return Response(
+            {
+                "success": True,
+                "message": "이력서를 조회했습니다.",
+                "data": serializer.data,
+                "exists": True,
+            }
+        )
+
     def perform_create(self, serializer):
         user = self.request.user
 
         # === 핵심: 유저당 1개의 이력서만 허용 ===
-        if TeacherApplication.objects.filter(user=user).exists():
+        if get_teacher_application(user) is not None:
             logger.warning(
                 "Duplicate teacher application create attempt",
                 extra={"user_id": getattr(user, "id", None)},
@@ -114,20 +129,14 @@ Best regards,
 Friending Team
 """.strip()
 
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[instance.email],
-                fail_silently=True,  # 이메일 발송 실패해도 API는 성공 처리
-            )
+            enqueue_email(subject, message, [instance.email])
             logger.info(
-                "Confirmation email send attempted",
+                "Confirmation email queued",
                 extra={"application_id": instance.id, "to": instance.email},
             )
         except Exception:
             logger.exception(
-                "Failed to send confirmation email",
+                "Failed to queue confirmation email",
                 extra={
                     "application_id": getattr(instance, "id", None),
                     "to": getattr(instance, "email", None),
@@ -200,15 +209,9 @@ Please review it in the admin/reviewer page.
 관리자/검토 페이지에서 확인해주세요.
 """.strip()
 
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=list(recipients),
-                fail_silently=True,
-            )
+            enqueue_email(subject, message, list(recipients))
             logger.info(
-                "New application notification email send attempted",
+                "New application notification email queued",
                 extra={
                     "application_id": instance.id,
                     "recipient_count": len(recipients),
@@ -217,7 +220,7 @@ Please review it in the admin/reviewer page.
         except Exception:
             # 이메일 발송 실패해도 지원서 제출은 성공으로 처리
             logger.exception(
-                "Failed to send new application notification email",
+                "Failed to queue new application notification email",
                 extra={"application_id": getattr(instance, "id", None)},
             )
 
@@ -274,13 +277,12 @@ class TeacherApplicationUpdateView(generics.RetrieveUpdateDestroyAPIView):
 
     serializer_class = TeacherApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
-    parser_classes = [MultiPartParser, FormParser]
+    parser_classes = [InspectedMultiPartParser, FormParser, JSONParser]
 
     def get_object(self):
         """현재 로그인한 사용자의 이력서 조회"""
-        try:
-            return TeacherApplication.objects.get(user=self.request.user)
-        except TeacherApplication.DoesNotExist:
+        application = get_teacher_application(self.request.user)
+        if application is None:
             logger.info(
                 "Teacher application not found for user",
                 extra={
@@ -293,6 +295,7 @@ class TeacherApplicationUpdateView(generics.RetrieveUpdateDestroyAPIView):
                     "message": "등록된 이력서가 없습니다.",
                 }
             )
+        return application
 
     def retrieve(self, request, *args, **kwargs):
         """이력서 조회 응답 커스터마이징"""
@@ -458,14 +461,56 @@ class TeacherApplicationUpdateView(generics.RetrieveUpdateDestroyAPIView):
         )
 
 
-class TeacherApplicationListView(generics.ListAPIView):
+class TeacherApplicationUploadURLView(APIView):
+    """
+    profile_image / visa_scan 을 버킷에 직접 올리기 위한 presigned POST 발급.
+    응답의 url 로 fields + file 을 multipart POST 한 뒤,
+    지원서 생성/수정 요청에 token 을 <field>_upload 로 보내면 업로드된 파일이 연결됨.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            upload = issue_upload(
+                request.user,
+                request.data.get("field", ""),
+                request.data.get("filename", ""),
+            )
+        except DirectUploadUnavailable as e:
+            return Response(
+                {"success": False, "message": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except DjangoValidationError as e:
+            return Response(
+                {"success": False, "message": " ".join(e.messages)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {"success": True, "data": upload},
+            status=status.HTTP_200_OK,
+        )
+
+
+class TeacherApplicationListView(ReplicaReadMixin, generics.ListAPIView):
     """
     Admin-only list view for reviewing applications.
     관리자용 이력서 목록 조회 엔드포인트
+
+    ?fields=id,first_name,... 로 응답 필드 선택 (기본: TeacherApplicationListSerializer.LIST_FIELDS)
+    → 선택된 필드에 필요한 컬럼만 queryset.only() 로 조회
+
+    조건 검색 (cursor 페이지 단위가 아닌 전체 목록 기준으로 DB 에서 필터):
+    - ?location=서울특별시&location=강남구 : 각 값이 city 또는 district 에 포함 (AND)
+    - ?teaching_language= / ?gender= / ?nationality= / ?visa_type= : 일치
+    - ?age_min=30&age_max=39 : date_of_birth 범위로 변환
+    - ?search= : SearchFilter (search_fields)
     """
 
     queryset = TeacherApplication.objects.all()
-    serializer_class = TeacherApplicationSerializer
+    serializer_class = TeacherApplicationListSerializer
     permission_classes = [permissions.IsAdminUser]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
 
@@ -490,18 +535,86 @@ class TeacherApplicationListView(generics.ListAPIView):
         )
         return super().list(request, *args, **kwargs)
 
+    @property
+    def list_fields(self):
+        if not hasattr(self, "_list_fields"):
+            self._list_fields = TeacherApplicationListSerializer.parse_fields(
+                self.request.query_params.get("fields")
+            )
+        return self._list_fields
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.list_fields)
+        return super().get_serializer(*args, **kwargs)
+
     def get_queryset(self):
         """ACCEPTED 상태의 이력서만 조회되도록 제한"""
         queryset = super().get_queryset()
         queryset = queryset.filter(status=ApplicationStatusChoices.ACCEPTED)
 
+        # 직렬화할 필드 + 정렬/cursor 키 컬럼만 SELECT (나머지는 지연 로딩 없이 제외)
+        columns = TeacherApplicationListSerializer.model_columns(self.list_fields)
+        for name in self.ordering_fields:
+            if name not in columns:
+                columns.append(name)
+        queryset = queryset.only(*columns)
+
+        params = self.request.query_params
+
         # 비자 종류별 필터링
-        visa_type = self.request.query_params.get("visa_type")
+        visa_type = params.get("visa_type")
         if visa_type:
             queryset = queryset.filter(visa_type=visa_type)
 
+        for location in params.getlist("location"):
+            location = location.strip()
+            if location:
+                queryset = queryset.filter(
+                    Q(city__icontains=location) | Q(district__icontains=location)
+                )
+
+        teaching_language = params.get("teaching_language", "").strip()
+        if teaching_language:
+            queryset = queryset.filter(teaching_languages__iexact=teaching_language)
+        gender = params.get("gender")
+        if gender:
+            queryset = queryset.filter(gender=gender)
+        nationality = params.get("nationality")
+        if nationality:
+            queryset = queryset.filter(nationality=nationality)
+
+        # 만 나이 a 이상 ⇔ 생년월일 <= 오늘로부터 a년 전
+        today = date.today()
+        age_min = self._age_param("age_min")
+        if age_min is not None:
+            queryset = queryset.filter(date_of_birth__lte=_years_before(today, age_min))
+        age_max = self._age_param("age_max")
+        if age_max is not None:
+            queryset = queryset.filter(
+                date_of_birth__gt=_years_before(today, age_max + 1)
+            )
+
         return queryset
 
+    def _age_param(self, name):
+        raw = self.request.query_params.get(name)
+        if raw in (None, ""):
+            return None
+        try:
+            value = int(raw)
+        except ValueError:
+            raise DRFValidationError({name: "정수여야 합니다."})
+        if not 0 <= value <= 150:
+            raise DRFValidationError({name: "0 ~ 150 사이여야 합니다."})
+        return value
+
+
+def _years_before(day: date, years: int) -> date:
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:  # 2/29 → 2/28
+        return day.replace(year=day.year - years, day=28)
+
 
 class TeacherApplicationDetailView(generics.RetrieveUpdateAPIView):
     """
@@ -553,15 +666,9 @@ class TeacherApplicationDetailView(generics.RetrieveUpdateAPIView):
                 subject = "Application Update / 지원서 결과 안내"
                 message = f"Dear {instance.first_name}, thank you for your application. We will keep your profile for future opportunities."
 
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[instance.email],
-                fail_silently=True,
-            )
+            enqueue_email(subject, message, [instance.email])
             logger.info(
-                "Status update email send attempted",
+                "Status update email queued",
                 extra={
                     "application_id": instance.id,
                     "to": instance.email,
@@ -570,7 +677,7 @@ class TeacherApplicationDetailView(generics.RetrieveUpdateAPIView):
             )
         except Exception:
             logger.exception(
-                "Failed to send status update email",
+                "Failed to queue status update email",
                 extra={
                     "application_id": getattr(instance, "id", None),
                     "to": getattr(instance, "email", None),
@@ -12,6 +12,7 @@ import { coursesAPI } from "@/lib/api";
 import PageShell from "@/components/cms/PageShell";
 import StatusPill from "@/components/cms/StatusPill";
 import DayBadges from "@/components/cms/DayBadges";
+import LoadMoreButton from "@/components/cms/LoadMoreButton";
 
 type CultureCenter = {
   id: number;
@@ -60,6 +61,8 @@ export default function AdminCoursesPage() {
 
   const [courses, setCourses] = useState<Course[]>([]);
   const [fetching, setFetching] = useState(true);
+  const [cursor, setCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [savingId, setSavingId] = useState<number | null>(null);
 
   useEffect(() => {
@@ -73,9 +76,9 @@ export default function AdminCoursesPage() {
   const refresh = async () => {
     setFetching(true);
     try {
-      const res = await coursesAPI.adminList();
-      const data = Array.isArray(res.data) ? res.data : res.data?.results || res.data?.data || [];
-      setCourses(data);
+      const page = await coursesAPI.adminList();
+      setCourses(page.results);
+      setCursor(page.cursor);
     } catch (e: any) {
       const msg = e?.response?.data?.detail || e?.response?.data?.message || "강좌 목록을 불러오지 못했습니다.";
       toast.error(msg);
@@ -84,6 +87,21 @@ export default function AdminCoursesPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!cursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await coursesAPI.adminList(cursor);
+      setCourses((prev) => [...prev, ...page.results]);
+      setCursor(page.cursor);
+    } catch (e: any) {
+      const msg = e?.response?.data?.detail || e?.response?.data?.message || "강좌 목록을 불러오지 못했습니다.";
+      toast.error(msg);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     if (!user || user.role === "teacher") return;
     refresh();
@@ -156,9 +174,10 @@ export default function AdminCoursesPage() {
                       const next = e.target.value;
                       setSavingId(c.id);
                       try {
-                        await coursesAPI.adminUpdate(c.id, { status: next });
+                        const res = await coursesAPI.adminUpdate(c.id, { status: next });
                         toast.success("상태가 변경되었습니다.");
-                        await refresh();
+                        // 전체를 다시 불러오면 "더 보기"로 이어 붙인 페이지가 사라지므로 해당 행만 갱신
+                        setCourses((prev) => prev.map((x) => (x.id === c.id ? res.data : x)));
                       } catch (err: any) {
                         const msg = err?.response?.data?.detail || err?.response?.data?.message || "상태 변경 실패";
                         toast.error(msg);
@@ -220,6 +239,8 @@ export default function AdminCoursesPage() {
             </div>
           );
         })}
+
+        {!fetching && <LoadMoreButton hasMore={!!cursor} loading={loadingMore} onClick={loadMore} />}
       </div>
 
       <div className={"mt-6 flex justify-center text-sm text-zinc-600"}>
@@ -12,6 +12,7 @@ import { useAuth } from "@/contexts/AuthContext";
 import PageShell from "@/components/cms/PageShell";
 import StatusPill from "@/components/cms/StatusPill";
 import DayBadges from "@/components/cms/DayBadges";
+import LoadMoreButton from "@/components/cms/LoadMoreButton";
 import DispatchRequestModal, { type CultureCenterBranch } from "@/components/dispatch/DispatchRequestModal";
 import DispatchRequestDetailModal from "@/components/dispatch/DispatchRequestDetailModal";
 
@@ -70,6 +71,8 @@ export default function DispatchRequestsPage() {
 
   const [items, setItems] = useState<DispatchRequest[]>([]);
   const [fetching, setFetching] = useState(true);
+  const [cursor, setCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const [modalOpen, setModalOpen] = useState(false);
 
@@ -99,11 +102,15 @@ export default function DispatchRequestsPage() {
     }
   };
 
+  const fetchPage = (cursor?: string | null) =>
+    isAdmin ? dispatchRequestsAPI.adminList(cursor) : dispatchRequestsAPI.myList(cursor);
+
   const fetchList = async () => {
     try {
       setFetching(true);
-      const res = isAdmin ? await dispatchRequestsAPI.adminList() : await dispatchRequestsAPI.myList();
-      setItems(res.data || []);
+      const page = await fetchPage();
+      setItems(page.results);
+      setCursor(page.cursor);
     } catch (e: any) {
       toast.error("강사 파견 요청 목록을 불러오지 못했습니다.");
     } finally {
@@ -111,6 +118,20 @@ export default function DispatchRequestsPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!cursor || loadingMore) return;
+    try {
+      setLoadingMore(true);
+      const page = await fetchPage(cursor);
+      setItems((prev) => [...prev, ...page.results]);
+      setCursor(page.cursor);
+    } catch (e: any) {
+      toast.error("강사 파견 요청 목록을 불러오지 못했습니다.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     if (!user) return;
     fetchBranches();
@@ -138,7 +159,7 @@ export default function DispatchRequestsPage() {
         <div className="mt-6 rounded-2xl border border-zinc-200 bg-white shadow-sm">
           <div className="flex items-center justify-between border-b border-zinc-200 p-4">
             <div className="text-sm font-semibold text-zinc-900">목록</div>
-            <div className="text-sm text-zinc-600">{fetching ? "불러오는 중..." : `${items.length}건`}</div>
+            <div className="text-sm text-zinc-600">{fetching ? "불러오는 중..." : `${items.length}건${cursor ? "+" : ""}`}</div>
           </div>
 
           <div className="overflow-x-auto">
@@ -207,6 +228,10 @@ export default function DispatchRequestsPage() {
               </tbody>
             </table>
           </div>
+
+          {!fetching && (
+            <LoadMoreButton hasMore={!!cursor} loading={loadingMore} onClick={loadMore} className="border-t border-zinc-200 p-4" />
+          )}
         </div>
 
         <div className={"mt-6 flex justify-center text-sm text-zinc-600"}>
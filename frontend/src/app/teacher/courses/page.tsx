@@ -11,6 +11,7 @@ import { coursesAPI } from "@/lib/api";
 import PageShell from "@/components/cms/PageShell";
 import StatusPill from "@/components/cms/StatusPill";
 import DayBadges from "@/components/cms/DayBadges";
+import LoadMoreButton from "@/components/cms/LoadMoreButton";
 
 type CultureCenter = {
   id: number;
@@ -45,6 +46,8 @@ export default function TeacherCoursesPage() {
 
   const [courses, setCourses] = useState<Course[]>([]);
   const [fetching, setFetching] = useState(true);
+  const [cursor, setCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (!loading && !user) router.push("/auth/login");
@@ -62,9 +65,11 @@ export default function TeacherCoursesPage() {
     (async () => {
       setFetching(true);
       try {
-        const res = await coursesAPI.myList();
-        const data = Array.isArray(res.data) ? res.data : res.data?.results || res.data?.data || [];
-        if (mounted) setCourses(data);
+        const page = await coursesAPI.myList();
+        if (mounted) {
+          setCourses(page.results);
+          setCursor(page.cursor);
+        }
       } catch (e: any) {
         const msg = e?.response?.data?.detail || e?.response?.data?.message || "강좌 목록을 불러오지 못했습니다.";
         toast.error(msg);
@@ -78,6 +83,21 @@ export default function TeacherCoursesPage() {
     };
   }, [user]);
 
+  const loadMore = async () => {
+    if (!cursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await coursesAPI.myList(cursor);
+      setCourses((prev) => [...prev, ...page.results]);
+      setCursor(page.cursor);
+    } catch (e: any) {
+      const msg = e?.response?.data?.detail || e?.response?.data?.message || "강좌 목록을 불러오지 못했습니다.";
+      toast.error(msg);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const actions = (
     <>
       <Link
@@ -168,6 +188,8 @@ export default function TeacherCoursesPage() {
             </div>
           );
         })}
+
+        {!fetching && <LoadMoreButton hasMore={!!cursor} loading={loadingMore} onClick={loadMore} />}
       </div>
     </PageShell>
   );
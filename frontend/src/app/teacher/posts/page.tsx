@@ -12,6 +12,7 @@ import { dispatchRequestsAPI } from "@/lib/api";
 import PageShell from "@/components/cms/PageShell";
 import StatusPill from "@/components/cms/StatusPill";
 import DayBadges from "@/components/cms/DayBadges";
+import LoadMoreButton from "@/components/cms/LoadMoreButton";
 
 type CultureCenter = {
   id: number;
@@ -59,6 +60,8 @@ export default function TeacherPostsPage() {
   const [posts, setPosts] = useState<DispatchRequest[]>([]);
   const [fetching, setFetching] = useState(true);
   const [refreshKey, setRefreshKey] = useState(0);
+  const [cursor, setCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     if (!loading && !user) router.push("/auth/login");
@@ -77,9 +80,11 @@ export default function TeacherPostsPage() {
     (async () => {
       setFetching(true);
       try {
-        const res = await dispatchRequestsAPI.openList();
-        const data = Array.isArray(res.data) ? res.data : res.data?.results || res.data?.data || [];
-        if (mounted) setPosts(data);
+        const page = await dispatchRequestsAPI.openList();
+        if (mounted) {
+          setPosts(page.results);
+          setCursor(page.cursor);
+        }
       } catch (e: any) {
         const msg = e?.response?.data?.detail || e?.response?.data?.message || "공고 목록을 불러오지 못했습니다.";
         toast.error(msg);
@@ -93,6 +98,21 @@ export default function TeacherPostsPage() {
     };
   }, [user, refreshKey]);
 
+  const loadMore = async () => {
+    if (!cursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const page = await dispatchRequestsAPI.openList(cursor);
+      setPosts((prev) => [...prev, ...page.results]);
+      setCursor(page.cursor);
+    } catch (e: any) {
+      const msg = e?.response?.data?.detail || e?.response?.data?.message || "공고 목록을 불러오지 못했습니다.";
+      toast.error(msg);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const actions = (
     <>
       <Link
@@ -224,6 +244,8 @@ export default function TeacherPostsPage() {
             </div>
           );
         })}
+
+        {!fetching && <LoadMoreButton hasMore={!!cursor} loading={loadingMore} onClick={loadMore} />}
       </div>
     </PageShell>
   );
@@ -2,11 +2,12 @@
 
 import React, { useEffect, useMemo, useState, useRef } from "react";
 import clsx from "clsx";
-import api from "@/lib/api";
+import api, { getPage } from "@/lib/api";
 import { useAuth } from "@/contexts/AuthContext";
 import cityDistrictData from "@/lib/city_district.json";
 import WeeklyTimeTableReadOnly from "@/components/WeeklyTimeTableReadOnly";
 import Flag from "@/components/Flag";
+import LoadMoreButton from "@/components/cms/LoadMoreButton";
 import DispatchRequestModal, { CultureCenterBranch } from "@/components/dispatch/DispatchRequestModal";
 import { Toaster, toast } from "react-hot-toast";
 import Link from "next/link"; // ✅ NEW
@@ -74,6 +75,22 @@ const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL || "http://localhost:8
 
 const ALL_VALUE = "ALL" as const;
 
+// 목록 카드에 표시하는 필드만 요청 (?fields= → 서버에서 필요한 컬럼만 조회)
+const TEACHER_LIST_FIELDS = [
+  "id",
+  "profile_image_thumbnail",
+  "first_name",
+  "last_name",
+  "gender",
+  "age",
+  "nationality",
+  "teaching_languages",
+  "city",
+  "district",
+  "introduction_youtube_url",
+  "evaluation_result",
+];
+
 function toAbsoluteMediaUrl(url?: string | null) {
   if (!url) return null;
   if (url.startsWith("http://") || url.startsWith("https://")) return url;
@@ -81,19 +98,14 @@ function toAbsoluteMediaUrl(url?: string | null) {
   return `${API_BASE_URL}/${url}`;
 }
 
-function normalize(s?: string | null) {
-  return (s || "").trim().toLowerCase();
-}
-
-function getAgeBracket(age?: number | null): AgeBracket {
-  if (typeof age !== "number" || Number.isNaN(age)) return "ALL";
-  if (age >= 60) return "60PLUS";
-  if (age >= 50) return "50S";
-  if (age >= 40) return "40S";
-  if (age >= 30) return "30S";
-  if (age >= 20) return "20S";
-  return "ALL";
-}
+// 연령대 → 서버 조건 검색 파라미터 (age_min ~ age_max, 만 나이)
+const AGE_RANGES: Record<Exclude<AgeBracket, "ALL">, { age_min: number; age_max?: number }> = {
+  "20S": { age_min: 20, age_max: 29 },
+  "30S": { age_min: 30, age_max: 39 },
+  "40S": { age_min: 40, age_max: 49 },
+  "50S": { age_min: 50, age_max: 59 },
+  "60PLUS": { age_min: 60 },
+};
 
 function badgeClassByGender(gender?: string | null) {
   switch (gender) {
@@ -243,6 +255,9 @@ export default function MainPage() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [teachers, setTeachers] = useState<TeacherApplication[]>([]);
+  // 다음 페이지 cursor (조건 검색은 지금까지 불러온 카드에 적용)
+  const [cursor, setCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   // ===== Dispatch Request (Manager Request) (minimal state only) =====
   const [dispatchOpen, setDispatchOpen] = useState(false);
@@ -478,23 +493,67 @@ export default function MainPage() {
     }
   };
 
+  // 조건 검색은 서버에서 전체 목록 기준으로 필터 (불러온 페이지만 거르면 결과가 누락됨)
+  const teacherFilterParams = useMemo(() => {
+    const params: Record<string, string | number | string[]> = {};
+    const locations = [sido, sigungu, gu].filter((v) => v !== ALL_VALUE);
+    if (locations.length) params.location = locations;
+    if (advLanguage !== ALL_VALUE) params.teaching_language = advLanguage;
+    if (advGender !== ALL_VALUE) params.gender = advGender;
+    if (advNationality !== ALL_VALUE) params.nationality = advNationality;
+    if (advAgeBracket !== "ALL") Object.assign(params, AGE_RANGES[advAgeBracket]);
+    return params;
+  }, [sido, sigungu, gu, advLanguage, advGender, advAgeBracket, advNationality]);
+
+  const hasActiveFilters = Object.keys(teacherFilterParams).length > 0;
+
+  const fetchTeacherPage = (cursor?: string | null) =>
+    getPage<TeacherApplication>("/teacher-applications/admin/list/", cursor, {
+      params: { ...teacherFilterParams, fields: TEACHER_LIST_FIELDS.join(",") },
+      // location=a&location=b (axios 기본값은 location[]=a)
+      paramsSerializer: { indexes: null },
+    });
+
+  // 조건 변경 중 먼저 보낸 요청의 응답이 늦게 와서 덮어쓰지 않도록
+  const teacherRequestSeq = useRef(0);
+
+  const loadMoreTeachers = async () => {
+    if (!cursor || loadingMore) return;
+    const seq = teacherRequestSeq.current;
+    setLoadingMore(true);
+    try {
+      const page = await fetchTeacherPage(cursor);
+      if (seq !== teacherRequestSeq.current) return;
+      setTeachers((prev) => [...prev, ...page.results]);
+      setCursor(page.cursor);
+    } catch (e: any) {
+      toast.error("강사 목록을 더 불러오지 못했습니다. 잠시 후 다시 시도해 주세요.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const fetchTeachers = async () => {
+    const seq = ++teacherRequestSeq.current;
     setLoading(true);
     setError(null);
     try {
       // 관리자용 목록 엔드포인트 (permissions.IsAdminUser)
-      const res = await api.get("/teacher-applications/admin/list/");
-      const data = Array.isArray(res.data) ? res.data : [];
-      setTeachers(data);
+      const page = await fetchTeacherPage();
+      if (seq !== teacherRequestSeq.current) return;
+      setTeachers(page.results);
+      setCursor(page.cursor);
     } catch (e: any) {
+      if (seq !== teacherRequestSeq.current) return;
       // 권한 문제/네트워크 문제 등
       const status = e?.response?.status;
       if (status === 403) setError("관리자 권한이 필요합니다. (403 Forbidden)");
       else if (status === 401) setError("로그인이 필요합니다. (401 Unauthorized)");
       else setError("강사 목록을 불러오지 못했습니다. 잠시 후 다시 시도해 주세요.");
       setTeachers([]);
+      setCursor(null);
     } finally {
-      setLoading(false);
+      if (seq === teacherRequestSeq.current) setLoading(false);
     }
   };
 
@@ -527,7 +586,7 @@ export default function MainPage() {
 
   useEffect(() => {
     fetchTeachers();
-  }, []);
+  }, [teacherFilterParams]);
 
   // 모달 열렸을 때: ESC 닫기 + body 스크롤 잠금
   useEffect(() => {
@@ -547,29 +606,6 @@ export default function MainPage() {
     };
   }, [selectedTeacherId]);
 
-  const filteredTeachers = useMemo(() => {
-    return teachers.filter((t) => {
-      // 조건 검색(복합): location + language + gender + age 를 AND로 결합
-      const combinedLocation = normalize(`${t.city || ""} ${t.district || ""}`);
-
-      if (sido !== ALL_VALUE && !combinedLocation.includes(normalize(sido))) return false;
-      if (sigungu !== ALL_VALUE && !combinedLocation.includes(normalize(sigungu))) return false;
-      if (gu !== ALL_VALUE && !combinedLocation.includes(normalize(gu))) return false;
-
-      if (advLanguage !== ALL_VALUE && normalize(t.teaching_languages) !== normalize(advLanguage)) return false;
-      if (advGender !== ALL_VALUE && (t.gender || "") !== advGender) return false;
-      if (advAgeBracket !== "ALL" && getAgeBracket(t.age ?? null) !== advAgeBracket) return false;
-
-      // ✅ NEW: nationality filter
-      if (advNationality !== ALL_VALUE) {
-        const tKey = normalizeNationalityKey(t.nationality);
-        if (tKey !== advNationality) return false;
-      }
-
-      return true;
-    });
-  }, [teachers, sido, sigungu, gu, advLanguage, advGender, advAgeBracket, advNationality]);
-
   const handleLogout = async () => {
     try {
       await logout();
@@ -782,7 +818,8 @@ export default function MainPage() {
           <div className="flex items-center gap-2 text-sm text-gray-600">
             <span className="rounded-full bg-gray-100 px-3 py-1 ring-1 ring-gray-200">{activeFilterLabel}</span>
             <span className="rounded-full bg-gray-100 px-3 py-1 ring-1 ring-gray-200">
-              {filteredTeachers.length} / {teachers.length}
+              {teachers.length}
+              {cursor ? "+" : ""}
             </span>
           </div>
         </div>
@@ -811,19 +848,19 @@ export default function MainPage() {
               </div>
             ))}
           </div>
+        ) : teachers.length === 0 && hasActiveFilters ? (
+          <div className="rounded-2xl border border-gray-200 bg-white p-8 text-center shadow-sm">
+            <div className="text-base font-semibold">조건에 맞는 강사가 없습니다.</div>
+            <div className="mt-1 text-sm text-gray-600">검색 조건을 변경해 보세요.</div>
+          </div>
         ) : teachers.length === 0 ? (
           <div className="rounded-2xl border border-gray-200 bg-white p-8 text-center shadow-sm">
             <div className="text-base font-semibold">등록된 지원서가 없습니다.</div>
             <div className="mt-1 text-sm text-gray-600">TeacherApplication 데이터가 생성되면 이곳에 카드 형태로 표시됩니다.</div>
           </div>
-        ) : filteredTeachers.length === 0 ? (
-          <div className="rounded-2xl border border-gray-200 bg-white p-8 text-center shadow-sm">
-            <div className="text-base font-semibold">조건에 맞는 강사가 없습니다.</div>
-            <div className="mt-1 text-sm text-gray-600">검색 조건을 변경해 보세요.</div>
-          </div>
         ) : (
           <div className="grid gap-4 sm:grid-cols-2 lg:grid-cols-3">
-            {filteredTeachers.map((t) => {
+            {teachers.map((t) => {
               const thumb = toAbsoluteMediaUrl(t.profile_image_thumbnail);
               const fullName = `${t.first_name || ""} ${t.last_name || ""}`.trim();
               const ageText = typeof t.age === "number" ? `${t.age}` : "-";
@@ -933,6 +970,10 @@ export default function MainPage() {
             })}
           </div>
         )}
+
+        {!loading && !error && (
+          <LoadMoreButton hasMore={!!cursor} loading={loadingMore} onClick={loadMoreTeachers} className="mt-6" />
+        )}
       </main>
 
       {/* Detail Modal */}
@@ -0,0 +1,33 @@
+"use client";
+
+import React from "react";
+import clsx from "clsx";
+
+// cursor 목록의 "더 보기" (다음 페이지가 없으면 렌더링하지 않음)
+export default function LoadMoreButton({
+  hasMore,
+  loading,
+  onClick,
+  className,
+}: {
+  hasMore: boolean;
+  loading?: boolean;
+  onClick: () => void;
+  className?: string;
+}) {
+  if (!hasMore) return null;
+
+  return (
+    <div className={clsx("flex justify-center", className)}>
+      <button
+        onClick={onClick}
+        disabled={loading}
+        className={clsx(
+          "inline-flex items-center rounded-2xl border border-zinc-200 bg-white px-4 py-2 text-sm font-medium text-zinc-900 shadow-sm hover:bg-zinc-50",
+          loading && "opacity-60"
+        )}>
+        {loading ? "불러오는 중..." : "더 보기"}
+      </button>
+    </div>
+  );
+}
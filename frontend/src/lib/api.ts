@@ -1,4 +1,4 @@
-import axios from "axios";
+import axios, { AxiosRequestConfig } from "axios";
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_BASE_URL || "http://localhost:8000";
 
@@ -28,6 +28,41 @@ api.interceptors.request.use(async (config) => {
 
 export default api;
 
+// 목록 API 는 keyset cursor pagination 응답({ next, previous, results })
+// cursor: 다음 페이지 cursor (next 의 ?cursor= 값, 마지막 페이지면 null)
+export type Page<T = any> = { results: T[]; cursor: string | null };
+
+const cursorOf = (next?: string | null) => (next ? new URL(next).searchParams.get("cursor") : null);
+
+// 한 페이지만 조회 → 목록 화면은 받은 cursor 로 "더 보기" 시 다음 페이지를 이어 붙임
+export const getPage = async <T = any>(
+  url: string,
+  cursor?: string | null,
+  config: AxiosRequestConfig = {}
+): Promise<Page<T>> => {
+  const res = await api.get(url, {
+    ...config,
+    params: { ...config.params, ...(cursor ? { cursor } : {}) },
+  });
+  if (Array.isArray(res.data)) return { results: res.data, cursor: null };
+  return { results: res.data?.results ?? [], cursor: cursorOf(res.data?.next) };
+};
+
+// 모든 페이지를 받아서 res.data 를 배열로 돌려줌
+// → 개수가 적고 상한이 있는 조회(공고 1건의 지원자 목록 등)에만 사용, 목록 화면은 getPage
+export const getAllPages = async (url: string, config: AxiosRequestConfig = {}) => {
+  let res = await api.get(url, config);
+  if (!res.data || Array.isArray(res.data)) return res;
+
+  const results = [...(res.data.results ?? [])];
+  while (res.data?.next) {
+    const cursor = cursorOf(res.data.next);
+    res = await api.get(url, { ...config, params: { ...config.params, cursor } });
+    results.push(...(res.data?.results ?? []));
+  }
+  return { ...res, data: results };
+};
+
 // Auth API
 export const authAPI = {
   register: (data: { email: string; password: string; password_confirm: string }) => api.post("/auth/register/", data),
@@ -62,12 +97,16 @@ export const teacherApplicationAPI = {
 export const dispatchRequestsAPI = {
   // common
   create: (data: any) => api.post("/dispatch-requests/", data),
-  myList: () => api.get("/dispatch-requests/my/"),
-  openList: () => api.get("/dispatch-requests/open/"),
+  myList: (cursor?: string | null) => getPage("/dispatch-requests/my/", cursor),
+  openList: (cursor?: string | null) => getPage("/dispatch-requests/open/", cursor),
+  openNearMe: (radiusKm?: number, cursor?: string | null) =>
+    getPage("/dispatch-requests/open/near-me/", cursor, {
+      params: radiusKm ? { radius_km: radiusKm } : undefined,
+    }),
   detail: (id: number) => api.get(`/dispatch-requests/${id}/`),
 
   // admin/manager
-  adminList: () => api.get("/dispatch-requests/admin/list/"),
+  adminList: (cursor?: string | null) => getPage("/dispatch-requests/admin/list/", cursor),
   adminDetail: (id: number) => api.get(`/dispatch-requests/admin/${id}/`),
   adminUpdate: (
     id: number,
@@ -75,7 +114,7 @@ export const dispatchRequestsAPI = {
   ) => api.patch(`/dispatch-requests/admin/${id}/`, data),
   open: (id: number) => api.post(`/dispatch-requests/admin/${id}/open/`),
   close: (id: number) => api.post(`/dispatch-requests/admin/${id}/close/`),
-  applications: (id: number) => api.get(`/dispatch-requests/admin/${id}/applications/`),
+  applications: (id: number) => getAllPages(`/dispatch-requests/admin/${id}/applications/`),
   setApplicationStatus: (id: number, applicationId: number, status: string) =>
     api.patch(`/dispatch-requests/admin/${id}/set-application-status/`, {
       application_id: applicationId,
@@ -90,8 +129,8 @@ export const dispatchRequestsAPI = {
 
 // === Courses (Confirmed) API ===
 export const coursesAPI = {
-  myList: () => api.get("/courses/my/"),
-  adminList: () => api.get("/courses/admin/list/"),
+  myList: (cursor?: string | null) => getPage("/courses/my/", cursor),
+  adminList: (cursor?: string | null) => getPage("/courses/admin/list/", cursor),
   adminDetail: (id: number) => api.get(`/courses/admin/${id}/`),
   adminUpdate: (id: number, data: any) => api.patch(`/courses/admin/${id}/`, data),
   confirmFromDispatch: (dispatchId: number, teacherId?: number) =>